@@ -30,6 +30,24 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+
+def include_object_for(dialect_name: str):
+    """Leave out of autogenerate the search objects that only exist on some dialects."""
+
+    def include_object(object, name, type_, reflected, compare_to):
+        # The SQLite FTS5 clientes search tables are created with raw DDL
+        if type_ == "table" and reflected and name.startswith("clientes_fts"):
+            return False
+        # Indexes restricted to another dialect with ddl_if() are never created here
+        ddl_if = getattr(object, "_ddl_if", None)
+        if type_ == "index" and ddl_if is not None and ddl_if.dialect not in (None, dialect_name):
+            return False
+        return True
+
+    return include_object
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -75,7 +93,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object_for(connection.dialect.name),
         )
 
         with context.begin_transaction():
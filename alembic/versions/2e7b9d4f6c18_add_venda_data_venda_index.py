@@ -0,0 +1,31 @@
+"""Add index for vendas reports
+
+Revision ID: 2e7b9d4f6c18
+Revises: 8c4d2e6f1a93
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e7b9d4f6c18'
+down_revision: Union[str, None] = '8c4d2e6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_vendas_data_venda',
+        'vendas',
+        ['data_venda', 'valor_venda', 'valor_entrada', 'apartamento_id', 'cliente_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vendas_data_venda', table_name='vendas')
@@ -0,0 +1,46 @@
+"""Add indexes for foreign keys and status filters
+
+Revision ID: 3f2a8c1d7b4e
+Revises: 9406a35b9d6c
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2a8c1d7b4e'
+down_revision: Union[str, None] = '9406a35b9d6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_apartamentos_status'), 'apartamentos', ['status'], unique=False)
+    op.create_index(op.f('ix_vendas_cliente_id'), 'vendas', ['cliente_id'], unique=False)
+    op.create_index(op.f('ix_vendas_apartamento_id'), 'vendas', ['apartamento_id'], unique=False)
+    op.create_index(op.f('ix_reservas_cliente_id'), 'reservas', ['cliente_id'], unique=False)
+    op.create_index(op.f('ix_reservas_apartamento_id'), 'reservas', ['apartamento_id'], unique=False)
+    op.create_index(op.f('ix_reservas_ativa'), 'reservas', ['ativa'], unique=False)
+    # Partial index: only active reservas, used by get_active_by_apartamento_id
+    op.create_index(
+        'ix_reservas_apartamento_id_ativa',
+        'reservas',
+        ['apartamento_id'],
+        unique=False,
+        postgresql_where=sa.text('ativa = true'),
+        sqlite_where=sa.text('ativa = 1'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservas_apartamento_id_ativa', table_name='reservas')
+    op.drop_index(op.f('ix_reservas_ativa'), table_name='reservas')
+    op.drop_index(op.f('ix_reservas_apartamento_id'), table_name='reservas')
+    op.drop_index(op.f('ix_reservas_cliente_id'), table_name='reservas')
+    op.drop_index(op.f('ix_vendas_apartamento_id'), table_name='vendas')
+    op.drop_index(op.f('ix_vendas_cliente_id'), table_name='vendas')
+    op.drop_index(op.f('ix_apartamentos_status'), table_name='apartamentos')
@@ -0,0 +1,29 @@
+"""Add apartamento version column
+
+Revision ID: 5b7e1c9a2d40
+Revises: 3f2a8c1d7b4e
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e1c9a2d40'
+down_revision: Union[str, None] = '3f2a8c1d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Version counter for optimistic concurrency (compare-and-swap on UPDATE)
+    with op.batch_alter_table('apartamentos') as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('apartamentos') as batch_op:
+        batch_op.drop_column('version')
@@ -0,0 +1,28 @@
+"""Add index for reserva expiration
+
+Revision ID: 8c4d2e6f1a93
+Revises: 5b7e1c9a2d40
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4d2e6f1a93'
+down_revision: Union[str, None] = '5b7e1c9a2d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_reservas_ativa_data_expiracao', 'reservas', ['ativa', 'data_expiracao'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reservas_ativa_data_expiracao', table_name='reservas')
@@ -0,0 +1,42 @@
+"""Add apartamentos inventory summary table
+
+Revision ID: b4f1c7e2a9d5
+Revises: 2e7b9d4f6c18
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4f1c7e2a9d5'
+down_revision: Union[str, None] = '2e7b9d4f6c18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('apartamentos_resumo',
+    sa.Column('bloco', sa.String(length=10), nullable=False),
+    sa.Column('andar', sa.Integer(), nullable=False),
+    # The statusapartamento type already exists on PostgreSQL
+    sa.Column('status', postgresql.ENUM('DISPONIVEL', 'RESERVADO', 'VENDIDO', name='statusapartamento', create_type=False), nullable=False),
+    sa.Column('quantidade', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('bloco', 'andar', 'status')
+    )
+    # Backfill from the existing apartamentos
+    op.execute(
+        'INSERT INTO apartamentos_resumo (bloco, andar, status, quantidade, created_at, updated_at) '
+        'SELECT bloco, andar, status, COUNT(*), CURRENT_TIMESTAMP, CURRENT_TIMESTAMP '
+        'FROM apartamentos GROUP BY bloco, andar, status'
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('apartamentos_resumo')
@@ -0,0 +1,34 @@
+"""Add composite indexes for the apartamentos search
+
+Revision ID: d7a3e5c1b8f2
+Revises: b4f1c7e2a9d5
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a3e5c1b8f2'
+down_revision: Union[str, None] = 'b4f1c7e2a9d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_apartamentos_status_quartos_preco', 'apartamentos', ['status', 'quartos', 'preco'], unique=False
+    )
+    op.create_index('ix_apartamentos_status_preco', 'apartamentos', ['status', 'preco', 'id'], unique=False)
+    op.create_index('ix_apartamentos_status_area', 'apartamentos', ['status', 'area', 'id'], unique=False)
+    op.create_index('ix_apartamentos_bloco_andar', 'apartamentos', ['bloco', 'andar'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_apartamentos_bloco_andar', table_name='apartamentos')
+    op.drop_index('ix_apartamentos_status_area', table_name='apartamentos')
+    op.drop_index('ix_apartamentos_status_preco', table_name='apartamentos')
+    op.drop_index('ix_apartamentos_status_quartos_preco', table_name='apartamentos')
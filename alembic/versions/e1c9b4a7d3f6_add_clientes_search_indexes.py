@@ -0,0 +1,70 @@
+"""Add search indexes on clientes nome, email and telefone
+
+Revision ID: e1c9b4a7d3f6
+Revises: d7a3e5c1b8f2
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1c9b4a7d3f6'
+down_revision: Union[str, None] = 'd7a3e5c1b8f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ['nome', 'email', 'telefone']
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in SEARCH_COLUMNS:
+            op.create_index(
+                f'ix_clientes_{column}_trgm',
+                'clientes',
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+            )
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE clientes_fts USING fts5("
+            "nome, email, telefone, content='clientes', content_rowid='id', tokenize='trigram')"
+        )
+        op.execute(
+            "CREATE TRIGGER clientes_fts_insert AFTER INSERT ON clientes BEGIN "
+            "INSERT INTO clientes_fts (rowid, nome, email, telefone) "
+            "VALUES (new.id, new.nome, new.email, new.telefone); END"
+        )
+        op.execute(
+            "CREATE TRIGGER clientes_fts_delete AFTER DELETE ON clientes BEGIN "
+            "INSERT INTO clientes_fts (clientes_fts, rowid, nome, email, telefone) "
+            "VALUES ('delete', old.id, old.nome, old.email, old.telefone); END"
+        )
+        op.execute(
+            "CREATE TRIGGER clientes_fts_update AFTER UPDATE ON clientes BEGIN "
+            "INSERT INTO clientes_fts (clientes_fts, rowid, nome, email, telefone) "
+            "VALUES ('delete', old.id, old.nome, old.email, old.telefone); "
+            "INSERT INTO clientes_fts (rowid, nome, email, telefone) "
+            "VALUES (new.id, new.nome, new.email, new.telefone); END"
+        )
+        # Index the existing clientes
+        op.execute("INSERT INTO clientes_fts (clientes_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for column in reversed(SEARCH_COLUMNS):
+            op.drop_index(f'ix_clientes_{column}_trgm', table_name='clientes')
+    elif dialect == 'sqlite':
+        for trigger in ('clientes_fts_update', 'clientes_fts_delete', 'clientes_fts_insert'):
+            op.execute(f'DROP TRIGGER {trigger}')
+        op.execute('DROP TABLE clientes_fts')
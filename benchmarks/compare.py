@@ -0,0 +1,67 @@
+"""Compare the latencies of two benchmark result files, e.g. the last release against a branch.
+
+Reads the JSON of load_test, bench_indexes, bench_apartamento_search and
+pytest-benchmark (--benchmark-json). Exits with status 1 when a latency
+grew by more than --threshold percent.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json
+    python -m benchmarks.compare micro-v1.json micro-v2.json --threshold 20
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict
+
+
+def latencies(results: Any, prefix: str = "") -> Dict[str, float]:
+    """Flatten every latency (keys ending in _ms) of a result file into 'path/to/key' -> ms."""
+    if isinstance(results, dict) and isinstance(results.get("benchmarks"), list):
+        # pytest-benchmark reports seconds per benchmark
+        return {
+            f"{benchmark['name']}/{stat}_ms": benchmark["stats"][stat] * 1000
+            for benchmark in results["benchmarks"]
+            for stat in ("min", "median", "max")
+        }
+    found: Dict[str, float] = {}
+    if isinstance(results, dict):
+        for key, value in results.items():
+            path = f"{prefix}/{key}" if prefix else str(key)
+            if key.endswith("_ms") and isinstance(value, (int, float)):
+                found[path] = float(value)
+            else:
+                found.update(latencies(value, path))
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed slowdown, in percent")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = latencies(json.load(f))
+    with open(args.candidate) as f:
+        candidate = latencies(json.load(f))
+
+    regressions = 0
+    for path in sorted(baseline.keys() & candidate.keys()):
+        before, after = baseline[path], candidate[path]
+        change = (after - before) / before * 100 if before else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{path:60s} {before:>10.3f}ms -> {after:>10.3f}ms  {change:>+7.1f}%{flag}")
+    for path in sorted(baseline.keys() ^ candidate.keys()):
+        print(f"{path:60s} only in {'baseline' if path in baseline else 'candidate'}")
+
+    if regressions:
+        print(f"{regressions} latencies grew more than {args.threshold:g}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Seeded datasets shared by the micro-benchmarks and the load test."""
+from datetime import datetime
+from typing import List, NamedTuple
+
+from sqlalchemy import insert, select
+
+from src.infrastructure.auth.jwt_handler import get_password_hash
+from src.infrastructure.database.models import Apartamento, Cliente, Usuario
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.seeding import SeedConfig, seed_database
+
+BENCH_USERNAME = "bench"
+BENCH_PASSWORD = "bench-password"
+
+
+class Dataset(NamedTuple):
+    """IDs of the seeded rows the benchmarks pick from."""
+
+    cliente_ids: List[int]
+    # Units left disponivel, for reservas and vendas created during the run
+    disponivel_ids: List[int]
+
+
+def seed_dataset(engine, clientes: int, apartamentos: int, seed: int = 42) -> Dataset:
+    """Insert a bench user, clientes and apartamentos, with a fifth of the units sold and a fifth reserved.
+
+    The rows only depend on the sizes and the seed (dates are relative to
+    today), so runs with the same arguments measure the same data.
+    """
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    config = SeedConfig(
+        clientes, apartamentos, reference_date=today, seed=seed, vendido_ratio=0.2, reservado_ratio=0.2
+    )
+    seed_database(engine, config)
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Usuario),
+            [
+                {
+                    "username": BENCH_USERNAME,
+                    "email": "bench@example.com",
+                    "hashed_password": get_password_hash(BENCH_PASSWORD),
+                    "is_active": True,
+                    "created_at": today,
+                    "updated_at": today,
+                }
+            ],
+        )
+        cliente_ids = list(conn.scalars(select(Cliente.id).order_by(Cliente.id)))
+        disponivel_ids = list(
+            conn.scalars(
+                select(Apartamento.id)
+                .where(Apartamento.status == StatusApartamento.DISPONIVEL)
+                .order_by(Apartamento.id)
+            )
+        )
+    return Dataset(cliente_ids, disponivel_ids)
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.infrastructure.cache import apartamento_cache
+from src.infrastructure.database.models import Base
+from benchmarks.dataset import seed_dataset
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "dataset of the micro-benchmarks")
+    group.addoption("--bench-database-url", default=None, help="Database to seed (default: a temporary SQLite file)")
+    group.addoption("--bench-clientes", type=int, default=10_000, help="Seeded clientes")
+    group.addoption("--bench-apartamentos", type=int, default=10_000, help="Seeded apartamentos")
+    group.addoption("--bench-seed", type=int, default=42, help="Random seed of the dataset")
+
+
+@pytest.fixture(scope="session")
+def bench_engine(request, tmp_path_factory):
+    """Engine over a freshly seeded database, shared by every benchmark of the run."""
+    url = request.config.getoption("--bench-database-url")
+    if url is None:
+        url = f"sqlite:///{tmp_path_factory.mktemp('bench') / 'bench.db'}"
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def dataset(request, bench_engine):
+    """IDs of the seeded rows."""
+    return seed_dataset(
+        bench_engine,
+        clientes=request.config.getoption("--bench-clientes"),
+        apartamentos=request.config.getoption("--bench-apartamentos"),
+        seed=request.config.getoption("--bench-seed"),
+    )
+
+
+@pytest.fixture
+def db(bench_engine, dataset):
+    """A session configured like the application's."""
+    apartamento_cache.clear()
+    session = sessionmaker(bind=bench_engine, autoflush=False, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -1,22 +1,55 @@
-from .cliente_dto import ClienteCreate, ClienteUpdate, ClienteResponse
-from .apartamento_dto import ApartamentoCreate, ApartamentoUpdate, ApartamentoResponse
-from .venda_dto import VendaCreate, VendaResponse
-from .reserva_dto import ReservaCreate, ReservaResponse
+from .bulk_dto import BulkItemResult, BulkCreateResponse, ImportRowError, ClienteImportResponse
+from .cliente_dto import ClienteCreate, ClienteBulkCreate, ClienteUpdate, ClienteResponse
+from .apartamento_dto import (
+    ApartamentoCreate,
+    ApartamentoBulkCreate,
+    ApartamentoUpdate,
+    ApartamentoResponse,
+    OrdenacaoApartamentos,
+    ApartamentoFiltro,
+    ResumoContagem,
+    ResumoAndar,
+    ApartamentoResumoResponse,
+)
+from .expansao_dto import Expansao
+from .venda_dto import VendaCreate, VendaResponse, VendaExpandidaResponse
+from .reserva_dto import ReservaCreate, ReservaResponse, ReservaExpandidaResponse
+from .relatorio_dto import AgrupamentoVendas, VendasResumo, VendasGrupo, RelatorioVendasResponse
 from .auth_dto import Token, TokenData, UserLogin, UserCreate
+from .idempotency_dto import IdempotentRequest
 
 __all__ = [
+    "BulkItemResult",
+    "BulkCreateResponse",
+    "ImportRowError",
+    "ClienteImportResponse",
     "ClienteCreate",
+    "ClienteBulkCreate",
     "ClienteUpdate",
     "ClienteResponse",
     "ApartamentoCreate",
+    "ApartamentoBulkCreate",
     "ApartamentoUpdate",
     "ApartamentoResponse",
+    "OrdenacaoApartamentos",
+    "ApartamentoFiltro",
+    "ResumoContagem",
+    "ResumoAndar",
+    "ApartamentoResumoResponse",
+    "Expansao",
     "VendaCreate",
     "VendaResponse",
+    "VendaExpandidaResponse",
     "ReservaCreate",
     "ReservaResponse",
+    "ReservaExpandidaResponse",
+    "AgrupamentoVendas",
+    "VendasResumo",
+    "VendasGrupo",
+    "RelatorioVendasResponse",
     "Token",
     "TokenData",
     "UserLogin",
     "UserCreate",
+    "IdempotentRequest",
 ]
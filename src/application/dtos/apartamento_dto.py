@@ -1,6 +1,9 @@
 from datetime import datetime
+from enum import Enum
+from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 from src.infrastructure.database.models.apartamento import StatusApartamento
+from .bulk_dto import BULK_MAX_ITEMS
 
 
 class ApartamentoBase(BaseModel):
@@ -20,6 +23,12 @@ class ApartamentoCreate(ApartamentoBase):
     pass
 
 
+class ApartamentoBulkCreate(BaseModel):
+    """Schema for creating a batch of apartamentos."""
+
+    items: List[ApartamentoCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class ApartamentoUpdate(BaseModel):
     """Schema for updating an apartamento."""
 
@@ -41,3 +50,60 @@ class ApartamentoResponse(ApartamentoBase):
     status: StatusApartamento
     created_at: datetime
     updated_at: datetime
+
+
+class OrdenacaoApartamentos(str, Enum):
+    """Sort order of the apartamentos listing; a leading '-' sorts descending."""
+
+    ID = "id"
+    PRECO = "preco"
+    PRECO_DESC = "-preco"
+    AREA = "area"
+    AREA_DESC = "-area"
+
+    @property
+    def field(self) -> Optional[str]:
+        """The sorted column besides id, or None when sorting by id only."""
+        return None if self is OrdenacaoApartamentos.ID else self.value.lstrip("-")
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
+
+
+class ApartamentoFiltro(BaseModel):
+    """Filters and sort order of an apartamentos search; None means no filter."""
+
+    status: StatusApartamento | None = None
+    bloco: str | None = None
+    quartos: List[int] | None = None
+    min_preco: float | None = None
+    max_preco: float | None = None
+    min_area: float | None = None
+    max_area: float | None = None
+    min_andar: int | None = None
+    max_andar: int | None = None
+    sort: OrdenacaoApartamentos = OrdenacaoApartamentos.ID
+
+
+class ResumoContagem(BaseModel):
+    """Number of apartamentos per status."""
+
+    disponivel: int = 0
+    reservado: int = 0
+    vendido: int = 0
+    total: int = 0
+
+
+class ResumoAndar(ResumoContagem):
+    """Number of apartamentos per status on one andar of a bloco."""
+
+    bloco: str
+    andar: int
+
+
+class ApartamentoResumoResponse(BaseModel):
+    """Schema for the inventory summary response."""
+
+    totais: ResumoContagem
+    andares: List[ResumoAndar]
@@ -0,0 +1,40 @@
+from typing import List
+from pydantic import BaseModel
+
+# Largest batch accepted by the bulk create endpoints
+BULK_MAX_ITEMS = 10000
+# Rejected rows listed in an import report; the rest are only counted
+IMPORT_MAX_REPORTED_ERRORS = 1000
+
+
+class BulkItemResult(BaseModel):
+    """Outcome of one item of a bulk create request."""
+
+    index: int
+    id: int | None = None
+    error: str | None = None
+
+
+class BulkCreateResponse(BaseModel):
+    """Schema for bulk create response."""
+
+    created: int
+    failed: int
+    results: List[BulkItemResult]
+
+
+class ImportRowError(BaseModel):
+    """A row rejected by a file import."""
+
+    line: int
+    cpf: str | None = None
+    error: str
+
+
+class ClienteImportResponse(BaseModel):
+    """Schema for the clientes import report."""
+
+    created: int
+    updated: int
+    failed: int
+    errors: List[ImportRowError]
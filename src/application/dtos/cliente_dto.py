@@ -1,5 +1,10 @@
 from datetime import datetime
+from typing import List
 from pydantic import BaseModel, EmailStr, Field, ConfigDict
+from .bulk_dto import BULK_MAX_ITEMS
+
+# Shortest cliente search term; trigram indexes cannot match anything shorter
+CLIENTE_SEARCH_MIN_LENGTH = 3
 
 
 class ClienteBase(BaseModel):
@@ -17,6 +22,12 @@ class ClienteCreate(ClienteBase):
     pass
 
 
+class ClienteBulkCreate(BaseModel):
+    """Schema for creating a batch of clientes."""
+
+    items: List[ClienteCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
 class ClienteUpdate(BaseModel):
     """Schema for updating a cliente."""
 
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class Expansao(str, Enum):
+    """Related entity a venda or reserva response can embed through expand."""
+
+    CLIENTE = "cliente"
+    APARTAMENTO = "apartamento"
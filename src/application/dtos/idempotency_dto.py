@@ -0,0 +1,16 @@
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+
+class IdempotentRequest(BaseModel):
+    """A create request sent with an Idempotency-Key header."""
+
+    # Keys are scoped to the user and the endpoint they were sent to
+    usuario_id: int
+    endpoint: str = Field(..., max_length=100)
+    key: str = Field(..., min_length=1, max_length=255)
+    # SHA-256 of the request body
+    fingerprint: str = Field(..., min_length=64, max_length=64)
+    # Status the first response is stored and replayed with
+    status_code: int
+    expires_at: datetime
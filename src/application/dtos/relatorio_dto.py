@@ -0,0 +1,41 @@
+from datetime import date
+from enum import Enum
+from typing import List
+from pydantic import BaseModel
+
+
+class AgrupamentoVendas(str, Enum):
+    """Dimensions the vendas report can be grouped by."""
+
+    BLOCO = "bloco"
+    QUARTOS = "quartos"
+    MES = "mes"
+    CLIENTE = "cliente"
+
+
+class VendasResumo(BaseModel):
+    """Aggregated figures for a set of vendas."""
+
+    quantidade: int
+    valor_total: float
+    ticket_medio: float
+    valor_entrada_total: float
+    # valor_entrada_total / valor_total, i.e. weighted by valor_venda
+    razao_entrada: float
+
+
+class VendasGrupo(VendasResumo):
+    """Aggregated figures for one group of vendas."""
+
+    grupo: str
+    descricao: str | None = None
+
+
+class RelatorioVendasResponse(BaseModel):
+    """Schema for the vendas report."""
+
+    agrupamento: AgrupamentoVendas | None = None
+    data_inicio: date | None = None
+    data_fim: date | None = None
+    total: VendasResumo
+    grupos: List[VendasGrupo]
@@ -1,5 +1,8 @@
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
+from .apartamento_dto import ApartamentoResponse
+from .cliente_dto import ClienteResponse
 
 
 class ReservaCreate(BaseModel):
@@ -23,3 +26,10 @@ class ReservaResponse(BaseModel):
     ativa: bool
     created_at: datetime
     updated_at: datetime
+
+
+class ReservaExpandidaResponse(ReservaResponse):
+    """Schema for reserva response embedding the relations requested through expand."""
+
+    cliente: Optional[ClienteResponse] = None
+    apartamento: Optional[ApartamentoResponse] = None
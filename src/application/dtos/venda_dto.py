@@ -1,5 +1,8 @@
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
+from .apartamento_dto import ApartamentoResponse
+from .cliente_dto import ClienteResponse
 
 
 class VendaCreate(BaseModel):
@@ -24,3 +27,10 @@ class VendaResponse(BaseModel):
     data_venda: datetime
     created_at: datetime
     updated_at: datetime
+
+
+class VendaExpandidaResponse(VendaResponse):
+    """Schema for venda response embedding the relations requested through expand."""
+
+    cliente: Optional[ClienteResponse] = None
+    apartamento: Optional[ApartamentoResponse] = None
@@ -3,6 +3,13 @@ from .apartamento_service import ApartamentoService
 from .venda_service import VendaService
 from .reserva_service import ReservaService
 from .auth_service import AuthService
+from .idempotency_service import IdempotencyService
+from .async_cliente_service import AsyncClienteService
+from .async_apartamento_service import AsyncApartamentoService
+from .async_venda_service import AsyncVendaService
+from .async_reserva_service import AsyncReservaService
+from .async_auth_service import AsyncAuthService
+from .async_idempotency_service import AsyncIdempotencyService
 
 __all__ = [
     "ClienteService",
@@ -10,4 +17,11 @@ __all__ = [
     "VendaService",
     "ReservaService",
     "AuthService",
+    "IdempotencyService",
+    "AsyncClienteService",
+    "AsyncApartamentoService",
+    "AsyncVendaService",
+    "AsyncReservaService",
+    "AsyncAuthService",
+    "AsyncIdempotencyService",
 ]
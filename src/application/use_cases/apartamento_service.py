@@ -1,9 +1,24 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from src.infrastructure.database.repositories import ApartamentoRepository
+from src.infrastructure.database.repositories import (
+    ApartamentoRepository,
+    ApartamentoResumoRepository,
+    CachedApartamentoRepository,
+)
 from src.infrastructure.database.models import Apartamento
 from src.infrastructure.database.models.apartamento import StatusApartamento
-from src.application.dtos import ApartamentoCreate, ApartamentoUpdate
+from src.application.dtos import (
+    BulkCreateResponse,
+    ApartamentoCreate,
+    ApartamentoUpdate,
+    ApartamentoFiltro,
+    ApartamentoResponse,
+    ApartamentoResumoResponse,
+)
+from .bulk import bulk_create_response, partition_bulk_items
+from .relatorios import apartamento_resumo_response
 
 
 class ApartamentoService:
@@ -12,6 +27,9 @@ class ApartamentoService:
     def __init__(self, db: Session):
         self.db = db
         self.apartamento_repo = ApartamentoRepository(db)
+        # Hot reads are served from the apartamento cache
+        self.cached_repo = CachedApartamentoRepository(self.apartamento_repo)
+        self.resumo_repo = ApartamentoResumoRepository(db)
 
     def create_apartamento(self, apartamento_data: ApartamentoCreate) -> Apartamento:
         """Create a new apartamento."""
@@ -21,22 +39,77 @@ class ApartamentoService:
 
         return self.apartamento_repo.create(apartamento_data)
 
-    def get_apartamento(self, apartamento_id: int) -> Optional[Apartamento]:
+    def create_apartamentos_bulk(self, items: List[ApartamentoCreate]) -> BulkCreateResponse:
+        """Create a batch of apartamentos, reporting the outcome of each item."""
+        existing = self.apartamento_repo.get_existing_numeros(item.numero for item in items)
+        rejected, accepted = partition_bulk_items(
+            items,
+            key=lambda item: item.numero,
+            existing=existing,
+            exists_error="Apartamento number already exists",
+            duplicate_error="Apartamento number repeated in batch",
+        )
+
+        ids: List[int] = []
+        if accepted:
+            try:
+                created = self.apartamento_repo.create_many([item for _, item in accepted])
+            except IntegrityError:
+                # Another request inserted one of the numeros after the duplicate check
+                self.db.rollback()
+                raise ValueError("Apartamento number already exists")
+
+            ids = [created[item.numero] for _, item in accepted]
+
+        return bulk_create_response(rejected, accepted, ids)
+
+    def get_apartamento(self, apartamento_id: int) -> ApartamentoResponse:
         """Get an apartamento by ID."""
-        apartamento = self.apartamento_repo.get_by_id(apartamento_id)
+        apartamento = self.cached_repo.get_by_id(apartamento_id)
         if not apartamento:
             raise ValueError("Apartamento not found")
         return apartamento
 
-    def get_all_apartamentos(self, skip: int = 0, limit: int = 100) -> List[Apartamento]:
+    def get_all_apartamentos(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[ApartamentoResponse]:
         """Get all apartamentos."""
-        return self.apartamento_repo.get_all(skip, limit)
+        return self.cached_repo.get_all(skip, limit, after_id)
 
     def get_apartamentos_by_status(
-        self, status: StatusApartamento, skip: int = 0, limit: int = 100
-    ) -> List[Apartamento]:
+        self, status: StatusApartamento, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[ApartamentoResponse]:
         """Get apartamentos by status."""
-        return self.apartamento_repo.get_by_status(status, skip, limit)
+        return self.cached_repo.get_by_status(status, skip, limit, after_id)
+
+    def search_apartamentos(
+        self,
+        filtro: ApartamentoFiltro,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        after_value: Optional[float] = None,
+    ) -> List[ApartamentoResponse]:
+        """Search apartamentos by status, bloco, quartos and preco, area and andar ranges."""
+        return self.cached_repo.search(filtro, skip, limit, after_id, after_value)
+
+    def get_apartamento_updated_at(self, apartamento_id: int) -> datetime:
+        """Get when an apartamento last changed, without building its response."""
+        updated_at = self.cached_repo.get_updated_at(apartamento_id)
+        if updated_at is None:
+            raise ValueError("Apartamento not found")
+        return updated_at
+
+    def search_apartamentos_updated_at(
+        self,
+        filtro: ApartamentoFiltro,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        after_value: Optional[float] = None,
+    ) -> List[Tuple[int, datetime]]:
+        """Get the (id, updated_at) of the apartamentos search_apartamentos returns."""
+        return self.cached_repo.search_updated_at(filtro, skip, limit, after_id, after_value)
 
     def update_apartamento(
         self, apartamento_id: int, apartamento_data: ApartamentoUpdate
@@ -53,6 +126,10 @@ class ApartamentoService:
             raise ValueError("Apartamento not found")
         return True
 
+    def get_resumo(self, bloco: Optional[str] = None) -> ApartamentoResumoResponse:
+        """Get the number of apartamentos per status, per bloco and andar."""
+        return apartamento_resumo_response(self.resumo_repo.get_all(bloco))
+
     def check_disponibilidade(self, apartamento_id: int) -> bool:
         """Check if apartamento is available."""
         apartamento = self.get_apartamento(apartamento_id)
@@ -0,0 +1,136 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.repositories import (
+    AsyncApartamentoRepository,
+    AsyncApartamentoResumoRepository,
+    AsyncCachedApartamentoRepository,
+)
+from src.infrastructure.database.models import Apartamento
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.application.dtos import (
+    BulkCreateResponse,
+    ApartamentoCreate,
+    ApartamentoUpdate,
+    ApartamentoFiltro,
+    ApartamentoResponse,
+    ApartamentoResumoResponse,
+)
+from .bulk import bulk_create_response, partition_bulk_items
+from .relatorios import apartamento_resumo_response
+
+
+class AsyncApartamentoService:
+    """Async Apartamento service."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.apartamento_repo = AsyncApartamentoRepository(db)
+        # Hot reads are served from the apartamento cache
+        self.cached_repo = AsyncCachedApartamentoRepository(self.apartamento_repo)
+        self.resumo_repo = AsyncApartamentoResumoRepository(db)
+
+    async def create_apartamento(self, apartamento_data: ApartamentoCreate) -> Apartamento:
+        """Create a new apartamento."""
+        # Check if numero already exists
+        if await self.apartamento_repo.get_by_numero(apartamento_data.numero):
+            raise ValueError("Apartamento number already exists")
+
+        return await self.apartamento_repo.create(apartamento_data)
+
+    async def create_apartamentos_bulk(self, items: List[ApartamentoCreate]) -> BulkCreateResponse:
+        """Create a batch of apartamentos, reporting the outcome of each item."""
+        existing = await self.apartamento_repo.get_existing_numeros(item.numero for item in items)
+        rejected, accepted = partition_bulk_items(
+            items,
+            key=lambda item: item.numero,
+            existing=existing,
+            exists_error="Apartamento number already exists",
+            duplicate_error="Apartamento number repeated in batch",
+        )
+
+        ids: List[int] = []
+        if accepted:
+            try:
+                created = await self.apartamento_repo.create_many([item for _, item in accepted])
+            except IntegrityError:
+                # Another request inserted one of the numeros after the duplicate check
+                await self.db.rollback()
+                raise ValueError("Apartamento number already exists")
+
+            ids = [created[item.numero] for _, item in accepted]
+
+        return bulk_create_response(rejected, accepted, ids)
+
+    async def get_apartamento(self, apartamento_id: int) -> ApartamentoResponse:
+        """Get an apartamento by ID."""
+        apartamento = await self.cached_repo.get_by_id(apartamento_id)
+        if not apartamento:
+            raise ValueError("Apartamento not found")
+        return apartamento
+
+    async def get_all_apartamentos(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[ApartamentoResponse]:
+        """Get all apartamentos."""
+        return await self.cached_repo.get_all(skip, limit, after_id)
+
+    async def get_apartamentos_by_status(
+        self, status: StatusApartamento, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[ApartamentoResponse]:
+        """Get apartamentos by status."""
+        return await self.cached_repo.get_by_status(status, skip, limit, after_id)
+
+    async def search_apartamentos(
+        self,
+        filtro: ApartamentoFiltro,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        after_value: Optional[float] = None,
+    ) -> List[ApartamentoResponse]:
+        """Search apartamentos by status, bloco, quartos and preco, area and andar ranges."""
+        return await self.cached_repo.search(filtro, skip, limit, after_id, after_value)
+
+    async def get_apartamento_updated_at(self, apartamento_id: int) -> datetime:
+        """Get when an apartamento last changed, without building its response."""
+        updated_at = await self.cached_repo.get_updated_at(apartamento_id)
+        if updated_at is None:
+            raise ValueError("Apartamento not found")
+        return updated_at
+
+    async def search_apartamentos_updated_at(
+        self,
+        filtro: ApartamentoFiltro,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        after_value: Optional[float] = None,
+    ) -> List[Tuple[int, datetime]]:
+        """Get the (id, updated_at) of the apartamentos search_apartamentos returns."""
+        return await self.cached_repo.search_updated_at(filtro, skip, limit, after_id, after_value)
+
+    async def update_apartamento(
+        self, apartamento_id: int, apartamento_data: ApartamentoUpdate
+    ) -> Apartamento:
+        """Update an apartamento."""
+        apartamento = await self.apartamento_repo.update(apartamento_id, apartamento_data)
+        if not apartamento:
+            raise ValueError("Apartamento not found")
+        return apartamento
+
+    async def delete_apartamento(self, apartamento_id: int) -> bool:
+        """Delete an apartamento."""
+        if not await self.apartamento_repo.delete(apartamento_id):
+            raise ValueError("Apartamento not found")
+        return True
+
+    async def get_resumo(self, bloco: Optional[str] = None) -> ApartamentoResumoResponse:
+        """Get the number of apartamentos per status, per bloco and andar."""
+        return apartamento_resumo_response(await self.resumo_repo.get_all(bloco))
+
+    async def check_disponibilidade(self, apartamento_id: int) -> bool:
+        """Check if apartamento is available."""
+        apartamento = await self.get_apartamento(apartamento_id)
+        return apartamento.status == StatusApartamento.DISPONIVEL
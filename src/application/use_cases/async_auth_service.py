@@ -0,0 +1,59 @@
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.repositories import AsyncUsuarioRepository
+from src.infrastructure.auth import create_access_token, password_hasher, Principal, principal_cache
+from src.application.dtos import UserCreate, UserLogin, Token
+
+
+class AsyncAuthService:
+    """Async authentication service."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.usuario_repo = AsyncUsuarioRepository(db)
+
+    async def register(self, user_data: UserCreate):
+        """Register a new user."""
+        # Check if username already exists
+        if await self.usuario_repo.get_by_username(user_data.username):
+            raise ValueError("Username already exists")
+
+        # Check if email already exists
+        if await self.usuario_repo.get_by_email(user_data.email):
+            raise ValueError("Email already exists")
+
+        # Create user
+        hashed_password = await password_hasher.hash(user_data.password)
+        return await self.usuario_repo.create(user_data, hashed_password)
+
+    async def authenticate(self, user_data: UserLogin) -> Optional[Token]:
+        """Authenticate a user and return a token."""
+        user = await self.usuario_repo.get_by_username(user_data.username)
+        if not user:
+            return None
+
+        if not user.is_active:
+            return None
+
+        if not await password_hasher.verify(user_data.password, user.hashed_password):
+            return None
+
+        # Warm the principal cache so the first authenticated request skips the lookup
+        principal_cache.set(user.username, Principal.from_usuario(user))
+
+        access_token = create_access_token(data={"sub": user.username})
+        return Token(access_token=access_token, token_type="bearer")
+
+    async def get_user_by_username(self, username: str):
+        """Get user by username."""
+        return await self.usuario_repo.get_by_username(username)
+
+    async def set_user_active(self, username: str, is_active: bool):
+        """Activate or deactivate a user, dropping its cached principal."""
+        user = await self.usuario_repo.get_by_username(username)
+        if not user:
+            raise ValueError("User not found")
+
+        user = await self.usuario_repo.update_is_active(user.id, is_active)
+        principal_cache.delete(username)
+        return user
@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, List, Optional, Sequence, Tuple
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.repositories import AsyncClienteRepository
+from src.infrastructure.database.models import Cliente
+from src.application.dtos import BulkCreateResponse, ClienteCreate, ClienteImportResponse, ClienteUpdate
+from src.application.dtos.cliente_dto import CLIENTE_SEARCH_MIN_LENGTH
+from .bulk import bulk_create_response, partition_bulk_items
+from .cliente_import import ClienteCsvImport
+
+
+class AsyncClienteImporter:
+    """Upserts the clientes of a CSV file chunk by chunk as its bytes are fed in."""
+
+    def __init__(self, cliente_repo: AsyncClienteRepository, chunk_size: int = 1000):
+        self.cliente_repo = cliente_repo
+        self.state = ClienteCsvImport(chunk_size)
+
+    async def feed(self, data: bytes) -> None:
+        """Consume a piece of the file, writing every chunk it fills."""
+        for chunk in self.state.feed(data):
+            await self._write(chunk)
+
+    async def finish(self) -> ClienteImportResponse:
+        """Write the last chunk and return the import report."""
+        for chunk in self.state.close():
+            await self._write(chunk)
+        return self.state.response()
+
+    async def _write(self, chunk: List[ClienteCreate]) -> None:
+        # One query to tell updates from inserts, one upsert, one commit per chunk
+        existing = await self.cliente_repo.get_existing_cpfs(item.cpf for item in chunk)
+        await self.cliente_repo.upsert_many(chunk)
+        self.state.record_written(created=len(chunk) - len(existing), updated=len(existing))
+
+
+class AsyncClienteService:
+    """Async Cliente service."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.cliente_repo = AsyncClienteRepository(db)
+
+    async def create_cliente(self, cliente_data: ClienteCreate) -> Cliente:
+        """Create a new cliente."""
+        # Check if CPF already exists
+        if await self.cliente_repo.get_by_cpf(cliente_data.cpf):
+            raise ValueError("CPF already exists")
+
+        return await self.cliente_repo.create(cliente_data)
+
+    async def create_clientes_bulk(self, items: List[ClienteCreate]) -> BulkCreateResponse:
+        """Create a batch of clientes, reporting the outcome of each item."""
+        existing = await self.cliente_repo.get_existing_cpfs(item.cpf for item in items)
+        rejected, accepted = partition_bulk_items(
+            items,
+            key=lambda item: item.cpf,
+            existing=existing,
+            exists_error="CPF already exists",
+            duplicate_error="CPF repeated in batch",
+        )
+
+        ids: List[int] = []
+        if accepted:
+            try:
+                created = await self.cliente_repo.create_many([item for _, item in accepted])
+            except IntegrityError:
+                # Another request inserted one of the CPFs after the duplicate check
+                await self.db.rollback()
+                raise ValueError("CPF already exists")
+
+            ids = [created[item.cpf] for _, item in accepted]
+
+        return bulk_create_response(rejected, accepted, ids)
+
+    def start_import(self, chunk_size: int = 1000) -> AsyncClienteImporter:
+        """Start a CSV import; feed it the file's bytes and finish it for the report."""
+        return AsyncClienteImporter(self.cliente_repo, chunk_size)
+
+    async def import_clientes(
+        self, data: AsyncIterable[bytes], chunk_size: int = 1000
+    ) -> ClienteImportResponse:
+        """Import a CSV file read piece by piece, upserting clientes by CPF."""
+        importer = self.start_import(chunk_size)
+        async for piece in data:
+            await importer.feed(piece)
+        return await importer.finish()
+
+    async def get_cliente(self, cliente_id: int) -> Optional[Cliente]:
+        """Get a cliente by ID."""
+        cliente = await self.cliente_repo.get_by_id(cliente_id)
+        if not cliente:
+            raise ValueError("Cliente not found")
+        return cliente
+
+    async def get_all_clientes(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Cliente]:
+        """Get all clientes."""
+        return await self.cliente_repo.get_all(skip, limit, after_id)
+
+    async def get_cliente_updated_at(self, cliente_id: int) -> datetime:
+        """Get when a cliente last changed, without loading it."""
+        updated_at = await self.cliente_repo.get_updated_at(cliente_id)
+        if updated_at is None:
+            raise ValueError("Cliente not found")
+        return updated_at
+
+    async def get_all_clientes_updated_at(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Tuple[int, datetime]]:
+        """Get the (id, updated_at) of the clientes get_all_clientes returns."""
+        return await self.cliente_repo.get_all_updated_at(skip, limit, after_id)
+
+    async def search_clientes(self, q: str, limit: int = 20) -> List[Cliente]:
+        """Search clientes by CPF prefix or by part of nome, email or telefone."""
+        q = q.strip()
+        if len(q) < CLIENTE_SEARCH_MIN_LENGTH:
+            raise ValueError(f"Search term must have at least {CLIENTE_SEARCH_MIN_LENGTH} characters")
+        return await self.cliente_repo.search(q, limit)
+
+    def export_clientes(self, columns: Sequence[str], batch_size: int = 1000) -> AsyncIterator[List[Row]]:
+        """Stream every cliente for export, batch_size rows at a time."""
+        return self.cliente_repo.stream_all(columns, batch_size)
+
+    async def update_cliente(self, cliente_id: int, cliente_data: ClienteUpdate) -> Cliente:
+        """Update a cliente."""
+        cliente = await self.cliente_repo.update(cliente_id, cliente_data)
+        if not cliente:
+            raise ValueError("Cliente not found")
+        return cliente
+
+    async def delete_cliente(self, cliente_id: int) -> bool:
+        """Delete a cliente."""
+        if not await self.cliente_repo.delete(cliente_id):
+            raise ValueError("Cliente not found")
+        return True
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.exceptions import IdempotencyKeyReusedError
+from src.infrastructure.database.models import IdempotencyKey
+from src.infrastructure.database.repositories import AsyncIdempotencyKeyRepository
+from src.application.dtos import IdempotentRequest
+
+
+class AsyncIdempotencyService:
+    """Async Idempotency key service."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.idempotency_repo = AsyncIdempotencyKeyRepository(db)
+
+    async def find(self, request: IdempotentRequest, now: Optional[datetime] = None) -> Optional[IdempotencyKey]:
+        """Get the stored response of an earlier request with the same key.
+
+        Raises IdempotencyKeyReusedError when the key was sent with a
+        different request body.
+        """
+        now = now or datetime.utcnow()
+        stored = await self.idempotency_repo.get(request.usuario_id, request.endpoint, request.key)
+        if stored is None:
+            return None
+        if stored.expires_at <= now:
+            # Past its TTL but not cleaned up yet: the key is free again
+            await self.idempotency_repo.delete(stored)
+            return None
+        if stored.fingerprint != request.fingerprint:
+            raise IdempotencyKeyReusedError("Idempotency-Key was already used with a different request")
+        return stored
+
+    async def delete_expired(self, now: datetime, limit: int) -> int:
+        """Delete up to limit keys expired at now."""
+        return await self.idempotency_repo.delete_expired(now, limit)
@@ -0,0 +1,122 @@
+from datetime import datetime
+from typing import AsyncIterator, Collection, List, Optional, Sequence
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.repositories import (
+    AsyncReservaRepository,
+    AsyncApartamentoRepository,
+    AsyncClienteRepository,
+    AsyncIdempotencyKeyRepository,
+)
+from src.infrastructure.database.models import Reserva
+from src.infrastructure.database.unit_of_work import async_unit_of_work
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.application.dtos import Expansao, IdempotentRequest, ReservaCreate, ReservaResponse
+
+
+class AsyncReservaService:
+    """Async Reserva service."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.reserva_repo = AsyncReservaRepository(db, auto_commit=False)
+        self.apartamento_repo = AsyncApartamentoRepository(db, auto_commit=False)
+        self.cliente_repo = AsyncClienteRepository(db, auto_commit=False)
+        self.idempotency_repo = AsyncIdempotencyKeyRepository(db, auto_commit=False)
+
+    async def create_reserva(
+        self, reserva_data: ReservaCreate, idempotency: Optional[IdempotentRequest] = None
+    ) -> Reserva:
+        """Create a new reserva, storing its response under the idempotency key if one is given."""
+        # Verify cliente exists
+        cliente = await self.cliente_repo.get_by_id(reserva_data.cliente_id)
+        if not cliente:
+            raise ValueError("Cliente not found")
+
+        # Verify apartamento exists
+        apartamento = await self.apartamento_repo.get_by_id(reserva_data.apartamento_id)
+        if not apartamento:
+            raise ValueError("Apartamento not found")
+
+        # Check if apartamento is disponivel
+        if apartamento.status != StatusApartamento.DISPONIVEL:
+            raise ValueError("Apartamento is not available")
+
+        # Check if apartamento already has an active reserva
+        existing_reserva = await self.reserva_repo.get_active_by_apartamento_id(reserva_data.apartamento_id)
+        if existing_reserva:
+            raise ValueError("Apartamento already has an active reservation")
+
+        # Create reserva and mark apartamento as reservado in a single transaction
+        async with async_unit_of_work(self.db):
+            reserva = await self.reserva_repo.create(reserva_data)
+            await self.apartamento_repo.update_status(reserva_data.apartamento_id, StatusApartamento.RESERVADO)
+            await self.idempotency_repo.store_response(idempotency, ReservaResponse, reserva)
+
+        return reserva
+
+    async def get_reserva(self, reserva_id: int, expand: Collection[Expansao] = ()) -> Optional[Reserva]:
+        """Get a reserva by ID, with the expanded relations loaded."""
+        reserva = await self.reserva_repo.get_by_id(reserva_id, expand)
+        if not reserva:
+            raise ValueError("Reserva not found")
+        return reserva
+
+    async def get_all_reservas(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        expand: Collection[Expansao] = (),
+    ) -> List[Reserva]:
+        """Get all reservas, with the expanded relations loaded."""
+        return await self.reserva_repo.get_all(skip, limit, after_id, expand)
+
+    def export_reservas(self, columns: Sequence[str], batch_size: int = 1000) -> AsyncIterator[List[Row]]:
+        """Stream every reserva for export, batch_size rows at a time."""
+        return self.reserva_repo.stream_all(columns, batch_size)
+
+    async def get_reservas_by_cliente(
+        self, cliente_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Reserva]:
+        """Get reservas by cliente ID."""
+        return await self.reserva_repo.get_by_cliente_id(cliente_id, skip, limit, after_id)
+
+    async def expire_due_reservas(self, now: datetime, batch_size: int) -> List[datetime]:
+        """Expire one batch of due reservas, returning their data_expiracao values."""
+        async with async_unit_of_work(self.db):
+            expired = await self.reserva_repo.expire_due(now, batch_size)
+            await self.apartamento_repo.release_reserved([apartamento_id for apartamento_id, _ in expired])
+
+        return [data_expiracao for _, data_expiracao in expired]
+
+    async def cancel_reserva(self, reserva_id: int) -> bool:
+        """Cancel a reserva."""
+        reserva = await self.reserva_repo.get_by_id(reserva_id)
+        if not reserva:
+            raise ValueError("Reserva not found")
+
+        async with async_unit_of_work(self.db):
+            # Update reserva to inactive
+            await self.reserva_repo.update_ativa(reserva_id, False)
+
+            # Update apartamento status back to disponivel
+            await self.apartamento_repo.update_status(reserva.apartamento_id, StatusApartamento.DISPONIVEL)
+
+        return True
+
+    async def delete_reserva(self, reserva_id: int) -> bool:
+        """Delete a reserva."""
+        reserva = await self.reserva_repo.get_by_id(reserva_id)
+        if not reserva:
+            raise ValueError("Reserva not found")
+
+        async with async_unit_of_work(self.db):
+            # Update apartamento status back to disponivel if reserva is active
+            if reserva.ativa:
+                await self.apartamento_repo.update_status(reserva.apartamento_id, StatusApartamento.DISPONIVEL)
+
+            if not await self.reserva_repo.delete(reserva_id):
+                raise ValueError("Reserva not found")
+
+        return True
@@ -0,0 +1,121 @@
+from datetime import date
+from typing import AsyncIterator, Collection, List, Optional, Sequence
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.repositories import (
+    AsyncVendaRepository,
+    AsyncApartamentoRepository,
+    AsyncClienteRepository,
+    AsyncIdempotencyKeyRepository,
+)
+from src.infrastructure.database.models import Venda
+from src.infrastructure.database.unit_of_work import async_unit_of_work
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.application.dtos import (
+    AgrupamentoVendas,
+    Expansao,
+    IdempotentRequest,
+    RelatorioVendasResponse,
+    VendaCreate,
+    VendaResponse,
+)
+from .relatorios import periodo_bounds, relatorio_vendas_response
+
+
+class AsyncVendaService:
+    """Async Venda service."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.venda_repo = AsyncVendaRepository(db, auto_commit=False)
+        self.apartamento_repo = AsyncApartamentoRepository(db, auto_commit=False)
+        self.cliente_repo = AsyncClienteRepository(db, auto_commit=False)
+        self.idempotency_repo = AsyncIdempotencyKeyRepository(db, auto_commit=False)
+
+    async def create_venda(
+        self, venda_data: VendaCreate, idempotency: Optional[IdempotentRequest] = None
+    ) -> Venda:
+        """Create a new venda, storing its response under the idempotency key if one is given."""
+        # Verify cliente exists
+        cliente = await self.cliente_repo.get_by_id(venda_data.cliente_id)
+        if not cliente:
+            raise ValueError("Cliente not found")
+
+        # Verify apartamento exists
+        apartamento = await self.apartamento_repo.get_by_id(venda_data.apartamento_id)
+        if not apartamento:
+            raise ValueError("Apartamento not found")
+
+        # Check if apartamento is disponivel or reservado
+        if apartamento.status not in [StatusApartamento.DISPONIVEL, StatusApartamento.RESERVADO]:
+            raise ValueError("Apartamento is not available for sale")
+
+        # Check if apartamento already has a venda
+        existing_venda = await self.venda_repo.get_by_apartamento_id(venda_data.apartamento_id)
+        if existing_venda:
+            raise ValueError("Apartamento already sold")
+
+        # Create venda and mark apartamento as vendido in a single transaction
+        async with async_unit_of_work(self.db):
+            venda = await self.venda_repo.create(venda_data)
+            await self.apartamento_repo.update_status(venda_data.apartamento_id, StatusApartamento.VENDIDO)
+            await self.idempotency_repo.store_response(idempotency, VendaResponse, venda)
+
+        return venda
+
+    async def get_venda(self, venda_id: int, expand: Collection[Expansao] = ()) -> Optional[Venda]:
+        """Get a venda by ID, with the expanded relations loaded."""
+        venda = await self.venda_repo.get_by_id(venda_id, expand)
+        if not venda:
+            raise ValueError("Venda not found")
+        return venda
+
+    async def get_all_vendas(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        expand: Collection[Expansao] = (),
+    ) -> List[Venda]:
+        """Get all vendas, with the expanded relations loaded."""
+        return await self.venda_repo.get_all(skip, limit, after_id, expand)
+
+    def export_vendas(self, columns: Sequence[str], batch_size: int = 1000) -> AsyncIterator[List[Row]]:
+        """Stream every venda for export, batch_size rows at a time."""
+        return self.venda_repo.stream_all(columns, batch_size)
+
+    async def get_vendas_by_cliente(
+        self, cliente_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Venda]:
+        """Get vendas by cliente ID."""
+        return await self.venda_repo.get_by_cliente_id(cliente_id, skip, limit, after_id)
+
+    async def get_relatorio(
+        self,
+        group_by: Optional[AgrupamentoVendas] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        limit: int = 100,
+    ) -> RelatorioVendasResponse:
+        """Get vendas totals, optionally grouped, for the [data_inicio, data_fim) period."""
+        inicio, fim = periodo_bounds(data_inicio, data_fim)
+        total = await self.venda_repo.summarize(inicio, fim)
+        grupos = []
+        if group_by is not None:
+            grupos = await self.venda_repo.summarize_by(group_by, inicio, fim, limit)
+        return relatorio_vendas_response(group_by, data_inicio, data_fim, total, grupos)
+
+    async def delete_venda(self, venda_id: int) -> bool:
+        """Delete a venda."""
+        venda = await self.venda_repo.get_by_id(venda_id)
+        if not venda:
+            raise ValueError("Venda not found")
+
+        async with async_unit_of_work(self.db):
+            # Update apartamento status back to disponivel
+            await self.apartamento_repo.update_status(venda.apartamento_id, StatusApartamento.DISPONIVEL)
+
+            if not await self.venda_repo.delete(venda_id):
+                raise ValueError("Venda not found")
+
+        return True
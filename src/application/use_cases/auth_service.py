@@ -1,18 +1,22 @@
 from typing import Optional
 from sqlalchemy.orm import Session
 from src.infrastructure.database.repositories import UsuarioRepository
-from src.infrastructure.auth import verify_password, create_access_token
+from src.infrastructure.auth import create_access_token, password_hasher, Principal, principal_cache
 from src.application.dtos import UserCreate, UserLogin, Token
 
 
 class AuthService:
-    """Authentication service."""
+    """Authentication service.
+
+    register and authenticate are coroutines: their queries run on the
+    request's session, and only bcrypt goes to the bounded hashing pool.
+    """
 
     def __init__(self, db: Session):
         self.db = db
         self.usuario_repo = UsuarioRepository(db)
 
-    def register(self, user_data: UserCreate):
+    async def register(self, user_data: UserCreate):
         """Register a new user."""
         # Check if username already exists
         if self.usuario_repo.get_by_username(user_data.username):
@@ -23,9 +27,10 @@ class AuthService:
             raise ValueError("Email already exists")
 
         # Create user
-        return self.usuario_repo.create(user_data)
+        hashed_password = await password_hasher.hash(user_data.password)
+        return self.usuario_repo.create(user_data, hashed_password)
 
-    def authenticate(self, user_data: UserLogin) -> Optional[Token]:
+    async def authenticate(self, user_data: UserLogin) -> Optional[Token]:
         """Authenticate a user and return a token."""
         user = self.usuario_repo.get_by_username(user_data.username)
         if not user:
@@ -34,12 +39,25 @@ class AuthService:
         if not user.is_active:
             return None
 
-        if not verify_password(user_data.password, user.hashed_password):
+        if not await password_hasher.verify(user_data.password, user.hashed_password):
             return None
 
+        # Warm the principal cache so the first authenticated request skips the lookup
+        principal_cache.set(user.username, Principal.from_usuario(user))
+
         access_token = create_access_token(data={"sub": user.username})
         return Token(access_token=access_token, token_type="bearer")
 
     def get_user_by_username(self, username: str):
         """Get user by username."""
         return self.usuario_repo.get_by_username(username)
+
+    def set_user_active(self, username: str, is_active: bool):
+        """Activate or deactivate a user, dropping its cached principal."""
+        user = self.usuario_repo.get_by_username(username)
+        if not user:
+            raise ValueError("User not found")
+
+        user = self.usuario_repo.update_is_active(user.id, is_active)
+        principal_cache.delete(username)
+        return user
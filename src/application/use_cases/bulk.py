@@ -0,0 +1,36 @@
+from typing import Callable, Hashable, List, Sequence, Set, Tuple, TypeVar
+from src.application.dtos import BulkItemResult, BulkCreateResponse
+
+T = TypeVar("T")
+
+
+def partition_bulk_items(
+    items: Sequence[T],
+    key: Callable[[T], Hashable],
+    existing: Set[Hashable],
+    exists_error: str,
+    duplicate_error: str,
+) -> Tuple[List[BulkItemResult], List[Tuple[int, T]]]:
+    """Split a batch into rejected item results and the (index, item) pairs to insert."""
+    rejected: List[BulkItemResult] = []
+    accepted: List[Tuple[int, T]] = []
+    seen: Set[Hashable] = set()
+    for index, item in enumerate(items):
+        value = key(item)
+        if value in existing:
+            rejected.append(BulkItemResult(index=index, error=exists_error))
+        elif value in seen:
+            rejected.append(BulkItemResult(index=index, error=duplicate_error))
+        else:
+            seen.add(value)
+            accepted.append((index, item))
+    return rejected, accepted
+
+
+def bulk_create_response(
+    rejected: List[BulkItemResult], accepted: List[Tuple[int, T]], ids: List[int]
+) -> BulkCreateResponse:
+    """Merge rejected and created items into per-item results, in request order."""
+    results = rejected + [BulkItemResult(index=index, id=id_) for (index, _), id_ in zip(accepted, ids)]
+    results.sort(key=lambda result: result.index)
+    return BulkCreateResponse(created=len(ids), failed=len(rejected), results=results)
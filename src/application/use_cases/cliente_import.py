@@ -0,0 +1,225 @@
+import codecs
+import csv
+from typing import List, NamedTuple, Optional, Set, Tuple
+from pydantic import ValidationError
+from src.application.dtos import ClienteCreate, ClienteImportResponse, ImportRowError
+from src.application.dtos.bulk_dto import IMPORT_MAX_REPORTED_ERRORS
+
+REQUIRED_COLUMNS = ("nome", "cpf", "email", "telefone")
+
+
+class CsvRecord(NamedTuple):
+    """One CSV record and the line it starts on; error is set when it cannot be parsed."""
+
+    line: int
+    fields: List[str]
+    error: Optional[str] = None
+
+
+# Quote states of csv.reader's default dialect, carried from one line of a record to the next
+START_FIELD, UNQUOTED, QUOTED, QUOTE_IN_QUOTED = range(4)
+# A quoted field still open after this many lines is reported, and reading resumes at its second line
+MAX_RECORD_LINES = 100
+
+
+def quote_state(text: str, state: int = START_FIELD) -> int:
+    """Scan a line the way csv.reader does, returning the quote state at its end.
+
+    Only a quote that starts a field opens a quoted field; anywhere else it
+    is a literal character, as in 'Ana 5" tall'.
+    """
+    if state != QUOTED and '"' not in text:
+        return UNQUOTED
+    for char in text:
+        if state == QUOTED:
+            if char == '"':
+                state = QUOTE_IN_QUOTED
+        elif char == ",":
+            state = START_FIELD
+        elif state == START_FIELD:
+            state = QUOTED if char == '"' else UNQUOTED
+        elif state == QUOTE_IN_QUOTED:
+            # A doubled quote is an escaped one; anything else closes the quoted part
+            state = QUOTED if char == '"' else UNQUOTED
+    return state
+
+
+class CsvRecordReader:
+    """Splits a CSV byte stream into records as the bytes arrive.
+
+    Lines are cut on b"\\n", which never occurs inside a multi-byte UTF-8
+    sequence, and decoded one at a time, so an invalid byte only spoils its
+    own record. A record spans several lines while a quoted field is open.
+    """
+
+    def __init__(self):
+        self._buffer = b""
+        self._line = 0
+        self._start = 0
+        self._lines: List[Tuple[str, bool]] = []
+        self._state = START_FIELD
+
+    def feed(self, data: bytes) -> List[CsvRecord]:
+        """Consume a piece of the file, returning the records it completes."""
+        lines = (self._buffer + data).split(b"\n")
+        self._buffer = lines.pop()
+        records: List[CsvRecord] = []
+        for line in lines:
+            self._add_line(line, records)
+        return records
+
+    def close(self) -> List[CsvRecord]:
+        """Flush the last line, reporting a record left with an open quote."""
+        records: List[CsvRecord] = []
+        if self._buffer:
+            self._add_line(self._buffer, records)
+            self._buffer = b""
+        while self._lines:
+            self._resync(records)
+        return records
+
+    def _add_line(self, line: bytes, records: List[CsvRecord]) -> None:
+        self._line += 1
+        if self._line == 1 and line.startswith(codecs.BOM_UTF8):
+            line = line[len(codecs.BOM_UTF8):]
+        try:
+            text, invalid = line.rstrip(b"\r").decode("utf-8"), False
+        except UnicodeDecodeError:
+            text, invalid = line.rstrip(b"\r").decode("utf-8", errors="replace"), True
+        self._add_text(self._line, text, invalid, records)
+
+    def _add_text(self, line: int, text: str, invalid: bool, records: List[CsvRecord]) -> None:
+        if not self._lines:
+            self._start = line
+        self._lines.append((text, invalid))
+        self._state = quote_state(text, self._state)
+        if self._state == QUOTED:
+            if len(self._lines) >= MAX_RECORD_LINES:
+                self._resync(records)
+            return
+
+        start, lines = self._start, self._lines
+        self._lines, self._state = [], START_FIELD
+        text = "\n".join(part for part, _ in lines)
+        if any(invalid for _, invalid in lines):
+            records.append(CsvRecord(start, [], "Row is not valid UTF-8"))
+        elif text.strip():
+            try:
+                records.append(CsvRecord(start, next(csv.reader([text]))))
+            except csv.Error as e:
+                records.append(CsvRecord(start, [], str(e)))
+
+    def _resync(self, records: List[CsvRecord]) -> None:
+        """Report the record whose quote never closed and read the lines after its first again."""
+        start, lines = self._start, self._lines
+        self._lines, self._state = [], START_FIELD
+        records.append(CsvRecord(start, [], "Unterminated quoted field"))
+        for offset, (text, invalid) in enumerate(lines[1:], 1):
+            self._add_text(start + offset, text, invalid, records)
+
+
+def validation_message(exc: ValidationError) -> str:
+    """Summarize a pydantic error as 'field: message' pairs."""
+    return "; ".join(
+        ".".join(str(part) for part in error["loc"]) + ": " + error["msg"] for error in exc.errors()
+    )
+
+
+class ClienteCsvImport:
+    """Parsing, validation and report of one clientes CSV import.
+
+    Bytes go in through feed() and close(); validated clientes come out in
+    chunks of chunk_size, ready for one upsert each. Rejected rows are
+    counted and the first max_errors of them are listed in the report.
+    A CPF repeated in the file keeps its first row.
+    """
+
+    def __init__(self, chunk_size: int = 1000, max_errors: int = IMPORT_MAX_REPORTED_ERRORS):
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.columns: Optional[List[str]] = None
+        self.created = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors: List[ImportRowError] = []
+        self._reader = CsvRecordReader()
+        self._seen: Set[str] = set()
+        self._chunk: List[ClienteCreate] = []
+
+    def feed(self, data: bytes) -> List[List[ClienteCreate]]:
+        """Consume a piece of the file, returning the chunks it fills."""
+        return self._collect(self._reader.feed(data))
+
+    def close(self) -> List[List[ClienteCreate]]:
+        """Finish the file, returning the remaining chunks."""
+        chunks = self._collect(self._reader.close())
+        if self.columns is None:
+            raise ValueError("CSV file is empty")
+        if self._chunk:
+            chunks.append(self._chunk)
+            self._chunk = []
+        return chunks
+
+    def record_written(self, created: int, updated: int) -> None:
+        """Count the outcome of one upserted chunk."""
+        self.created += created
+        self.updated += updated
+
+    def response(self) -> ClienteImportResponse:
+        """Build the import report."""
+        return ClienteImportResponse(
+            created=self.created, updated=self.updated, failed=self.failed, errors=self.errors
+        )
+
+    def _collect(self, records: List[CsvRecord]) -> List[List[ClienteCreate]]:
+        chunks: List[List[ClienteCreate]] = []
+        for record in records:
+            if self.columns is None:
+                self._read_header(record)
+                continue
+            item = self._validate(record)
+            if item is not None:
+                self._chunk.append(item)
+                if len(self._chunk) >= self.chunk_size:
+                    chunks.append(self._chunk)
+                    self._chunk = []
+        return chunks
+
+    def _read_header(self, record: CsvRecord) -> None:
+        if record.error:
+            raise ValueError(f"Invalid CSV header: {record.error}")
+        columns = [column.strip().lower() for column in record.fields]
+        missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+        if missing:
+            raise ValueError("CSV header is missing the columns: " + ", ".join(missing))
+        self.columns = columns
+
+    def _validate(self, record: CsvRecord) -> Optional[ClienteCreate]:
+        if record.error:
+            self._reject(record.line, record.error)
+            return None
+        if len(record.fields) != len(self.columns):
+            self._reject(record.line, f"Expected {len(self.columns)} columns, got {len(record.fields)}")
+            return None
+
+        row = {
+            column: value.strip()
+            for column, value in zip(self.columns, record.fields)
+            if column in REQUIRED_COLUMNS
+        }
+        try:
+            item = ClienteCreate(**row)
+        except ValidationError as e:
+            self._reject(record.line, validation_message(e), row["cpf"] or None)
+            return None
+
+        if item.cpf in self._seen:
+            self._reject(record.line, "CPF repeated in file", item.cpf)
+            return None
+        self._seen.add(item.cpf)
+        return item
+
+    def _reject(self, line: int, error: str, cpf: Optional[str] = None) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(ImportRowError(line=line, cpf=cpf, error=error))
@@ -1,8 +1,39 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from src.infrastructure.database.repositories import ClienteRepository
 from src.infrastructure.database.models import Cliente
-from src.application.dtos import ClienteCreate, ClienteUpdate
+from src.application.dtos import BulkCreateResponse, ClienteCreate, ClienteImportResponse, ClienteUpdate
+from src.application.dtos.cliente_dto import CLIENTE_SEARCH_MIN_LENGTH
+from .bulk import bulk_create_response, partition_bulk_items
+from .cliente_import import ClienteCsvImport
+
+
+class ClienteImporter:
+    """Upserts the clientes of a CSV file chunk by chunk as its bytes are fed in."""
+
+    def __init__(self, cliente_repo: ClienteRepository, chunk_size: int = 1000):
+        self.cliente_repo = cliente_repo
+        self.state = ClienteCsvImport(chunk_size)
+
+    def feed(self, data: bytes) -> None:
+        """Consume a piece of the file, writing every chunk it fills."""
+        for chunk in self.state.feed(data):
+            self._write(chunk)
+
+    def finish(self) -> ClienteImportResponse:
+        """Write the last chunk and return the import report."""
+        for chunk in self.state.close():
+            self._write(chunk)
+        return self.state.response()
+
+    def _write(self, chunk: List[ClienteCreate]) -> None:
+        # One query to tell updates from inserts, one upsert, one commit per chunk
+        existing = self.cliente_repo.get_existing_cpfs(item.cpf for item in chunk)
+        self.cliente_repo.upsert_many(chunk)
+        self.state.record_written(created=len(chunk) - len(existing), updated=len(existing))
 
 
 class ClienteService:
@@ -20,6 +51,41 @@ class ClienteService:
 
         return self.cliente_repo.create(cliente_data)
 
+    def create_clientes_bulk(self, items: List[ClienteCreate]) -> BulkCreateResponse:
+        """Create a batch of clientes, reporting the outcome of each item."""
+        existing = self.cliente_repo.get_existing_cpfs(item.cpf for item in items)
+        rejected, accepted = partition_bulk_items(
+            items,
+            key=lambda item: item.cpf,
+            existing=existing,
+            exists_error="CPF already exists",
+            duplicate_error="CPF repeated in batch",
+        )
+
+        ids: List[int] = []
+        if accepted:
+            try:
+                created = self.cliente_repo.create_many([item for _, item in accepted])
+            except IntegrityError:
+                # Another request inserted one of the CPFs after the duplicate check
+                self.db.rollback()
+                raise ValueError("CPF already exists")
+
+            ids = [created[item.cpf] for _, item in accepted]
+
+        return bulk_create_response(rejected, accepted, ids)
+
+    def start_import(self, chunk_size: int = 1000) -> ClienteImporter:
+        """Start a CSV import; feed it the file's bytes and finish it for the report."""
+        return ClienteImporter(self.cliente_repo, chunk_size)
+
+    def import_clientes(self, data: Iterable[bytes], chunk_size: int = 1000) -> ClienteImportResponse:
+        """Import a CSV file read piece by piece, upserting clientes by CPF."""
+        importer = self.start_import(chunk_size)
+        for piece in data:
+            importer.feed(piece)
+        return importer.finish()
+
     def get_cliente(self, cliente_id: int) -> Optional[Cliente]:
         """Get a cliente by ID."""
         cliente = self.cliente_repo.get_by_id(cliente_id)
@@ -27,9 +93,35 @@ class ClienteService:
             raise ValueError("Cliente not found")
         return cliente
 
-    def get_all_clientes(self, skip: int = 0, limit: int = 100) -> List[Cliente]:
+    def get_all_clientes(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Cliente]:
         """Get all clientes."""
-        return self.cliente_repo.get_all(skip, limit)
+        return self.cliente_repo.get_all(skip, limit, after_id)
+
+    def get_cliente_updated_at(self, cliente_id: int) -> datetime:
+        """Get when a cliente last changed, without loading it."""
+        updated_at = self.cliente_repo.get_updated_at(cliente_id)
+        if updated_at is None:
+            raise ValueError("Cliente not found")
+        return updated_at
+
+    def get_all_clientes_updated_at(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Tuple[int, datetime]]:
+        """Get the (id, updated_at) of the clientes get_all_clientes returns."""
+        return self.cliente_repo.get_all_updated_at(skip, limit, after_id)
+
+    def search_clientes(self, q: str, limit: int = 20) -> List[Cliente]:
+        """Search clientes by CPF prefix or by part of nome, email or telefone."""
+        q = q.strip()
+        if len(q) < CLIENTE_SEARCH_MIN_LENGTH:
+            raise ValueError(f"Search term must have at least {CLIENTE_SEARCH_MIN_LENGTH} characters")
+        return self.cliente_repo.search(q, limit)
+
+    def export_clientes(self, columns: Sequence[str], batch_size: int = 1000) -> Iterator[List[Row]]:
+        """Stream every cliente for export, batch_size rows at a time."""
+        return self.cliente_repo.stream_all(columns, batch_size)
 
     def update_cliente(self, cliente_id: int, cliente_data: ClienteUpdate) -> Cliente:
         """Update a cliente."""
@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from src.domain.exceptions import IdempotencyKeyReusedError
+from src.infrastructure.database.models import IdempotencyKey
+from src.infrastructure.database.repositories import IdempotencyKeyRepository
+from src.application.dtos import IdempotentRequest
+
+
+class IdempotencyService:
+    """Idempotency key service.
+
+    The create use cases store the first response of a keyed request in
+    their own transaction, so a retry finds either both or neither.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.idempotency_repo = IdempotencyKeyRepository(db)
+
+    def find(self, request: IdempotentRequest, now: Optional[datetime] = None) -> Optional[IdempotencyKey]:
+        """Get the stored response of an earlier request with the same key.
+
+        Raises IdempotencyKeyReusedError when the key was sent with a
+        different request body.
+        """
+        now = now or datetime.utcnow()
+        stored = self.idempotency_repo.get(request.usuario_id, request.endpoint, request.key)
+        if stored is None:
+            return None
+        if stored.expires_at <= now:
+            # Past its TTL but not cleaned up yet: the key is free again
+            self.idempotency_repo.delete(stored)
+            return None
+        if stored.fingerprint != request.fingerprint:
+            raise IdempotencyKeyReusedError("Idempotency-Key was already used with a different request")
+        return stored
+
+    def delete_expired(self, now: datetime, limit: int) -> int:
+        """Delete up to limit keys expired at now."""
+        return self.idempotency_repo.delete_expired(now, limit)
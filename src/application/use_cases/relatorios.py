@@ -0,0 +1,66 @@
+from datetime import date, datetime, time
+from typing import Any, Dict, Iterable, Optional, Tuple
+from src.application.dtos import (
+    AgrupamentoVendas,
+    ApartamentoResumoResponse,
+    RelatorioVendasResponse,
+    ResumoAndar,
+    ResumoContagem,
+    VendasGrupo,
+    VendasResumo,
+)
+
+
+def periodo_bounds(
+    data_inicio: Optional[date], data_fim: Optional[date]
+) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Turn the [data_inicio, data_fim) dates into data_venda bounds."""
+    if data_inicio is not None and data_fim is not None and data_fim < data_inicio:
+        raise ValueError("data_fim must not be before data_inicio")
+    return (
+        datetime.combine(data_inicio, time.min) if data_inicio is not None else None,
+        datetime.combine(data_fim, time.min) if data_fim is not None else None,
+    )
+
+
+def _resumo(row: Any) -> Dict[str, Any]:
+    valor_total = float(row.valor_total)
+    valor_entrada_total = float(row.valor_entrada_total)
+    return {
+        "quantidade": row.quantidade,
+        "valor_total": valor_total,
+        "ticket_medio": round(valor_total / row.quantidade, 2) if row.quantidade else 0.0,
+        "valor_entrada_total": valor_entrada_total,
+        "razao_entrada": round(valor_entrada_total / valor_total, 4) if valor_total else 0.0,
+    }
+
+
+def relatorio_vendas_response(
+    group_by: Optional[AgrupamentoVendas],
+    data_inicio: Optional[date],
+    data_fim: Optional[date],
+    total: Any,
+    grupos: Iterable[Any] = (),
+) -> RelatorioVendasResponse:
+    """Turn the aggregate rows into the report, deriving the averages and ratios."""
+    return RelatorioVendasResponse(
+        agrupamento=group_by,
+        data_inicio=data_inicio,
+        data_fim=data_fim,
+        total=VendasResumo(**_resumo(total)),
+        grupos=[VendasGrupo(grupo=str(row.grupo), descricao=row.descricao, **_resumo(row)) for row in grupos],
+    )
+
+
+def apartamento_resumo_response(rows: Iterable[Any]) -> ApartamentoResumoResponse:
+    """Pivot the (bloco, andar, status, quantidade) summary rows into one entry per andar."""
+    totais = ResumoContagem()
+    andares: Dict[Tuple[str, int], ResumoAndar] = {}
+    for row in rows:
+        andar = andares.get((row.bloco, row.andar))
+        if andar is None:
+            andar = andares[(row.bloco, row.andar)] = ResumoAndar(bloco=row.bloco, andar=row.andar)
+        for contagem in (andar, totais):
+            setattr(contagem, row.status.value, getattr(contagem, row.status.value) + row.quantidade)
+            contagem.total += row.quantidade
+    return ApartamentoResumoResponse(totais=totais, andares=list(andares.values()))
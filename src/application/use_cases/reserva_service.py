@@ -1,9 +1,17 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Collection, Iterator, List, Optional, Sequence
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
-from src.infrastructure.database.repositories import ReservaRepository, ApartamentoRepository, ClienteRepository
+from src.infrastructure.database.repositories import (
+    ReservaRepository,
+    ApartamentoRepository,
+    ClienteRepository,
+    IdempotencyKeyRepository,
+)
 from src.infrastructure.database.models import Reserva
+from src.infrastructure.database.unit_of_work import unit_of_work
 from src.infrastructure.database.models.apartamento import StatusApartamento
-from src.application.dtos import ReservaCreate
+from src.application.dtos import Expansao, IdempotentRequest, ReservaCreate, ReservaResponse
 
 
 class ReservaService:
@@ -11,12 +19,15 @@ class ReservaService:
 
     def __init__(self, db: Session):
         self.db = db
-        self.reserva_repo = ReservaRepository(db)
-        self.apartamento_repo = ApartamentoRepository(db)
-        self.cliente_repo = ClienteRepository(db)
-
-    def create_reserva(self, reserva_data: ReservaCreate) -> Reserva:
-        """Create a new reserva."""
+        self.reserva_repo = ReservaRepository(db, auto_commit=False)
+        self.apartamento_repo = ApartamentoRepository(db, auto_commit=False)
+        self.cliente_repo = ClienteRepository(db, auto_commit=False)
+        self.idempotency_repo = IdempotencyKeyRepository(db, auto_commit=False)
+
+    def create_reserva(
+        self, reserva_data: ReservaCreate, idempotency: Optional[IdempotentRequest] = None
+    ) -> Reserva:
+        """Create a new reserva, storing its response under the idempotency key if one is given."""
         # Verify cliente exists
         cliente = self.cliente_repo.get_by_id(reserva_data.cliente_id)
         if not cliente:
@@ -36,28 +47,48 @@ class ReservaService:
         if existing_reserva:
             raise ValueError("Apartamento already has an active reservation")
 
-        # Create reserva
-        reserva = self.reserva_repo.create(reserva_data)
-
-        # Update apartamento status to reservado
-        self.apartamento_repo.update_status(reserva_data.apartamento_id, StatusApartamento.RESERVADO)
+        # Create reserva and mark apartamento as reservado in a single transaction
+        with unit_of_work(self.db):
+            reserva = self.reserva_repo.create(reserva_data)
+            self.apartamento_repo.update_status(reserva_data.apartamento_id, StatusApartamento.RESERVADO)
+            self.idempotency_repo.store_response(idempotency, ReservaResponse, reserva)
 
         return reserva
 
-    def get_reserva(self, reserva_id: int) -> Optional[Reserva]:
-        """Get a reserva by ID."""
-        reserva = self.reserva_repo.get_by_id(reserva_id)
+    def get_reserva(self, reserva_id: int, expand: Collection[Expansao] = ()) -> Optional[Reserva]:
+        """Get a reserva by ID, with the expanded relations loaded."""
+        reserva = self.reserva_repo.get_by_id(reserva_id, expand)
         if not reserva:
             raise ValueError("Reserva not found")
         return reserva
 
-    def get_all_reservas(self, skip: int = 0, limit: int = 100) -> List[Reserva]:
-        """Get all reservas."""
-        return self.reserva_repo.get_all(skip, limit)
-
-    def get_reservas_by_cliente(self, cliente_id: int, skip: int = 0, limit: int = 100) -> List[Reserva]:
+    def get_all_reservas(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        expand: Collection[Expansao] = (),
+    ) -> List[Reserva]:
+        """Get all reservas, with the expanded relations loaded."""
+        return self.reserva_repo.get_all(skip, limit, after_id, expand)
+
+    def export_reservas(self, columns: Sequence[str], batch_size: int = 1000) -> Iterator[List[Row]]:
+        """Stream every reserva for export, batch_size rows at a time."""
+        return self.reserva_repo.stream_all(columns, batch_size)
+
+    def get_reservas_by_cliente(
+        self, cliente_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Reserva]:
         """Get reservas by cliente ID."""
-        return self.reserva_repo.get_by_cliente_id(cliente_id, skip, limit)
+        return self.reserva_repo.get_by_cliente_id(cliente_id, skip, limit, after_id)
+
+    def expire_due_reservas(self, now: datetime, batch_size: int) -> List[datetime]:
+        """Expire one batch of due reservas, returning their data_expiracao values."""
+        with unit_of_work(self.db):
+            expired = self.reserva_repo.expire_due(now, batch_size)
+            self.apartamento_repo.release_reserved([apartamento_id for apartamento_id, _ in expired])
+
+        return [data_expiracao for _, data_expiracao in expired]
 
     def cancel_reserva(self, reserva_id: int) -> bool:
         """Cancel a reserva."""
@@ -65,11 +96,12 @@ class ReservaService:
         if not reserva:
             raise ValueError("Reserva not found")
 
-        # Update reserva to inactive
-        self.reserva_repo.update_ativa(reserva_id, False)
+        with unit_of_work(self.db):
+            # Update reserva to inactive
+            self.reserva_repo.update_ativa(reserva_id, False)
 
-        # Update apartamento status back to disponivel
-        self.apartamento_repo.update_status(reserva.apartamento_id, StatusApartamento.DISPONIVEL)
+            # Update apartamento status back to disponivel
+            self.apartamento_repo.update_status(reserva.apartamento_id, StatusApartamento.DISPONIVEL)
 
         return True
 
@@ -79,11 +111,12 @@ class ReservaService:
         if not reserva:
             raise ValueError("Reserva not found")
 
-        # Update apartamento status back to disponivel if reserva is active
-        if reserva.ativa:
-            self.apartamento_repo.update_status(reserva.apartamento_id, StatusApartamento.DISPONIVEL)
+        with unit_of_work(self.db):
+            # Update apartamento status back to disponivel if reserva is active
+            if reserva.ativa:
+                self.apartamento_repo.update_status(reserva.apartamento_id, StatusApartamento.DISPONIVEL)
 
-        if not self.reserva_repo.delete(reserva_id):
-            raise ValueError("Reserva not found")
+            if not self.reserva_repo.delete(reserva_id):
+                raise ValueError("Reserva not found")
 
         return True
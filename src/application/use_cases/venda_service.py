@@ -1,9 +1,25 @@
-from typing import List, Optional
+from datetime import date
+from typing import Collection, Iterator, List, Optional, Sequence
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
-from src.infrastructure.database.repositories import VendaRepository, ApartamentoRepository, ClienteRepository
+from src.infrastructure.database.repositories import (
+    VendaRepository,
+    ApartamentoRepository,
+    ClienteRepository,
+    IdempotencyKeyRepository,
+)
 from src.infrastructure.database.models import Venda
+from src.infrastructure.database.unit_of_work import unit_of_work
 from src.infrastructure.database.models.apartamento import StatusApartamento
-from src.application.dtos import VendaCreate
+from src.application.dtos import (
+    AgrupamentoVendas,
+    Expansao,
+    IdempotentRequest,
+    RelatorioVendasResponse,
+    VendaCreate,
+    VendaResponse,
+)
+from .relatorios import periodo_bounds, relatorio_vendas_response
 
 
 class VendaService:
@@ -11,12 +27,15 @@ class VendaService:
 
     def __init__(self, db: Session):
         self.db = db
-        self.venda_repo = VendaRepository(db)
-        self.apartamento_repo = ApartamentoRepository(db)
-        self.cliente_repo = ClienteRepository(db)
-
-    def create_venda(self, venda_data: VendaCreate) -> Venda:
-        """Create a new venda."""
+        self.venda_repo = VendaRepository(db, auto_commit=False)
+        self.apartamento_repo = ApartamentoRepository(db, auto_commit=False)
+        self.cliente_repo = ClienteRepository(db, auto_commit=False)
+        self.idempotency_repo = IdempotencyKeyRepository(db, auto_commit=False)
+
+    def create_venda(
+        self, venda_data: VendaCreate, idempotency: Optional[IdempotentRequest] = None
+    ) -> Venda:
+        """Create a new venda, storing its response under the idempotency key if one is given."""
         # Verify cliente exists
         cliente = self.cliente_repo.get_by_id(venda_data.cliente_id)
         if not cliente:
@@ -36,28 +55,55 @@ class VendaService:
         if existing_venda:
             raise ValueError("Apartamento already sold")
 
-        # Create venda
-        venda = self.venda_repo.create(venda_data)
-
-        # Update apartamento status to vendido
-        self.apartamento_repo.update_status(venda_data.apartamento_id, StatusApartamento.VENDIDO)
+        # Create venda and mark apartamento as vendido in a single transaction
+        with unit_of_work(self.db):
+            venda = self.venda_repo.create(venda_data)
+            self.apartamento_repo.update_status(venda_data.apartamento_id, StatusApartamento.VENDIDO)
+            self.idempotency_repo.store_response(idempotency, VendaResponse, venda)
 
         return venda
 
-    def get_venda(self, venda_id: int) -> Optional[Venda]:
-        """Get a venda by ID."""
-        venda = self.venda_repo.get_by_id(venda_id)
+    def get_venda(self, venda_id: int, expand: Collection[Expansao] = ()) -> Optional[Venda]:
+        """Get a venda by ID, with the expanded relations loaded."""
+        venda = self.venda_repo.get_by_id(venda_id, expand)
         if not venda:
             raise ValueError("Venda not found")
         return venda
 
-    def get_all_vendas(self, skip: int = 0, limit: int = 100) -> List[Venda]:
-        """Get all vendas."""
-        return self.venda_repo.get_all(skip, limit)
-
-    def get_vendas_by_cliente(self, cliente_id: int, skip: int = 0, limit: int = 100) -> List[Venda]:
+    def get_all_vendas(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        expand: Collection[Expansao] = (),
+    ) -> List[Venda]:
+        """Get all vendas, with the expanded relations loaded."""
+        return self.venda_repo.get_all(skip, limit, after_id, expand)
+
+    def export_vendas(self, columns: Sequence[str], batch_size: int = 1000) -> Iterator[List[Row]]:
+        """Stream every venda for export, batch_size rows at a time."""
+        return self.venda_repo.stream_all(columns, batch_size)
+
+    def get_vendas_by_cliente(
+        self, cliente_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Venda]:
         """Get vendas by cliente ID."""
-        return self.venda_repo.get_by_cliente_id(cliente_id, skip, limit)
+        return self.venda_repo.get_by_cliente_id(cliente_id, skip, limit, after_id)
+
+    def get_relatorio(
+        self,
+        group_by: Optional[AgrupamentoVendas] = None,
+        data_inicio: Optional[date] = None,
+        data_fim: Optional[date] = None,
+        limit: int = 100,
+    ) -> RelatorioVendasResponse:
+        """Get vendas totals, optionally grouped, for the [data_inicio, data_fim) period."""
+        inicio, fim = periodo_bounds(data_inicio, data_fim)
+        total = self.venda_repo.summarize(inicio, fim)
+        grupos = []
+        if group_by is not None:
+            grupos = self.venda_repo.summarize_by(group_by, inicio, fim, limit)
+        return relatorio_vendas_response(group_by, data_inicio, data_fim, total, grupos)
 
     def delete_venda(self, venda_id: int) -> bool:
         """Delete a venda."""
@@ -65,10 +111,11 @@ class VendaService:
         if not venda:
             raise ValueError("Venda not found")
 
-        # Update apartamento status back to disponivel
-        self.apartamento_repo.update_status(venda.apartamento_id, StatusApartamento.DISPONIVEL)
+        with unit_of_work(self.db):
+            # Update apartamento status back to disponivel
+            self.apartamento_repo.update_status(venda.apartamento_id, StatusApartamento.DISPONIVEL)
 
-        if not self.venda_repo.delete(venda_id):
-            raise ValueError("Venda not found")
+            if not self.venda_repo.delete(venda_id):
+                raise ValueError("Venda not found")
 
         return True
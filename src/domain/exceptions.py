@@ -0,0 +1,6 @@
+class ConcurrentUpdateError(ValueError):
+    """Raised when a row was changed by another transaction since it was read."""
+
+
+class IdempotencyKeyReusedError(ValueError):
+    """Raised when an Idempotency-Key is sent again with a different request."""
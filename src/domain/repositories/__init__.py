@@ -18,8 +18,8 @@ class BaseRepository(ABC, Generic[T]):
         pass
 
     @abstractmethod
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[T]:
-        """Get all entities."""
+    def get_all(self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[T]:
+        """Get all entities, ordered by ID."""
         pass
 
     @abstractmethod
@@ -4,10 +4,17 @@ from .jwt_handler import (
     create_access_token,
     decode_access_token,
 )
+from .principal_cache import Principal, principal_cache
+from .password_hasher import PasswordHasher, PasswordHasherBusyError, password_hasher
 
 __all__ = [
     "verify_password",
     "get_password_hash",
     "create_access_token",
     "decode_access_token",
+    "Principal",
+    "principal_cache",
+    "PasswordHasher",
+    "PasswordHasherBusyError",
+    "password_hasher",
 ]
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from src.infrastructure.cache import TTLCache
+from src.infrastructure.database.config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Authenticated user as seen by request handlers."""
+
+    id: int
+    username: str
+    is_active: bool
+
+    @classmethod
+    def from_usuario(cls, usuario) -> "Principal":
+        """Build a principal from a Usuario model."""
+        return cls(id=usuario.id, username=usuario.username, is_active=usuario.is_active)
+
+
+# Keyed by username (the token "sub"). Each worker keeps its own cache, so
+# AUTH_CACHE_TTL_SECONDS bounds how long other workers may see stale data.
+principal_cache = TTLCache(
+    max_size=settings.AUTH_CACHE_MAX_SIZE, ttl=settings.AUTH_CACHE_TTL_SECONDS
+)
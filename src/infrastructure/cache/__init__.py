@@ -0,0 +1,19 @@
+from .memory import TTLCache
+from .redis_cache import RedisCache
+from .apartamento_cache import (
+    ApartamentoCache,
+    CacheBackend,
+    apartamento_cache,
+    create_cache_backend,
+    mark_apartamentos_stale,
+)
+
+__all__ = [
+    "TTLCache",
+    "RedisCache",
+    "ApartamentoCache",
+    "CacheBackend",
+    "apartamento_cache",
+    "create_cache_backend",
+    "mark_apartamentos_stale",
+]
@@ -0,0 +1,136 @@
+import threading
+import uuid
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Protocol
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from src.infrastructure.database.config import settings
+from .memory import TTLCache
+from .redis_cache import RedisCache
+
+# Session.info key holding the apartamento IDs to invalidate once the transaction commits
+PENDING_INVALIDATIONS = "apartamento_cache_invalidations"
+LIST_GENERATION_KEY = "apartamentos:list-generation"
+LIST_GENERATION_TTL = 24 * 60 * 60.0
+
+
+class CacheBackend(Protocol):
+    """Operations the apartamento cache needs from a backend."""
+
+    def get(self, key: str, default: Any = None) -> Any: ...
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+def create_cache_backend(
+    backend: str, max_size: int, ttl: float, redis_url: Optional[str] = None
+) -> CacheBackend:
+    """Build the configured cache backend."""
+    if backend == "memory":
+        return TTLCache(max_size=max_size, ttl=ttl)
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("REDIS_URL is required for the redis cache backend")
+        return RedisCache.from_url(redis_url, ttl=ttl)
+    raise ValueError(f"Unknown cache backend '{backend}'")
+
+
+class ApartamentoCache:
+    """JSON snapshots of apartamentos, cached by ID and by list query.
+
+    List entries are keyed by a generation token; any write bumps the token,
+    so every cached page is dropped at once without tracking which pages
+    contained the changed unit.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, apartamento_id: int) -> Optional[Dict[str, Any]]:
+        """Get the snapshot of one apartamento."""
+        return self._count(self.backend.get(f"apartamento:{apartamento_id}"))
+
+    def set(self, apartamento_id: int, snapshot: Dict[str, Any]) -> None:
+        """Store the snapshot of one apartamento."""
+        self.backend.set(f"apartamento:{apartamento_id}", snapshot)
+
+    def get_list(self, query: Iterable[Hashable]) -> Optional[List[Dict[str, Any]]]:
+        """Get the snapshots returned by a list query."""
+        return self._count(self.backend.get(self._list_key(query)))
+
+    def set_list(self, query: Iterable[Hashable], snapshots: List[Dict[str, Any]]) -> None:
+        """Store the snapshots returned by a list query."""
+        self.backend.set(self._list_key(query), snapshots)
+
+    def invalidate(self, apartamento_ids: Iterable[int] = ()) -> None:
+        """Drop the given apartamentos and every cached list."""
+        for apartamento_id in apartamento_ids:
+            self.backend.delete(f"apartamento:{apartamento_id}")
+        self.backend.set(LIST_GENERATION_KEY, uuid.uuid4().hex, ttl=LIST_GENERATION_TTL)
+        with self._lock:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Remove every cached value."""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+    def _list_key(self, query: Iterable[Hashable]) -> str:
+        generation = self.backend.get(LIST_GENERATION_KEY)
+        if generation is None:
+            generation = uuid.uuid4().hex
+            self.backend.set(LIST_GENERATION_KEY, generation, ttl=LIST_GENERATION_TTL)
+        return f"apartamentos:list:{generation}:" + ":".join(str(part) for part in query)
+
+    def _count(self, value: Any) -> Any:
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+
+def mark_apartamentos_stale(db: Any, apartamento_ids: Iterable[int] = ()) -> None:
+    """Invalidate these apartamentos (and all cached lists) when db commits."""
+    db.info.setdefault(PENDING_INVALIDATIONS, set()).update(apartamento_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    # Only committed changes are invalidated, so readers never cache rolled-back data
+    pending = session.info.pop(PENDING_INVALIDATIONS, None)
+    if pending is not None:
+        apartamento_cache.invalidate(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+
+apartamento_cache = ApartamentoCache(
+    create_cache_backend(
+        settings.APARTAMENTO_CACHE_BACKEND,
+        max_size=settings.APARTAMENTO_CACHE_MAX_SIZE,
+        ttl=settings.APARTAMENTO_CACHE_TTL_SECONDS,
+        redis_url=settings.REDIS_URL,
+    )
+)
@@ -0,0 +1,67 @@
+import json
+from typing import Any, Optional
+
+
+class RedisCache:
+    """Cache backend on a Redis-compatible server, storing values as JSON.
+
+    Any client exposing get/set(px=)/delete/scan_iter works, so tests can pass
+    an in-memory fake instead of a real connection.
+    """
+
+    def __init__(self, client: Any, ttl: float = 60.0, prefix: str = "direcional:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    @classmethod
+    def from_url(cls, url: str, ttl: float = 60.0, prefix: str = "direcional:") -> "RedisCache":
+        """Connect to a Redis server (requires the optional redis package)."""
+        import redis
+
+        return cls(redis.Redis.from_url(url), ttl=ttl, prefix=prefix)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.ttl > 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value, or default when missing, expired or unreachable."""
+        try:
+            raw = self.client.get(self.prefix + key)
+        except Exception:
+            # A cache outage degrades to database reads instead of failing requests
+            self.errors += 1
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a JSON-serializable value."""
+        if not self.enabled:
+            return
+        try:
+            ttl_ms = int((self.ttl if ttl is None else ttl) * 1000)
+            self.client.set(self.prefix + key, json.dumps(value), px=ttl_ms)
+        except Exception:
+            self.errors += 1
+
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception:
+            self.errors += 1
+
+    def clear(self) -> None:
+        """Remove every value under this cache's prefix."""
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
@@ -1,4 +1,15 @@
-from .config import get_db, settings, engine
+from .config import get_db, get_async_db, settings, engine
 from .models import Base, Cliente, Apartamento, Venda, Reserva, Usuario
 
-__all__ = ["get_db", "settings", "engine", "Base", "Cliente", "Apartamento", "Venda", "Reserva", "Usuario"]
+__all__ = [
+    "get_db",
+    "get_async_db",
+    "settings",
+    "engine",
+    "Base",
+    "Cliente",
+    "Apartamento",
+    "Venda",
+    "Reserva",
+    "Usuario",
+]
@@ -1,7 +1,11 @@
-from typing import Generator
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Generator
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from .pool import TimedAsyncAdaptedQueuePool, TimedQueuePool
 
 
 class Settings(BaseSettings):
@@ -14,11 +18,92 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # Authenticated principal cache (0 disables it). The cache is per process:
+    # other workers may serve a deactivated user until its entry expires.
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_SIZE: int = 10000
+
+    # bcrypt worker pool (login/register requests beyond MAX_PENDING get a 503)
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 256
+
+    # Async database stack (asyncpg / aiosqlite)
+    USE_ASYNC_DB: bool = False
+    ASYNC_DATABASE_URL: str | None = None
+
+    # Connection pool (per engine, per uvicorn worker)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Background expiration of reservas past data_expiracao
+    RESERVA_EXPIRATION_ENABLED: bool = False
+    RESERVA_EXPIRATION_INTERVAL_SECONDS: float = 30.0
+    RESERVA_EXPIRATION_BATCH_SIZE: int = 500
+
+    # Idempotency-Key responses of POST /vendas and /reservas, and the
+    # background cleanup of the expired ones
+    IDEMPOTENCY_KEY_TTL_HOURS: float = 24.0
+    IDEMPOTENCY_CLEANUP_ENABLED: bool = False
+    IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS: float = 300.0
+    IDEMPOTENCY_CLEANUP_BATCH_SIZE: int = 1000
+
+    # Apartamento read-through cache ("memory" per worker, or "redis" shared)
+    APARTAMENTO_CACHE_BACKEND: str = "memory"
+    APARTAMENTO_CACHE_TTL_SECONDS: float = 5.0
+    APARTAMENTO_CACHE_MAX_SIZE: int = 10000
+    REDIS_URL: str | None = None
+
+    # Apartamento status change stream ("memory" per worker, or "postgres" LISTEN/NOTIFY)
+    EVENTS_BACKPLANE: str = "memory"
+    EVENTS_QUEUE_SIZE: int = 100
+    EVENTS_KEEPALIVE_SECONDS: float = 15.0
+
+    # Rows fetched per round trip by the streaming export endpoints
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Rows per upsert (and per commit) of the clientes CSV import
+    CLIENTE_IMPORT_CHUNK_SIZE: int = 1000
+
+    # Per-route request and SQL metrics, served on /metrics
+    METRICS_ENABLED: bool = True
+
+    # Opt-in SQL profiler: logs slow queries with their plan and repeated
+    # statements per request, and adds a Server-Timing header
+    SQL_PROFILER_ENABLED: bool = False
+    SQL_PROFILER_SLOW_QUERY_MS: float = 100.0
+    SQL_PROFILER_REPEAT_THRESHOLD: int = 5
+
 
 settings = Settings()
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def engine_options(database_url: str, use_async: bool = False) -> Dict[str, Any]:
+    """Build the connection pool options for an engine."""
+    if make_url(database_url).get_backend_name() == "sqlite":
+        # SQLite is file/memory based and keeps SQLAlchemy's default pooling
+        return {}
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if use_async else TimedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+engine = create_engine(settings.DATABASE_URL, **engine_options(settings.DATABASE_URL))
+# expire_on_commit=False: objects flushed with INSERT ... RETURNING stay usable
+# after the commit instead of being reloaded with an extra SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -28,3 +113,31 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def to_async_database_url(database_url: str) -> str:
+    """Translate a sync database URL into the equivalent async driver URL."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Get the async engine, created on first use so the driver stays optional."""
+    database_url = settings.ASYNC_DATABASE_URL or to_async_database_url(settings.DATABASE_URL)
+    return create_async_engine(database_url, **engine_options(database_url, use_async=True))
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Get the async session factory."""
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session."""
+    async with get_async_sessionmaker()() as db:
+        yield db
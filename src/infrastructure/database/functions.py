@@ -0,0 +1,28 @@
+from typing import Any, Callable
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import String
+
+
+class year_month(FunctionElement):
+    """Format a datetime as 'YYYY-MM', for grouping by calendar month."""
+
+    type = String()
+    name = "year_month"
+    inherit_cache = True
+
+
+@compiles(year_month)
+def _year_month_sqlite(element, compiler, **kw):
+    return "strftime('%%Y-%%m', %s)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(year_month, "postgresql")
+def _year_month_postgresql(element, compiler, **kw):
+    return "to_char(%s, 'YYYY-MM')" % compiler.process(element.clauses, **kw)
+
+
+def dialect_insert(dialect_name: str) -> Callable[..., Any]:
+    """The insert() construct supporting ON CONFLICT for the given dialect."""
+    return postgresql.insert if dialect_name == "postgresql" else sqlite.insert
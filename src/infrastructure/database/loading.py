@@ -0,0 +1,14 @@
+from typing import Any, Iterable, List
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.interfaces import ORMOption
+from src.application.dtos import Expansao
+
+
+def eager_load_options(model: Any, expand: Iterable[Expansao]) -> List[ORMOption]:
+    """Loader options fetching the expanded relations of model in the same query.
+
+    The expandable relations are many-to-one over NOT NULL foreign keys, so an
+    inner join loads them without multiplying rows, and a page costs one
+    statement however many items it holds.
+    """
+    return [joinedload(getattr(model, relation.value), innerjoin=True) for relation in expand]
@@ -1,8 +1,10 @@
 from .base import Base
 from .cliente import Cliente
 from .apartamento import Apartamento
+from .apartamento_resumo import ApartamentoResumo
 from .venda import Venda
 from .reserva import Reserva
 from .usuario import Usuario
+from .idempotency_key import IdempotencyKey
 
-__all__ = ["Base", "Cliente", "Apartamento", "Venda", "Reserva", "Usuario"]
+__all__ = ["Base", "Cliente", "Apartamento", "ApartamentoResumo", "Venda", "Reserva", "Usuario", "IdempotencyKey"]
@@ -1,5 +1,5 @@
 from typing import List, Optional
-from sqlalchemy import String, Integer, Numeric, Enum as SQLEnum
+from sqlalchemy import String, Integer, Numeric, Enum as SQLEnum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
@@ -18,6 +18,14 @@ class Apartamento(Base):
     """Apartamento model."""
 
     __tablename__ = "apartamentos"
+    __table_args__ = (
+        # Search indexes: equality filters first, then the range/sort column,
+        # so a filtered page sorted by preco or area is read in index order
+        Index("ix_apartamentos_status_quartos_preco", "status", "quartos", "preco"),
+        Index("ix_apartamentos_status_preco", "status", "preco", "id"),
+        Index("ix_apartamentos_status_area", "status", "area", "id"),
+        Index("ix_apartamentos_bloco_andar", "bloco", "andar"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     numero: Mapped[str] = mapped_column(String(10), unique=True, nullable=False)
@@ -27,8 +35,15 @@ class Apartamento(Base):
     area: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
     preco: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False)
     status: Mapped[StatusApartamento] = mapped_column(
-        SQLEnum(StatusApartamento), default=StatusApartamento.DISPONIVEL, nullable=False
+        SQLEnum(StatusApartamento),
+        default=StatusApartamento.DISPONIVEL,
+        nullable=False,
+        index=True,
     )
+    # Optimistic concurrency: every UPDATE is a compare-and-swap on version
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")
+
+    __mapper_args__ = {"version_id_col": version}
 
     # Relationships
     vendas: Mapped[List["Venda"]] = relationship(
@@ -0,0 +1,20 @@
+from sqlalchemy import String, Integer, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .apartamento import StatusApartamento
+
+
+class ApartamentoResumo(Base):
+    """Inventory summary: number of apartamentos per bloco, andar and status.
+
+    Kept in sync incrementally by ApartamentoRepository, in the same
+    transaction as the write that changes the counts.
+    """
+
+    __tablename__ = "apartamentos_resumo"
+
+    bloco: Mapped[str] = mapped_column(String(10), primary_key=True)
+    andar: Mapped[int] = mapped_column(Integer, primary_key=True)
+    status: Mapped[StatusApartamento] = mapped_column(SQLEnum(StatusApartamento), primary_key=True)
+    quantidade: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -1,5 +1,5 @@
 from typing import List
-from sqlalchemy import String
+from sqlalchemy import DDL, Index, String, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -9,6 +9,16 @@ class Cliente(Base):
     """Cliente model."""
 
     __tablename__ = "clientes"
+    __table_args__ = tuple(
+        # Trigram indexes back the substring search (ILIKE '%q%') on PostgreSQL
+        Index(
+            f"ix_clientes_{column}_trgm",
+            column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql")
+        for column in ("nome", "email", "telefone")
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     nome: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -23,3 +33,35 @@ class Cliente(Base):
     reservas: Mapped[List["Reserva"]] = relationship(
         "Reserva", back_populates="cliente", cascade="all, delete-orphan"
     )
+
+
+# SQLite has no pg_trgm: an external-content FTS5 table with the trigram
+# tokenizer indexes the same columns, kept in sync by triggers
+CLIENTES_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS clientes_fts USING fts5("
+    "nome, email, telefone, content='clientes', content_rowid='id', tokenize='trigram')",
+    "CREATE TRIGGER IF NOT EXISTS clientes_fts_insert AFTER INSERT ON clientes BEGIN "
+    "INSERT INTO clientes_fts (rowid, nome, email, telefone) "
+    "VALUES (new.id, new.nome, new.email, new.telefone); END",
+    "CREATE TRIGGER IF NOT EXISTS clientes_fts_delete AFTER DELETE ON clientes BEGIN "
+    "INSERT INTO clientes_fts (clientes_fts, rowid, nome, email, telefone) "
+    "VALUES ('delete', old.id, old.nome, old.email, old.telefone); END",
+    "CREATE TRIGGER IF NOT EXISTS clientes_fts_update AFTER UPDATE ON clientes BEGIN "
+    "INSERT INTO clientes_fts (clientes_fts, rowid, nome, email, telefone) "
+    "VALUES ('delete', old.id, old.nome, old.email, old.telefone); "
+    "INSERT INTO clientes_fts (rowid, nome, email, telefone) "
+    "VALUES (new.id, new.nome, new.email, new.telefone); END",
+]
+
+event.listen(
+    Cliente.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+for statement in CLIENTES_FTS_DDL:
+    event.listen(Cliente.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(
+    Cliente.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS clientes_fts").execute_if(dialect="sqlite"),
+)
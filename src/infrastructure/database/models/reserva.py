@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import ForeignKey, DateTime
+from sqlalchemy import ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -9,17 +9,30 @@ class Reserva(Base):
     """Reserva model."""
 
     __tablename__ = "reservas"
+    __table_args__ = (
+        # Partial index backing get_active_by_apartamento_id
+        Index(
+            "ix_reservas_apartamento_id_ativa",
+            "apartamento_id",
+            postgresql_where=text("ativa = true"),
+            sqlite_where=text("ativa = 1"),
+        ),
+        # Backs the expiration scan for due active reservas
+        Index("ix_reservas_ativa_data_expiracao", "ativa", "data_expiracao"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    cliente_id: Mapped[int] = mapped_column(ForeignKey("clientes.id"), nullable=False)
+    cliente_id: Mapped[int] = mapped_column(
+        ForeignKey("clientes.id"), nullable=False, index=True
+    )
     apartamento_id: Mapped[int] = mapped_column(
-        ForeignKey("apartamentos.id"), nullable=False
+        ForeignKey("apartamentos.id"), nullable=False, index=True
     )
     data_reserva: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, nullable=False
     )
     data_expiracao: Mapped[datetime] = mapped_column(DateTime, nullable=False)
-    ativa: Mapped[bool] = mapped_column(default=True, nullable=False)
+    ativa: Mapped[bool] = mapped_column(default=True, nullable=False, index=True)
 
     # Relationships
     cliente: Mapped["Cliente"] = relationship("Cliente", back_populates="reservas")
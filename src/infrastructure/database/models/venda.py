@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import ForeignKey, Numeric, DateTime
+from sqlalchemy import ForeignKey, Numeric, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -9,11 +9,25 @@ class Venda(Base):
     """Venda model."""
 
     __tablename__ = "vendas"
+    __table_args__ = (
+        # Covering index for the report: totals over a period are computed
+        # from the index alone, without reading the table rows
+        Index(
+            "ix_vendas_data_venda",
+            "data_venda",
+            "valor_venda",
+            "valor_entrada",
+            "apartamento_id",
+            "cliente_id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    cliente_id: Mapped[int] = mapped_column(ForeignKey("clientes.id"), nullable=False)
+    cliente_id: Mapped[int] = mapped_column(
+        ForeignKey("clientes.id"), nullable=False, index=True
+    )
     apartamento_id: Mapped[int] = mapped_column(
-        ForeignKey("apartamentos.id"), nullable=False
+        ForeignKey("apartamentos.id"), nullable=False, index=True
     )
     valor_venda: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False)
     valor_entrada: Mapped[float] = mapped_column(Numeric(15, 2), nullable=False)
@@ -0,0 +1,102 @@
+import time
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    """Counters describing how a connection pool is being used."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Record the time spent waiting for a connection."""
+        self.wait_count += 1
+        self.wait_seconds_total += seconds
+        if seconds > self.wait_seconds_max:
+            self.wait_seconds_max = seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the counters as a dict."""
+        return {
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.wait_count, 6)
+            if self.wait_count
+            else 0.0,
+        }
+
+
+class TimedPoolMixin:
+    """Pool mixin that measures checkout wait time and counts pool events."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        if kwargs.get("_dispatch") is not None:
+            # Recreated pool: listeners are copied over from the original pool
+            return
+        event.listen(self, "checkout", self._on_checkout)
+        event.listen(self, "connect", self._on_connect)
+        event.listen(self, "invalidate", self._on_invalidate)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            self.metrics.record_wait(time.perf_counter() - start)
+
+    def recreate(self):
+        new_pool = super().recreate()
+        new_pool.metrics = self.metrics
+        return new_pool
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.metrics.checkouts += 1
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self.metrics.connects += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self.metrics.invalidations += 1
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    """QueuePool with checkout metrics."""
+
+
+class TimedAsyncAdaptedQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool with checkout metrics."""
+
+
+def pool_status(pool: Pool) -> Dict[str, Any]:
+    """Return the current gauges and counters of a connection pool."""
+    status: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            {
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        )
+    if isinstance(pool, TimedPoolMixin):
+        status.update(pool.metrics.as_dict())
+    return status
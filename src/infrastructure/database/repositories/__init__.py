@@ -1,13 +1,35 @@
 from .cliente_repository import ClienteRepository
+from .apartamento_resumo_repository import ApartamentoResumoRepository
 from .apartamento_repository import ApartamentoRepository
 from .venda_repository import VendaRepository
 from .reserva_repository import ReservaRepository
 from .usuario_repository import UsuarioRepository
+from .cached_apartamento_repository import CachedApartamentoRepository
+from .idempotency_key_repository import IdempotencyKeyRepository
+from .async_cliente_repository import AsyncClienteRepository
+from .async_apartamento_resumo_repository import AsyncApartamentoResumoRepository
+from .async_apartamento_repository import AsyncApartamentoRepository
+from .async_venda_repository import AsyncVendaRepository
+from .async_reserva_repository import AsyncReservaRepository
+from .async_usuario_repository import AsyncUsuarioRepository
+from .async_cached_apartamento_repository import AsyncCachedApartamentoRepository
+from .async_idempotency_key_repository import AsyncIdempotencyKeyRepository
 
 __all__ = [
     "ClienteRepository",
     "ApartamentoRepository",
+    "ApartamentoResumoRepository",
     "VendaRepository",
     "ReservaRepository",
     "UsuarioRepository",
+    "CachedApartamentoRepository",
+    "IdempotencyKeyRepository",
+    "AsyncClienteRepository",
+    "AsyncApartamentoRepository",
+    "AsyncApartamentoResumoRepository",
+    "AsyncVendaRepository",
+    "AsyncReservaRepository",
+    "AsyncUsuarioRepository",
+    "AsyncCachedApartamentoRepository",
+    "AsyncIdempotencyKeyRepository",
 ]
@@ -1,39 +1,144 @@
-from typing import Optional, List
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, List, Set
+from sqlalchemy import Select, insert, select, tuple_, update
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+from src.domain.exceptions import ConcurrentUpdateError
+from src.infrastructure.cache import mark_apartamentos_stale
+from src.infrastructure.events import record_status_change
 from src.infrastructure.database.models import Apartamento
 from src.infrastructure.database.models.apartamento import StatusApartamento
-from src.application.dtos import ApartamentoCreate, ApartamentoUpdate
+from src.application.dtos import ApartamentoCreate, ApartamentoFiltro, ApartamentoUpdate
+from .apartamento_resumo_repository import ApartamentoResumoRepository, inventory_deltas, inventory_key
+from .base import UnitOfWorkRepository
 
+# Columns the apartamentos listing can be sorted by, besides id
+SORT_COLUMNS = {"preco": Apartamento.preco, "area": Apartamento.area}
 
-class ApartamentoRepository:
+
+def build_search_query(
+    filtro: ApartamentoFiltro, after_id: Optional[int] = None, after_value: Optional[float] = None
+) -> Select:
+    """Translate an apartamentos search into one SELECT, ordered by the sort column and then id.
+
+    Later pages continue after (after_value, after_id) instead of using an
+    OFFSET, so they stay as cheap as the first one.
+    """
+    conditions = []
+    if filtro.status is not None:
+        conditions.append(Apartamento.status == filtro.status)
+    if filtro.bloco is not None:
+        conditions.append(Apartamento.bloco == filtro.bloco)
+    if filtro.quartos:
+        conditions.append(Apartamento.quartos.in_(filtro.quartos))
+    for column, low, high in (
+        (Apartamento.preco, filtro.min_preco, filtro.max_preco),
+        (Apartamento.area, filtro.min_area, filtro.max_area),
+        (Apartamento.andar, filtro.min_andar, filtro.max_andar),
+    ):
+        if low is not None:
+            conditions.append(column >= low)
+        if high is not None:
+            conditions.append(column <= high)
+
+    field = filtro.sort.field
+    keys = [Apartamento.id] if field is None else [SORT_COLUMNS[field], Apartamento.id]
+    if after_id is not None:
+        if field is None:
+            position, last = Apartamento.id, after_id
+        else:
+            position, last = tuple_(*keys), tuple_(Decimal(str(after_value)), after_id)
+        conditions.append(position < last if filtro.sort.descending else position > last)
+
+    order_by = [key.desc() for key in keys] if filtro.sort.descending else keys
+    return select(Apartamento).where(*conditions).order_by(*order_by)
+
+
+class ApartamentoRepository(UnitOfWorkRepository):
     """Apartamento repository."""
 
-    def __init__(self, db: Session):
-        self.db = db
+    def __init__(self, db: Session, auto_commit: bool = True):
+        super().__init__(db, auto_commit)
+        # Inventory counts are kept in the same transaction as every write
+        self.resumo_repo = ApartamentoResumoRepository(db)
+
+    def _commit(self, instance: Optional[Apartamento] = None) -> None:
+        """Commit or flush, reporting a failed version check as a ConcurrentUpdateError."""
+        try:
+            super()._commit(instance)
+        except StaleDataError:
+            # Another transaction changed the apartamento first
+            if self.auto_commit:
+                self.db.rollback()
+            raise ConcurrentUpdateError("Apartamento was modified by another request")
 
     def create(self, apartamento_data: ApartamentoCreate) -> Apartamento:
         """Create a new apartamento."""
         apartamento = Apartamento(**apartamento_data.model_dump())
         self.db.add(apartamento)
-        self.db.commit()
-        self.db.refresh(apartamento)
+        self.resumo_repo.apply(
+            inventory_deltas(added=[(apartamento.bloco, apartamento.andar, StatusApartamento.DISPONIVEL)])
+        )
+        mark_apartamentos_stale(self.db)
+        self._commit(apartamento)
         return apartamento
 
     def get_by_id(self, apartamento_id: int) -> Optional[Apartamento]:
         """Get an apartamento by ID."""
-        return self.db.query(Apartamento).filter(Apartamento.id == apartamento_id).first()
+        return self.db.get(Apartamento, apartamento_id)
 
     def get_by_numero(self, numero: str) -> Optional[Apartamento]:
         """Get an apartamento by numero."""
         return self.db.query(Apartamento).filter(Apartamento.numero == numero).first()
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Apartamento]:
-        """Get all apartamentos."""
-        return self.db.query(Apartamento).offset(skip).limit(limit).all()
+    def get_existing_numeros(self, numeros: Iterable[str]) -> Set[str]:
+        """Return which of the given numeros are already taken, in a single query."""
+        numeros = list(numeros)
+        if not numeros:
+            return set()
+        return set(self.db.scalars(select(Apartamento.numero).where(Apartamento.numero.in_(numeros))))
+
+    def create_many(self, items: List[ApartamentoCreate]) -> Dict[str, int]:
+        """Insert a batch of apartamentos with one executemany, returning their IDs by numero."""
+        # ORM bulk INSERT: batched multi-row INSERT ... RETURNING (insertmanyvalues).
+        # IDs are matched by numero because RETURNING order is not guaranteed on every backend.
+        stmt = insert(Apartamento).returning(Apartamento.numero, Apartamento.id)
+        result = self.db.execute(stmt, [item.model_dump() for item in items])
+        ids = dict(result.tuples().all())
+        self.resumo_repo.apply(
+            inventory_deltas(added=[(item.bloco, item.andar, StatusApartamento.DISPONIVEL) for item in items])
+        )
+        mark_apartamentos_stale(self.db)
+        self._commit()
+        return ids
+
+    def get_all(self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[Apartamento]:
+        """Get all apartamentos, ordered by ID (keyset pagination when after_id is given)."""
+        query = self.db.query(Apartamento)
+        if after_id is not None:
+            query = query.filter(Apartamento.id > after_id)
+        return query.order_by(Apartamento.id).offset(skip).limit(limit).all()
 
-    def get_by_status(self, status: StatusApartamento, skip: int = 0, limit: int = 100) -> List[Apartamento]:
-        """Get apartamentos by status."""
-        return self.db.query(Apartamento).filter(Apartamento.status == status).offset(skip).limit(limit).all()
+    def get_by_status(
+        self, status: StatusApartamento, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Apartamento]:
+        """Get apartamentos by status, ordered by ID."""
+        query = self.db.query(Apartamento).filter(Apartamento.status == status)
+        if after_id is not None:
+            query = query.filter(Apartamento.id > after_id)
+        return query.order_by(Apartamento.id).offset(skip).limit(limit).all()
+
+    def search(
+        self,
+        filtro: ApartamentoFiltro,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        after_value: Optional[float] = None,
+    ) -> List[Apartamento]:
+        """Search apartamentos with filtro, in its sort order (keyset pagination when after_id is given)."""
+        query = build_search_query(filtro, after_id, after_value)
+        return list(self.db.scalars(query.offset(skip).limit(limit)))
 
     def update(self, apartamento_id: int, apartamento_data: ApartamentoUpdate) -> Optional[Apartamento]:
         """Update an apartamento."""
@@ -41,12 +146,19 @@ class ApartamentoRepository:
         if not apartamento:
             return None
 
+        previous_status = apartamento.status
+        previous_key = inventory_key(apartamento)
         update_data = apartamento_data.model_dump(exclude_unset=True)
         for key, value in update_data.items():
             setattr(apartamento, key, value)
 
-        self.db.commit()
-        self.db.refresh(apartamento)
+        self.resumo_repo.apply(inventory_deltas([previous_key], [inventory_key(apartamento)]))
+        mark_apartamentos_stale(self.db, [apartamento_id])
+        if apartamento.status != previous_status:
+            record_status_change(
+                self.db, apartamento.id, apartamento.numero, apartamento.bloco, apartamento.status
+            )
+        self._commit(apartamento)
         return apartamento
 
     def delete(self, apartamento_id: int) -> bool:
@@ -56,16 +168,53 @@ class ApartamentoRepository:
             return False
 
         self.db.delete(apartamento)
-        self.db.commit()
+        self.resumo_repo.apply(inventory_deltas(removed=[inventory_key(apartamento)]))
+        mark_apartamentos_stale(self.db, [apartamento_id])
+        self._commit()
         return True
 
+    def release_reserved(self, apartamento_ids: List[int]) -> int:
+        """Flip reservado apartamentos back to disponivel in one UPDATE."""
+        if not apartamento_ids:
+            return 0
+        # Bumping version makes in-flight optimistic updates of these units fail
+        stmt = (
+            update(Apartamento)
+            .where(
+                Apartamento.id.in_(apartamento_ids),
+                Apartamento.status == StatusApartamento.RESERVADO,
+            )
+            .values(status=StatusApartamento.DISPONIVEL, version=Apartamento.version + 1)
+            .returning(Apartamento.id, Apartamento.numero, Apartamento.bloco, Apartamento.andar)
+            .execution_options(synchronize_session=False)
+        )
+        released = self.db.execute(stmt).all()
+        self.resumo_repo.apply(
+            inventory_deltas(
+                [(bloco, andar, StatusApartamento.RESERVADO) for _, _, bloco, andar in released],
+                [(bloco, andar, StatusApartamento.DISPONIVEL) for _, _, bloco, andar in released],
+            )
+        )
+        mark_apartamentos_stale(self.db, apartamento_ids)
+        for released_id, numero, bloco, _ in released:
+            record_status_change(self.db, released_id, numero, bloco, StatusApartamento.DISPONIVEL)
+        self._commit()
+        return len(released)
+
     def update_status(self, apartamento_id: int, status: StatusApartamento) -> Optional[Apartamento]:
         """Update apartamento status."""
         apartamento = self.get_by_id(apartamento_id)
         if not apartamento:
             return None
 
+        if apartamento.status != status:
+            record_status_change(self.db, apartamento.id, apartamento.numero, apartamento.bloco, status)
+            self.resumo_repo.apply(
+                inventory_deltas(
+                    [inventory_key(apartamento)], [(apartamento.bloco, apartamento.andar, status)]
+                )
+            )
         apartamento.status = status
-        self.db.commit()
-        self.db.refresh(apartamento)
+        mark_apartamentos_stale(self.db, [apartamento_id])
+        self._commit(apartamento)
         return apartamento
@@ -0,0 +1,93 @@
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import Insert, delete, func, insert, select
+from sqlalchemy.orm import Session
+from src.infrastructure.database.functions import dialect_insert
+from src.infrastructure.database.models import Apartamento, ApartamentoResumo
+from src.infrastructure.database.models.apartamento import StatusApartamento
+
+# (bloco, andar, status) -> change in the number of apartamentos
+InventoryKey = Tuple[str, int, StatusApartamento]
+
+
+def inventory_key(apartamento: object) -> InventoryKey:
+    """Summary row an apartamento (or anything with bloco/andar/status) is counted in."""
+    return (apartamento.bloco, apartamento.andar, apartamento.status)
+
+
+def inventory_deltas(
+    removed: Iterable[InventoryKey] = (), added: Iterable[InventoryKey] = ()
+) -> "Counter[InventoryKey]":
+    """Net count changes for units leaving and entering summary rows."""
+    deltas: "Counter[InventoryKey]" = Counter()
+    for key in removed:
+        deltas[key] -= 1
+    for key in added:
+        deltas[key] += 1
+    return deltas
+
+
+def build_upsert(dialect_name: str, deltas: "Counter[InventoryKey]") -> Optional[Insert]:
+    """Build one INSERT ... ON CONFLICT DO UPDATE adding the deltas to the summary rows."""
+    # Sorted so concurrent transactions lock the summary rows in the same order
+    rows = [
+        {"bloco": bloco, "andar": andar, "status": status, "quantidade": quantidade}
+        for (bloco, andar, status), quantidade in sorted(deltas.items())
+        if quantidade
+    ]
+    if not rows:
+        return None
+    stmt = dialect_insert(dialect_name)(ApartamentoResumo).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[ApartamentoResumo.bloco, ApartamentoResumo.andar, ApartamentoResumo.status],
+        set_={
+            "quantidade": ApartamentoResumo.quantidade + stmt.excluded.quantidade,
+            "updated_at": datetime.utcnow(),
+        },
+    )
+
+
+def build_resumo_query(bloco: Optional[str] = None):
+    """Select the non-empty summary rows, ordered by bloco and andar."""
+    query = select(ApartamentoResumo).where(ApartamentoResumo.quantidade > 0)
+    if bloco is not None:
+        query = query.where(ApartamentoResumo.bloco == bloco)
+    return query.order_by(ApartamentoResumo.bloco, ApartamentoResumo.andar, ApartamentoResumo.status)
+
+
+def build_rebuild_statements():
+    """Statements recomputing the whole summary from the apartamentos table."""
+    recount = select(
+        Apartamento.bloco, Apartamento.andar, Apartamento.status, func.count()
+    ).group_by(Apartamento.bloco, Apartamento.andar, Apartamento.status)
+    return (
+        delete(ApartamentoResumo),
+        insert(ApartamentoResumo).from_select(["bloco", "andar", "status", "quantidade"], recount),
+    )
+
+
+class ApartamentoResumoRepository:
+    """Inventory summary repository.
+
+    It never commits: deltas are written in the caller's transaction, so the
+    summary changes atomically with the apartamentos.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, deltas: "Counter[InventoryKey]") -> None:
+        """Add the count changes to the summary rows."""
+        stmt = build_upsert(self.db.get_bind().dialect.name, deltas)
+        if stmt is not None:
+            self.db.execute(stmt)
+
+    def get_all(self, bloco: Optional[str] = None) -> List[ApartamentoResumo]:
+        """Get the non-empty summary rows, optionally for one bloco."""
+        return list(self.db.scalars(build_resumo_query(bloco)))
+
+    def rebuild(self) -> None:
+        """Recompute the summary from scratch, e.g. after writes that bypassed the repositories."""
+        for stmt in build_rebuild_statements():
+            self.db.execute(stmt)
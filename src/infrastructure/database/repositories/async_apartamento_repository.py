@@ -0,0 +1,188 @@
+from typing import Dict, Iterable, Optional, List, Set
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+from src.domain.exceptions import ConcurrentUpdateError
+from src.infrastructure.cache import mark_apartamentos_stale
+from src.infrastructure.events import record_status_change
+from src.infrastructure.database.models import Apartamento
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.application.dtos import ApartamentoCreate, ApartamentoFiltro, ApartamentoUpdate
+from .base import AsyncUnitOfWorkRepository
+from .apartamento_repository import build_search_query
+from .apartamento_resumo_repository import inventory_deltas, inventory_key
+from .async_apartamento_resumo_repository import AsyncApartamentoResumoRepository
+
+
+class AsyncApartamentoRepository(AsyncUnitOfWorkRepository):
+    """Async Apartamento repository."""
+
+    def __init__(self, db: AsyncSession, auto_commit: bool = True):
+        super().__init__(db, auto_commit)
+        # Inventory counts are kept in the same transaction as every write
+        self.resumo_repo = AsyncApartamentoResumoRepository(db)
+
+    async def _commit(self, instance: Optional[Apartamento] = None) -> None:
+        """Commit or flush, reporting a failed version check as a ConcurrentUpdateError."""
+        try:
+            await super()._commit(instance)
+        except StaleDataError:
+            # Another transaction changed the apartamento first
+            if self.auto_commit:
+                await self.db.rollback()
+            raise ConcurrentUpdateError("Apartamento was modified by another request")
+
+    async def create(self, apartamento_data: ApartamentoCreate) -> Apartamento:
+        """Create a new apartamento."""
+        apartamento = Apartamento(**apartamento_data.model_dump())
+        self.db.add(apartamento)
+        await self.resumo_repo.apply(
+            inventory_deltas(added=[(apartamento.bloco, apartamento.andar, StatusApartamento.DISPONIVEL)])
+        )
+        mark_apartamentos_stale(self.db)
+        await self._commit(apartamento)
+        return apartamento
+
+    async def get_by_id(self, apartamento_id: int) -> Optional[Apartamento]:
+        """Get an apartamento by ID."""
+        return await self.db.get(Apartamento, apartamento_id)
+
+    async def get_by_numero(self, numero: str) -> Optional[Apartamento]:
+        """Get an apartamento by numero."""
+        return await self.db.scalar(select(Apartamento).where(Apartamento.numero == numero))
+
+    async def get_existing_numeros(self, numeros: Iterable[str]) -> Set[str]:
+        """Return which of the given numeros are already taken, in a single query."""
+        numeros = list(numeros)
+        if not numeros:
+            return set()
+        return set(await self.db.scalars(select(Apartamento.numero).where(Apartamento.numero.in_(numeros))))
+
+    async def create_many(self, items: List[ApartamentoCreate]) -> Dict[str, int]:
+        """Insert a batch of apartamentos with one executemany, returning their IDs by numero."""
+        # ORM bulk INSERT: batched multi-row INSERT ... RETURNING (insertmanyvalues).
+        # IDs are matched by numero because RETURNING order is not guaranteed on every backend.
+        stmt = insert(Apartamento).returning(Apartamento.numero, Apartamento.id)
+        result = await self.db.execute(stmt, [item.model_dump() for item in items])
+        ids = dict(result.tuples().all())
+        await self.resumo_repo.apply(
+            inventory_deltas(added=[(item.bloco, item.andar, StatusApartamento.DISPONIVEL) for item in items])
+        )
+        mark_apartamentos_stale(self.db)
+        await self._commit()
+        return ids
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Apartamento]:
+        """Get all apartamentos, ordered by ID (keyset pagination when after_id is given)."""
+        query = select(Apartamento)
+        if after_id is not None:
+            query = query.where(Apartamento.id > after_id)
+        result = await self.db.scalars(query.order_by(Apartamento.id).offset(skip).limit(limit))
+        return list(result)
+
+    async def get_by_status(
+        self, status: StatusApartamento, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Apartamento]:
+        """Get apartamentos by status, ordered by ID."""
+        query = select(Apartamento).where(Apartamento.status == status)
+        if after_id is not None:
+            query = query.where(Apartamento.id > after_id)
+        result = await self.db.scalars(query.order_by(Apartamento.id).offset(skip).limit(limit))
+        return list(result)
+
+    async def search(
+        self,
+        filtro: ApartamentoFiltro,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        after_value: Optional[float] = None,
+    ) -> List[Apartamento]:
+        """Search apartamentos with filtro, in its sort order (keyset pagination when after_id is given)."""
+        query = build_search_query(filtro, after_id, after_value)
+        return list(await self.db.scalars(query.offset(skip).limit(limit)))
+
+    async def update(
+        self, apartamento_id: int, apartamento_data: ApartamentoUpdate
+    ) -> Optional[Apartamento]:
+        """Update an apartamento."""
+        apartamento = await self.get_by_id(apartamento_id)
+        if not apartamento:
+            return None
+
+        previous_status = apartamento.status
+        previous_key = inventory_key(apartamento)
+        update_data = apartamento_data.model_dump(exclude_unset=True)
+        for key, value in update_data.items():
+            setattr(apartamento, key, value)
+
+        await self.resumo_repo.apply(inventory_deltas([previous_key], [inventory_key(apartamento)]))
+        mark_apartamentos_stale(self.db, [apartamento_id])
+        if apartamento.status != previous_status:
+            record_status_change(
+                self.db, apartamento.id, apartamento.numero, apartamento.bloco, apartamento.status
+            )
+        await self._commit(apartamento)
+        return apartamento
+
+    async def delete(self, apartamento_id: int) -> bool:
+        """Delete an apartamento."""
+        apartamento = await self.get_by_id(apartamento_id)
+        if not apartamento:
+            return False
+
+        await self.db.delete(apartamento)
+        await self.resumo_repo.apply(inventory_deltas(removed=[inventory_key(apartamento)]))
+        mark_apartamentos_stale(self.db, [apartamento_id])
+        await self._commit()
+        return True
+
+    async def release_reserved(self, apartamento_ids: List[int]) -> int:
+        """Flip reservado apartamentos back to disponivel in one UPDATE."""
+        if not apartamento_ids:
+            return 0
+        # Bumping version makes in-flight optimistic updates of these units fail
+        stmt = (
+            update(Apartamento)
+            .where(
+                Apartamento.id.in_(apartamento_ids),
+                Apartamento.status == StatusApartamento.RESERVADO,
+            )
+            .values(status=StatusApartamento.DISPONIVEL, version=Apartamento.version + 1)
+            .returning(Apartamento.id, Apartamento.numero, Apartamento.bloco, Apartamento.andar)
+            .execution_options(synchronize_session=False)
+        )
+        released = (await self.db.execute(stmt)).all()
+        await self.resumo_repo.apply(
+            inventory_deltas(
+                [(bloco, andar, StatusApartamento.RESERVADO) for _, _, bloco, andar in released],
+                [(bloco, andar, StatusApartamento.DISPONIVEL) for _, _, bloco, andar in released],
+            )
+        )
+        mark_apartamentos_stale(self.db, apartamento_ids)
+        for released_id, numero, bloco, _ in released:
+            record_status_change(self.db, released_id, numero, bloco, StatusApartamento.DISPONIVEL)
+        await self._commit()
+        return len(released)
+
+    async def update_status(
+        self, apartamento_id: int, status: StatusApartamento
+    ) -> Optional[Apartamento]:
+        """Update apartamento status."""
+        apartamento = await self.get_by_id(apartamento_id)
+        if not apartamento:
+            return None
+
+        if apartamento.status != status:
+            record_status_change(self.db, apartamento.id, apartamento.numero, apartamento.bloco, status)
+            await self.resumo_repo.apply(
+                inventory_deltas(
+                    [inventory_key(apartamento)], [(apartamento.bloco, apartamento.andar, status)]
+                )
+            )
+        apartamento.status = status
+        mark_apartamentos_stale(self.db, [apartamento_id])
+        await self._commit(apartamento)
+        return apartamento
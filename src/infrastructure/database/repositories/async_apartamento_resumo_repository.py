@@ -0,0 +1,32 @@
+from collections import Counter
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.models import ApartamentoResumo
+from .apartamento_resumo_repository import (
+    InventoryKey,
+    build_rebuild_statements,
+    build_resumo_query,
+    build_upsert,
+)
+
+
+class AsyncApartamentoResumoRepository:
+    """Async inventory summary repository; like the sync one, it never commits."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(self, deltas: "Counter[InventoryKey]") -> None:
+        """Add the count changes to the summary rows."""
+        stmt = build_upsert(self.db.get_bind().dialect.name, deltas)
+        if stmt is not None:
+            await self.db.execute(stmt)
+
+    async def get_all(self, bloco: Optional[str] = None) -> List[ApartamentoResumo]:
+        """Get the non-empty summary rows, optionally for one bloco."""
+        return list(await self.db.scalars(build_resumo_query(bloco)))
+
+    async def rebuild(self) -> None:
+        """Recompute the summary from scratch, e.g. after writes that bypassed the repositories."""
+        for stmt in build_rebuild_statements():
+            await self.db.execute(stmt)
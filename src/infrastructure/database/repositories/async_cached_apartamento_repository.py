@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from src.infrastructure.cache import ApartamentoCache, apartamento_cache
+from src.infrastructure.database.models import Apartamento
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.application.dtos import ApartamentoFiltro, ApartamentoResponse
+from .async_apartamento_repository import AsyncApartamentoRepository
+from .cached_apartamento_repository import search_key, to_snapshot, to_stamp
+
+
+class AsyncCachedApartamentoRepository:
+    """Async read-through cache in front of AsyncApartamentoRepository's hot reads."""
+
+    def __init__(
+        self, repository: AsyncApartamentoRepository, cache: ApartamentoCache = apartamento_cache
+    ):
+        self.repository = repository
+        self.cache = cache
+
+    async def get_by_id(self, apartamento_id: int) -> Optional[ApartamentoResponse]:
+        """Get an apartamento by ID."""
+        snapshot = await self._get_snapshot(apartamento_id)
+        return None if snapshot is None else ApartamentoResponse.model_validate(snapshot)
+
+    async def get_updated_at(self, apartamento_id: int) -> Optional[datetime]:
+        """Get when an apartamento last changed."""
+        snapshot = await self._get_snapshot(apartamento_id)
+        return None if snapshot is None else to_stamp(snapshot)[1]
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[ApartamentoResponse]:
+        """Get all apartamentos, ordered by ID."""
+        return await self._get_list(
+            ("all", skip, limit, after_id), lambda: self.repository.get_all(skip, limit, after_id)
+        )
+
+    async def get_by_status(
+        self, status: StatusApartamento, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[ApartamentoResponse]:
+        """Get apartamentos by status, ordered by ID."""
+        return await self._get_list(
+            ("status", status.value, skip, limit, after_id),
+            lambda: self.repository.get_by_status(status, skip, limit, after_id),
+        )
+
+    async def search(
+        self,
+        filtro: ApartamentoFiltro,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        after_value: Optional[float] = None,
+    ) -> List[ApartamentoResponse]:
+        """Search apartamentos with filtro, in its sort order."""
+        return await self._get_list(
+            search_key(filtro, skip, limit, after_id, after_value),
+            lambda: self.repository.search(filtro, skip, limit, after_id, after_value),
+        )
+
+    async def search_updated_at(
+        self,
+        filtro: ApartamentoFiltro,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        after_value: Optional[float] = None,
+    ) -> List[Tuple[int, datetime]]:
+        """The (id, updated_at) of every apartamento search returns, from the same cache entry."""
+        snapshots = await self._get_snapshots(
+            search_key(filtro, skip, limit, after_id, after_value),
+            lambda: self.repository.search(filtro, skip, limit, after_id, after_value),
+        )
+        return [to_stamp(snapshot) for snapshot in snapshots]
+
+    async def _get_snapshot(self, apartamento_id: int) -> Optional[Dict[str, Any]]:
+        snapshot = self.cache.get(apartamento_id)
+        if snapshot is None:
+            apartamento = await self.repository.get_by_id(apartamento_id)
+            if apartamento is None:
+                return None
+            snapshot = to_snapshot(apartamento)
+            self.cache.set(apartamento_id, snapshot)
+        return snapshot
+
+    async def _get_snapshots(
+        self, query: Tuple, load: Callable[[], Awaitable[List[Apartamento]]]
+    ) -> List[Dict[str, Any]]:
+        snapshots = self.cache.get_list(query)
+        if snapshots is None:
+            snapshots = [to_snapshot(apartamento) for apartamento in await load()]
+            self.cache.set_list(query, snapshots)
+        return snapshots
+
+    async def _get_list(
+        self, query: Tuple, load: Callable[[], Awaitable[List[Apartamento]]]
+    ) -> List[ApartamentoResponse]:
+        snapshots = await self._get_snapshots(query, load)
+        return [ApartamentoResponse.model_validate(snapshot) for snapshot in snapshots]
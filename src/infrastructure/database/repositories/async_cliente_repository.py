@@ -0,0 +1,129 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional, List, Set, AsyncIterator, Sequence, Tuple
+from sqlalchemy import Row, insert, select
+from src.infrastructure.database.functions import dialect_insert
+from src.infrastructure.database.streaming import export_query, astream_partitions
+from src.infrastructure.database.models import Cliente
+from src.application.dtos import ClienteCreate, ClienteUpdate
+from .base import AsyncUnitOfWorkRepository
+from .cliente_repository import (
+    build_cpf_prefix_query,
+    build_text_search_query,
+    cpf_prefix,
+    is_cpf_shaped,
+    merge_matches,
+)
+
+
+class AsyncClienteRepository(AsyncUnitOfWorkRepository):
+    """Async Cliente repository."""
+
+    async def create(self, cliente_data: ClienteCreate) -> Cliente:
+        """Create a new cliente."""
+        cliente = Cliente(**cliente_data.model_dump())
+        self.db.add(cliente)
+        await self._commit(cliente)
+        return cliente
+
+    async def get_by_id(self, cliente_id: int) -> Optional[Cliente]:
+        """Get a cliente by ID."""
+        return await self.db.get(Cliente, cliente_id)
+
+    async def get_by_cpf(self, cpf: str) -> Optional[Cliente]:
+        """Get a cliente by CPF."""
+        return await self.db.scalar(select(Cliente).where(Cliente.cpf == cpf))
+
+    async def search(self, q: str, limit: int = 20) -> List[Cliente]:
+        """Search clientes by CPF prefix and by part of nome, email or telefone."""
+        prefix = cpf_prefix(q)
+        by_cpf: List[Cliente] = []
+        if prefix is not None:
+            # A range scan of the CPF index
+            by_cpf = list(await self.db.scalars(build_cpf_prefix_query(prefix, limit)))
+            if by_cpf and is_cpf_shaped(q, prefix):
+                return by_cpf
+        query = build_text_search_query(self.db.get_bind().dialect.name, q, limit)
+        return merge_matches(by_cpf, list(await self.db.scalars(query)), limit)
+
+    async def get_existing_cpfs(self, cpfs: Iterable[str]) -> Set[str]:
+        """Return which of the given cpfs are already taken, in a single query."""
+        cpfs = list(cpfs)
+        if not cpfs:
+            return set()
+        return set(await self.db.scalars(select(Cliente.cpf).where(Cliente.cpf.in_(cpfs))))
+
+    async def create_many(self, items: List[ClienteCreate]) -> Dict[str, int]:
+        """Insert a batch of clientes with one executemany, returning their IDs by cpf."""
+        # ORM bulk INSERT: batched multi-row INSERT ... RETURNING (insertmanyvalues).
+        # IDs are matched by cpf because RETURNING order is not guaranteed on every backend.
+        stmt = insert(Cliente).returning(Cliente.cpf, Cliente.id)
+        result = await self.db.execute(stmt, [item.model_dump() for item in items])
+        ids = dict(result.tuples().all())
+        await self._commit()
+        return ids
+
+    async def upsert_many(self, items: List[ClienteCreate]) -> None:
+        """Insert a batch of clientes, updating nome, email and telefone of CPFs already taken."""
+        stmt = dialect_insert(self.db.get_bind().dialect.name)(Cliente)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Cliente.cpf],
+            set_={
+                "nome": stmt.excluded.nome,
+                "email": stmt.excluded.email,
+                "telefone": stmt.excluded.telefone,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.db.execute(stmt, [item.model_dump() for item in items])
+        await self._commit()
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Cliente]:
+        """Get all clientes, ordered by ID (keyset pagination when after_id is given)."""
+        query = select(Cliente)
+        if after_id is not None:
+            query = query.where(Cliente.id > after_id)
+        result = await self.db.scalars(query.order_by(Cliente.id).offset(skip).limit(limit))
+        return list(result)
+
+    async def get_updated_at(self, cliente_id: int) -> Optional[datetime]:
+        """Get when a cliente last changed, reading only that column."""
+        return await self.db.scalar(select(Cliente.updated_at).where(Cliente.id == cliente_id))
+
+    async def get_all_updated_at(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Tuple[int, datetime]]:
+        """Get the (id, updated_at) of the clientes get_all returns, without loading them."""
+        query = select(Cliente.id, Cliente.updated_at)
+        if after_id is not None:
+            query = query.where(Cliente.id > after_id)
+        result = await self.db.execute(query.order_by(Cliente.id).offset(skip).limit(limit))
+        return list(result.tuples())
+
+    def stream_all(self, columns: Sequence[str], batch_size: int = 1000) -> AsyncIterator[List[Row]]:
+        """Stream the given columns of every cliente, batch_size rows at a time, in ID order."""
+        return astream_partitions(self.db, export_query(Cliente, columns), batch_size)
+
+    async def update(self, cliente_id: int, cliente_data: ClienteUpdate) -> Optional[Cliente]:
+        """Update a cliente."""
+        cliente = await self.get_by_id(cliente_id)
+        if not cliente:
+            return None
+
+        update_data = cliente_data.model_dump(exclude_unset=True)
+        for key, value in update_data.items():
+            setattr(cliente, key, value)
+
+        await self._commit(cliente)
+        return cliente
+
+    async def delete(self, cliente_id: int) -> bool:
+        """Delete a cliente."""
+        cliente = await self.get_by_id(cliente_id)
+        if not cliente:
+            return False
+
+        await self.db.delete(cliente)
+        await self._commit()
+        return True
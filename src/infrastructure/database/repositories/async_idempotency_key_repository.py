@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Any, Optional, Type
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from src.infrastructure.database.models import IdempotencyKey
+from src.application.dtos import IdempotentRequest
+from .base import AsyncUnitOfWorkRepository
+
+
+class AsyncIdempotencyKeyRepository(AsyncUnitOfWorkRepository):
+    """Async Idempotency key repository."""
+
+    async def get(self, usuario_id: int, endpoint: str, key: str) -> Optional[IdempotencyKey]:
+        """Get the stored response of a key, expired or not."""
+        query = select(IdempotencyKey).where(
+            IdempotencyKey.usuario_id == usuario_id,
+            IdempotencyKey.endpoint == endpoint,
+            IdempotencyKey.key == key,
+        )
+        return (await self.db.scalars(query)).first()
+
+    async def store_response(
+        self, request: Optional[IdempotentRequest], schema: Type[BaseModel], instance: Any
+    ) -> Optional[IdempotencyKey]:
+        """Store instance, serialized with schema, as the first response to request (if keyed)."""
+        if request is None:
+            return None
+        response_body = schema.model_validate(instance).model_dump_json()
+        idempotency_key = IdempotencyKey(**request.model_dump(), response_body=response_body)
+        self.db.add(idempotency_key)
+        await self._commit()
+        return idempotency_key
+
+    async def delete(self, idempotency_key: IdempotencyKey) -> None:
+        """Delete a stored response."""
+        await self.db.delete(idempotency_key)
+        await self._commit()
+
+    async def delete_expired(self, now: datetime, limit: int) -> int:
+        """Delete up to limit keys expired at now, returning how many were deleted."""
+        expired = select(IdempotencyKey.id).where(IdempotencyKey.expires_at <= now).limit(limit)
+        stmt = (
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        deleted = (await self.db.execute(stmt)).rowcount
+        await self._commit()
+        return deleted
@@ -0,0 +1,106 @@
+from datetime import datetime
+from typing import Collection, Optional, List, Tuple, AsyncIterator, Sequence
+from sqlalchemy import Row, select, update
+from src.infrastructure.database.loading import eager_load_options
+from src.infrastructure.database.streaming import export_query, astream_partitions
+from src.infrastructure.database.models import Reserva
+from src.application.dtos import Expansao, ReservaCreate
+from .base import AsyncUnitOfWorkRepository
+
+
+class AsyncReservaRepository(AsyncUnitOfWorkRepository):
+    """Async Reserva repository."""
+
+    async def create(self, reserva_data: ReservaCreate) -> Reserva:
+        """Create a new reserva."""
+        reserva = Reserva(**reserva_data.model_dump())
+        self.db.add(reserva)
+        await self._commit(reserva)
+        return reserva
+
+    async def get_by_id(self, reserva_id: int, expand: Collection[Expansao] = ()) -> Optional[Reserva]:
+        """Get a reserva by ID, loading the expanded relations in the same query."""
+        if not expand:
+            return await self.db.get(Reserva, reserva_id)
+        query = select(Reserva).where(Reserva.id == reserva_id).options(*eager_load_options(Reserva, expand))
+        return (await self.db.scalars(query)).first()
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        expand: Collection[Expansao] = (),
+    ) -> List[Reserva]:
+        """Get all reservas, ordered by ID (keyset pagination when after_id is given).
+
+        The expanded relations are loaded in the same query.
+        """
+        query = select(Reserva).options(*eager_load_options(Reserva, expand))
+        if after_id is not None:
+            query = query.where(Reserva.id > after_id)
+        result = await self.db.scalars(query.order_by(Reserva.id).offset(skip).limit(limit))
+        return list(result)
+
+    def stream_all(self, columns: Sequence[str], batch_size: int = 1000) -> AsyncIterator[List[Row]]:
+        """Stream the given columns of every reserva, batch_size rows at a time, in ID order."""
+        return astream_partitions(self.db, export_query(Reserva, columns), batch_size)
+
+    async def get_by_cliente_id(
+        self, cliente_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Reserva]:
+        """Get reservas by cliente ID, ordered by ID."""
+        query = select(Reserva).where(Reserva.cliente_id == cliente_id)
+        if after_id is not None:
+            query = query.where(Reserva.id > after_id)
+        result = await self.db.scalars(query.order_by(Reserva.id).offset(skip).limit(limit))
+        return list(result)
+
+    async def get_active_by_apartamento_id(self, apartamento_id: int) -> Optional[Reserva]:
+        """Get active reserva by apartamento ID."""
+        return await self.db.scalar(
+            select(Reserva).where(Reserva.apartamento_id == apartamento_id, Reserva.ativa == True)
+        )
+
+    async def expire_due(self, now: datetime, limit: int) -> List[Tuple[int, datetime]]:
+        """Deactivate up to limit active reservas past data_expiracao, oldest first.
+
+        Returns (apartamento_id, data_expiracao) for each reserva actually expired.
+        """
+        due = (
+            select(Reserva.id)
+            .where(Reserva.ativa == True, Reserva.data_expiracao <= now)
+            .order_by(Reserva.data_expiracao)
+            .limit(limit)
+        )
+        # ativa is re-checked so a reserva cancelled concurrently is not counted twice
+        stmt = (
+            update(Reserva)
+            .where(Reserva.id.in_(due.scalar_subquery()), Reserva.ativa == True)
+            .values(ativa=False)
+            .returning(Reserva.apartamento_id, Reserva.data_expiracao)
+            .execution_options(synchronize_session=False)
+        )
+        expired = list((await self.db.execute(stmt)).tuples())
+        await self._commit()
+        return expired
+
+    async def update_ativa(self, reserva_id: int, ativa: bool) -> Optional[Reserva]:
+        """Update reserva ativa status."""
+        reserva = await self.get_by_id(reserva_id)
+        if not reserva:
+            return None
+
+        reserva.ativa = ativa
+        await self._commit(reserva)
+        return reserva
+
+    async def delete(self, reserva_id: int) -> bool:
+        """Delete a reserva."""
+        reserva = await self.get_by_id(reserva_id)
+        if not reserva:
+            return False
+
+        await self.db.delete(reserva)
+        await self._commit()
+        return True
@@ -0,0 +1,47 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database.models import Usuario
+from src.application.dtos import UserCreate
+
+
+class AsyncUsuarioRepository:
+    """Async Usuario repository."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, user_data: UserCreate, hashed_password: str) -> Usuario:
+        """Create a new usuario with an already hashed password."""
+        usuario = Usuario(
+            username=user_data.username,
+            email=user_data.email,
+            hashed_password=hashed_password,
+        )
+        self.db.add(usuario)
+        await self.db.commit()
+        await self.db.refresh(usuario)
+        return usuario
+
+    async def get_by_username(self, username: str) -> Optional[Usuario]:
+        """Get a usuario by username."""
+        return await self.db.scalar(select(Usuario).where(Usuario.username == username))
+
+    async def get_by_email(self, email: str) -> Optional[Usuario]:
+        """Get a usuario by email."""
+        return await self.db.scalar(select(Usuario).where(Usuario.email == email))
+
+    async def get_by_id(self, usuario_id: int) -> Optional[Usuario]:
+        """Get a usuario by ID."""
+        return await self.db.scalar(select(Usuario).where(Usuario.id == usuario_id))
+
+    async def update_is_active(self, usuario_id: int, is_active: bool) -> Optional[Usuario]:
+        """Activate or deactivate a usuario."""
+        usuario = await self.get_by_id(usuario_id)
+        if not usuario:
+            return None
+
+        usuario.is_active = is_active
+        await self.db.commit()
+        await self.db.refresh(usuario)
+        return usuario
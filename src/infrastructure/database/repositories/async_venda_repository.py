@@ -0,0 +1,88 @@
+from datetime import datetime
+from typing import Any, Collection, Optional, List, AsyncIterator, Sequence
+from sqlalchemy import Row, select
+from src.infrastructure.database.loading import eager_load_options
+from src.infrastructure.database.streaming import export_query, astream_partitions
+from src.infrastructure.database.models import Venda
+from src.application.dtos import AgrupamentoVendas, Expansao, VendaCreate
+from .base import AsyncUnitOfWorkRepository
+from .venda_repository import build_summary_query
+
+
+class AsyncVendaRepository(AsyncUnitOfWorkRepository):
+    """Async Venda repository."""
+
+    async def create(self, venda_data: VendaCreate) -> Venda:
+        """Create a new venda."""
+        venda = Venda(**venda_data.model_dump())
+        self.db.add(venda)
+        await self._commit(venda)
+        return venda
+
+    async def get_by_id(self, venda_id: int, expand: Collection[Expansao] = ()) -> Optional[Venda]:
+        """Get a venda by ID, loading the expanded relations in the same query."""
+        if not expand:
+            return await self.db.get(Venda, venda_id)
+        query = select(Venda).where(Venda.id == venda_id).options(*eager_load_options(Venda, expand))
+        return (await self.db.scalars(query)).first()
+
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        expand: Collection[Expansao] = (),
+    ) -> List[Venda]:
+        """Get all vendas, ordered by ID (keyset pagination when after_id is given).
+
+        The expanded relations are loaded in the same query.
+        """
+        query = select(Venda).options(*eager_load_options(Venda, expand))
+        if after_id is not None:
+            query = query.where(Venda.id > after_id)
+        result = await self.db.scalars(query.order_by(Venda.id).offset(skip).limit(limit))
+        return list(result)
+
+    def stream_all(self, columns: Sequence[str], batch_size: int = 1000) -> AsyncIterator[List[Row]]:
+        """Stream the given columns of every venda, batch_size rows at a time, in ID order."""
+        return astream_partitions(self.db, export_query(Venda, columns), batch_size)
+
+    async def get_by_cliente_id(
+        self, cliente_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Venda]:
+        """Get vendas by cliente ID, ordered by ID."""
+        query = select(Venda).where(Venda.cliente_id == cliente_id)
+        if after_id is not None:
+            query = query.where(Venda.id > after_id)
+        result = await self.db.scalars(query.order_by(Venda.id).offset(skip).limit(limit))
+        return list(result)
+
+    async def get_by_apartamento_id(self, apartamento_id: int) -> Optional[Venda]:
+        """Get venda by apartamento ID."""
+        return await self.db.scalar(select(Venda).where(Venda.apartamento_id == apartamento_id))
+
+    async def summarize(
+        self, data_inicio: Optional[datetime] = None, data_fim: Optional[datetime] = None
+    ) -> Any:
+        """Count and sum the vendas in [data_inicio, data_fim)."""
+        return (await self.db.execute(build_summary_query(None, data_inicio, data_fim))).one()
+
+    async def summarize_by(
+        self,
+        group_by: AgrupamentoVendas,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Any]:
+        """Count and sum the vendas in [data_inicio, data_fim) per group."""
+        return list(await self.db.execute(build_summary_query(group_by, data_inicio, data_fim, limit)))
+
+    async def delete(self, venda_id: int) -> bool:
+        """Delete a venda."""
+        venda = await self.get_by_id(venda_id)
+        if not venda:
+            return False
+
+        await self.db.delete(venda)
+        await self._commit()
+        return True
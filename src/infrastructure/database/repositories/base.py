@@ -0,0 +1,44 @@
+from typing import Any, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+class UnitOfWorkRepository:
+    """Base of the repositories whose writes can join a caller's unit of work.
+
+    By default every write commits on its own. With auto_commit=False the
+    repository only flushes, so the caller can combine writes of several
+    repositories and commit them once with unit_of_work.
+    """
+
+    def __init__(self, db: Session, auto_commit: bool = True):
+        self.db = db
+        self.auto_commit = auto_commit
+
+    def _commit(self, instance: Optional[Any] = None) -> None:
+        """Commit and refresh instance, or just flush inside a unit of work."""
+        if not self.auto_commit:
+            self.db.flush()
+            return
+
+        self.db.commit()
+        if instance is not None:
+            self.db.refresh(instance)
+
+
+class AsyncUnitOfWorkRepository:
+    """Async version of UnitOfWorkRepository, committed with async_unit_of_work."""
+
+    def __init__(self, db: AsyncSession, auto_commit: bool = True):
+        self.db = db
+        self.auto_commit = auto_commit
+
+    async def _commit(self, instance: Optional[Any] = None) -> None:
+        """Commit and refresh instance, or just flush inside a unit of work."""
+        if not self.auto_commit:
+            await self.db.flush()
+            return
+
+        await self.db.commit()
+        if instance is not None:
+            await self.db.refresh(instance)
@@ -1,34 +1,161 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
+import re
+from itertools import zip_longest
+from datetime import datetime
+from typing import Dict, Iterable, Optional, List, Set, Iterator, Sequence, Tuple
+from sqlalchemy import Row, Select, column, func, insert, literal_column, or_, select, table
+from src.infrastructure.database.functions import dialect_insert
+from src.infrastructure.database.streaming import export_query, stream_partitions
 from src.infrastructure.database.models import Cliente
 from src.application.dtos import ClienteCreate, ClienteUpdate
+from .base import UnitOfWorkRepository
 
 
-class ClienteRepository:
-    """Cliente repository."""
+# External-content FTS5 table kept in sync with clientes on SQLite (see models.cliente)
+CLIENTES_FTS = table("clientes_fts", column("rowid"), column("rank"))
+CPF_PREFIX = re.compile(r"\d{1,11}", re.ASCII)
+
+
+def cpf_prefix(q: str) -> Optional[str]:
+    """The digits of a query that can be the start of a CPF, or None."""
+    digits = re.sub(r"[.\-\s]", "", q)
+    return digits if CPF_PREFIX.fullmatch(digits) else None
+
+
+def is_cpf_shaped(q: str, prefix: str) -> bool:
+    """Whether a digit query can only mean a CPF: punctuated like one, or all 11 digits."""
+    return len(prefix) == 11 or re.search(r"[.\-]", q) is not None
+
+
+def merge_matches(first: List[Cliente], second: List[Cliente], limit: int) -> List[Cliente]:
+    """Alternate the results of two searches, skipping repeats, so both show up within limit."""
+    merged: Dict[int, Cliente] = {}
+    for pair in zip_longest(first, second):
+        for cliente in pair:
+            if cliente is not None:
+                merged.setdefault(cliente.id, cliente)
+    return list(merged.values())[:limit]
+
+
+def build_cpf_prefix_query(prefix: str, limit: int) -> Select:
+    """Clientes whose CPF starts with prefix, read as a range of the unique CPF index."""
+    upper = prefix + "9" * (11 - len(prefix))
+    return select(Cliente).where(Cliente.cpf >= prefix, Cliente.cpf <= upper).order_by(Cliente.cpf).limit(limit)
+
+
+def build_text_search_query(dialect_name: str, q: str, limit: int) -> Select:
+    """Clientes whose nome, email or telefone contains q, best matches first.
+
+    PostgreSQL answers the ILIKE from the pg_trgm indexes and ranks by
+    word_similarity; SQLite matches the trigram FTS5 table and ranks by bm25.
+    """
+    if dialect_name == "sqlite":
+        phrase = '"' + q.replace('"', '""') + '"'
+        return (
+            select(Cliente)
+            .join(CLIENTES_FTS, CLIENTES_FTS.c.rowid == Cliente.id)
+            .where(literal_column("clientes_fts").op("MATCH")(phrase))
+            .order_by(CLIENTES_FTS.c.rank, Cliente.id)
+            .limit(limit)
+        )
 
-    def __init__(self, db: Session):
-        self.db = db
+    columns = (Cliente.nome, Cliente.email, Cliente.telefone)
+    pattern = "%" + re.sub(r"([/%_])", r"/\1", q) + "%"
+    query = select(Cliente).where(or_(*(field.ilike(pattern, escape="/") for field in columns)))
+    if dialect_name == "postgresql":
+        score = func.greatest(*(func.word_similarity(q, field) for field in columns))
+        return query.order_by(score.desc(), Cliente.id).limit(limit)
+    return query.order_by(Cliente.id).limit(limit)
+
+
+class ClienteRepository(UnitOfWorkRepository):
+    """Cliente repository."""
 
     def create(self, cliente_data: ClienteCreate) -> Cliente:
         """Create a new cliente."""
         cliente = Cliente(**cliente_data.model_dump())
         self.db.add(cliente)
-        self.db.commit()
-        self.db.refresh(cliente)
+        self._commit(cliente)
         return cliente
 
     def get_by_id(self, cliente_id: int) -> Optional[Cliente]:
         """Get a cliente by ID."""
-        return self.db.query(Cliente).filter(Cliente.id == cliente_id).first()
+        return self.db.get(Cliente, cliente_id)
 
     def get_by_cpf(self, cpf: str) -> Optional[Cliente]:
         """Get a cliente by CPF."""
         return self.db.query(Cliente).filter(Cliente.cpf == cpf).first()
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Cliente]:
-        """Get all clientes."""
-        return self.db.query(Cliente).offset(skip).limit(limit).all()
+    def search(self, q: str, limit: int = 20) -> List[Cliente]:
+        """Search clientes by CPF prefix and by part of nome, email or telefone.
+
+        A CPF-shaped query only falls back to the text search when no CPF
+        matches; plain digits may be part of a telefone too, so both run.
+        """
+        prefix = cpf_prefix(q)
+        by_cpf: List[Cliente] = []
+        if prefix is not None:
+            # A range scan of the CPF index
+            by_cpf = list(self.db.scalars(build_cpf_prefix_query(prefix, limit)))
+            if by_cpf and is_cpf_shaped(q, prefix):
+                return by_cpf
+        query = build_text_search_query(self.db.get_bind().dialect.name, q, limit)
+        return merge_matches(by_cpf, list(self.db.scalars(query)), limit)
+
+    def get_existing_cpfs(self, cpfs: Iterable[str]) -> Set[str]:
+        """Return which of the given cpfs are already taken, in a single query."""
+        cpfs = list(cpfs)
+        if not cpfs:
+            return set()
+        return set(self.db.scalars(select(Cliente.cpf).where(Cliente.cpf.in_(cpfs))))
+
+    def create_many(self, items: List[ClienteCreate]) -> Dict[str, int]:
+        """Insert a batch of clientes with one executemany, returning their IDs by cpf."""
+        # ORM bulk INSERT: batched multi-row INSERT ... RETURNING (insertmanyvalues).
+        # IDs are matched by cpf because RETURNING order is not guaranteed on every backend.
+        stmt = insert(Cliente).returning(Cliente.cpf, Cliente.id)
+        result = self.db.execute(stmt, [item.model_dump() for item in items])
+        ids = dict(result.tuples().all())
+        self._commit()
+        return ids
+
+    def upsert_many(self, items: List[ClienteCreate]) -> None:
+        """Insert a batch of clientes, updating nome, email and telefone of CPFs already taken."""
+        stmt = dialect_insert(self.db.get_bind().dialect.name)(Cliente)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Cliente.cpf],
+            set_={
+                "nome": stmt.excluded.nome,
+                "email": stmt.excluded.email,
+                "telefone": stmt.excluded.telefone,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self.db.execute(stmt, [item.model_dump() for item in items])
+        self._commit()
+
+    def get_all(self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None) -> List[Cliente]:
+        """Get all clientes, ordered by ID (keyset pagination when after_id is given)."""
+        query = self.db.query(Cliente)
+        if after_id is not None:
+            query = query.filter(Cliente.id > after_id)
+        return query.order_by(Cliente.id).offset(skip).limit(limit).all()
+
+    def get_updated_at(self, cliente_id: int) -> Optional[datetime]:
+        """Get when a cliente last changed, reading only that column."""
+        return self.db.scalar(select(Cliente.updated_at).where(Cliente.id == cliente_id))
+
+    def get_all_updated_at(
+        self, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Tuple[int, datetime]]:
+        """Get the (id, updated_at) of the clientes get_all returns, without loading them."""
+        query = select(Cliente.id, Cliente.updated_at)
+        if after_id is not None:
+            query = query.where(Cliente.id > after_id)
+        return list(self.db.execute(query.order_by(Cliente.id).offset(skip).limit(limit)).tuples())
+
+    def stream_all(self, columns: Sequence[str], batch_size: int = 1000) -> Iterator[List[Row]]:
+        """Stream the given columns of every cliente, batch_size rows at a time, in ID order."""
+        return stream_partitions(self.db, export_query(Cliente, columns), batch_size)
 
     def update(self, cliente_id: int, cliente_data: ClienteUpdate) -> Optional[Cliente]:
         """Update a cliente."""
@@ -40,8 +167,7 @@ class ClienteRepository:
         for key, value in update_data.items():
             setattr(cliente, key, value)
 
-        self.db.commit()
-        self.db.refresh(cliente)
+        self._commit(cliente)
         return cliente
 
     def delete(self, cliente_id: int) -> bool:
@@ -51,5 +177,5 @@ class ClienteRepository:
             return False
 
         self.db.delete(cliente)
-        self.db.commit()
+        self._commit()
         return True
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Any, Optional, Type
+from pydantic import BaseModel
+from sqlalchemy import delete, select
+from src.infrastructure.database.models import IdempotencyKey
+from src.application.dtos import IdempotentRequest
+from .base import UnitOfWorkRepository
+
+
+class IdempotencyKeyRepository(UnitOfWorkRepository):
+    """Idempotency key repository."""
+
+    def get(self, usuario_id: int, endpoint: str, key: str) -> Optional[IdempotencyKey]:
+        """Get the stored response of a key, expired or not."""
+        query = select(IdempotencyKey).where(
+            IdempotencyKey.usuario_id == usuario_id,
+            IdempotencyKey.endpoint == endpoint,
+            IdempotencyKey.key == key,
+        )
+        return self.db.scalars(query).first()
+
+    def store_response(
+        self, request: Optional[IdempotentRequest], schema: Type[BaseModel], instance: Any
+    ) -> Optional[IdempotencyKey]:
+        """Store instance, serialized with schema, as the first response to request.
+
+        A no-op for unkeyed requests. Called inside the unit of work that
+        creates the resource, so a retry never finds one without the other.
+        """
+        if request is None:
+            return None
+        response_body = schema.model_validate(instance).model_dump_json()
+        idempotency_key = IdempotencyKey(**request.model_dump(), response_body=response_body)
+        self.db.add(idempotency_key)
+        self._commit()
+        return idempotency_key
+
+    def delete(self, idempotency_key: IdempotencyKey) -> None:
+        """Delete a stored response."""
+        self.db.delete(idempotency_key)
+        self._commit()
+
+    def delete_expired(self, now: datetime, limit: int) -> int:
+        """Delete up to limit keys expired at now, returning how many were deleted."""
+        expired = select(IdempotencyKey.id).where(IdempotencyKey.expires_at <= now).limit(limit)
+        stmt = (
+            delete(IdempotencyKey)
+            .where(IdempotencyKey.id.in_(expired.scalar_subquery()))
+            .execution_options(synchronize_session=False)
+        )
+        deleted = self.db.execute(stmt).rowcount
+        self._commit()
+        return deleted
@@ -1,34 +1,58 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Collection, Optional, List, Tuple, Iterator, Sequence
+from sqlalchemy import Row, select, update
+from src.infrastructure.database.loading import eager_load_options
+from src.infrastructure.database.streaming import export_query, stream_partitions
 from src.infrastructure.database.models import Reserva
-from src.application.dtos import ReservaCreate
+from src.application.dtos import Expansao, ReservaCreate
+from .base import UnitOfWorkRepository
 
 
-class ReservaRepository:
+class ReservaRepository(UnitOfWorkRepository):
     """Reserva repository."""
 
-    def __init__(self, db: Session):
-        self.db = db
-
     def create(self, reserva_data: ReservaCreate) -> Reserva:
         """Create a new reserva."""
         reserva = Reserva(**reserva_data.model_dump())
         self.db.add(reserva)
-        self.db.commit()
-        self.db.refresh(reserva)
+        self._commit(reserva)
         return reserva
 
-    def get_by_id(self, reserva_id: int) -> Optional[Reserva]:
-        """Get a reserva by ID."""
-        return self.db.query(Reserva).filter(Reserva.id == reserva_id).first()
+    def get_by_id(self, reserva_id: int, expand: Collection[Expansao] = ()) -> Optional[Reserva]:
+        """Get a reserva by ID, loading the expanded relations in the same query."""
+        if not expand:
+            return self.db.get(Reserva, reserva_id)
+        query = select(Reserva).where(Reserva.id == reserva_id).options(*eager_load_options(Reserva, expand))
+        return (self.db.scalars(query)).first()
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        expand: Collection[Expansao] = (),
+    ) -> List[Reserva]:
+        """Get all reservas, ordered by ID (keyset pagination when after_id is given).
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Reserva]:
-        """Get all reservas."""
-        return self.db.query(Reserva).offset(skip).limit(limit).all()
+        The expanded relations are loaded in the same query.
+        """
+        query = self.db.query(Reserva).options(*eager_load_options(Reserva, expand))
+        if after_id is not None:
+            query = query.filter(Reserva.id > after_id)
+        return query.order_by(Reserva.id).offset(skip).limit(limit).all()
 
-    def get_by_cliente_id(self, cliente_id: int, skip: int = 0, limit: int = 100) -> List[Reserva]:
-        """Get reservas by cliente ID."""
-        return self.db.query(Reserva).filter(Reserva.cliente_id == cliente_id).offset(skip).limit(limit).all()
+    def stream_all(self, columns: Sequence[str], batch_size: int = 1000) -> Iterator[List[Row]]:
+        """Stream the given columns of every reserva, batch_size rows at a time, in ID order."""
+        return stream_partitions(self.db, export_query(Reserva, columns), batch_size)
+
+    def get_by_cliente_id(
+        self, cliente_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Reserva]:
+        """Get reservas by cliente ID, ordered by ID."""
+        query = self.db.query(Reserva).filter(Reserva.cliente_id == cliente_id)
+        if after_id is not None:
+            query = query.filter(Reserva.id > after_id)
+        return query.order_by(Reserva.id).offset(skip).limit(limit).all()
 
     def get_active_by_apartamento_id(self, apartamento_id: int) -> Optional[Reserva]:
         """Get active reserva by apartamento ID."""
@@ -38,6 +62,29 @@ class ReservaRepository:
             .first()
         )
 
+    def expire_due(self, now: datetime, limit: int) -> List[Tuple[int, datetime]]:
+        """Deactivate up to limit active reservas past data_expiracao, oldest first.
+
+        Returns (apartamento_id, data_expiracao) for each reserva actually expired.
+        """
+        due = (
+            select(Reserva.id)
+            .where(Reserva.ativa == True, Reserva.data_expiracao <= now)
+            .order_by(Reserva.data_expiracao)
+            .limit(limit)
+        )
+        # ativa is re-checked so a reserva cancelled concurrently is not counted twice
+        stmt = (
+            update(Reserva)
+            .where(Reserva.id.in_(due.scalar_subquery()), Reserva.ativa == True)
+            .values(ativa=False)
+            .returning(Reserva.apartamento_id, Reserva.data_expiracao)
+            .execution_options(synchronize_session=False)
+        )
+        expired = list(self.db.execute(stmt).tuples())
+        self._commit()
+        return expired
+
     def update_ativa(self, reserva_id: int, ativa: bool) -> Optional[Reserva]:
         """Update reserva ativa status."""
         reserva = self.get_by_id(reserva_id)
@@ -45,8 +92,7 @@ class ReservaRepository:
             return None
 
         reserva.ativa = ativa
-        self.db.commit()
-        self.db.refresh(reserva)
+        self._commit(reserva)
         return reserva
 
     def delete(self, reserva_id: int) -> bool:
@@ -56,5 +102,5 @@ class ReservaRepository:
             return False
 
         self.db.delete(reserva)
-        self.db.commit()
+        self._commit()
         return True
@@ -2,7 +2,6 @@ from typing import Optional
 from sqlalchemy.orm import Session
 from src.infrastructure.database.models import Usuario
 from src.application.dtos import UserCreate
-from src.infrastructure.auth import get_password_hash
 
 
 class UsuarioRepository:
@@ -11,9 +10,8 @@ class UsuarioRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def create(self, user_data: UserCreate) -> Usuario:
-        """Create a new usuario."""
-        hashed_password = get_password_hash(user_data.password)
+    def create(self, user_data: UserCreate, hashed_password: str) -> Usuario:
+        """Create a new usuario with an already hashed password."""
         usuario = Usuario(
             username=user_data.username,
             email=user_data.email,
@@ -35,3 +33,14 @@ class UsuarioRepository:
     def get_by_id(self, usuario_id: int) -> Optional[Usuario]:
         """Get a usuario by ID."""
         return self.db.query(Usuario).filter(Usuario.id == usuario_id).first()
+
+    def update_is_active(self, usuario_id: int, is_active: bool) -> Optional[Usuario]:
+        """Activate or deactivate a usuario."""
+        usuario = self.get_by_id(usuario_id)
+        if not usuario:
+            return None
+
+        usuario.is_active = is_active
+        self.db.commit()
+        self.db.refresh(usuario)
+        return usuario
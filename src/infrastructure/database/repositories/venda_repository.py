@@ -1,39 +1,127 @@
-from typing import Optional, List
-from sqlalchemy.orm import Session
-from src.infrastructure.database.models import Venda
-from src.application.dtos import VendaCreate
+from datetime import datetime
+from typing import Any, Collection, Optional, List, Iterator, Sequence
+from sqlalchemy import Row, Select, func, null, select
+from src.infrastructure.database.functions import year_month
+from src.infrastructure.database.loading import eager_load_options
+from src.infrastructure.database.streaming import export_query, stream_partitions
+from src.infrastructure.database.models import Apartamento, Cliente, Venda
+from src.application.dtos import AgrupamentoVendas, Expansao, VendaCreate
+from .base import UnitOfWorkRepository
 
 
-class VendaRepository:
-    """Venda repository."""
+def build_summary_query(
+    group_by: Optional[AgrupamentoVendas] = None,
+    data_inicio: Optional[datetime] = None,
+    data_fim: Optional[datetime] = None,
+    limit: Optional[int] = None,
+) -> Select:
+    """Build the aggregate query behind the vendas report.
+
+    Without group_by it returns a single total row; otherwise one row per
+    group, with the group key and description as the first two columns.
+    """
+    valor_total = func.coalesce(func.sum(Venda.valor_venda), 0).label("valor_total")
+    aggregates = [
+        func.count().label("quantidade"),
+        valor_total,
+        func.coalesce(func.sum(Venda.valor_entrada), 0).label("valor_entrada_total"),
+    ]
+
+    if group_by is None:
+        query = select(*aggregates)
+    elif group_by == AgrupamentoVendas.CLIENTE:
+        query = (
+            select(Venda.cliente_id.label("grupo"), Cliente.nome.label("descricao"), *aggregates)
+            .join(Cliente, Cliente.id == Venda.cliente_id)
+            .group_by(Venda.cliente_id, Cliente.nome)
+            # Top clientes first
+            .order_by(valor_total.desc(), Venda.cliente_id)
+        )
+    else:
+        if group_by == AgrupamentoVendas.MES:
+            key = year_month(Venda.data_venda)
+        else:
+            key = getattr(Apartamento, group_by.value)
+        query = select(key.label("grupo"), null().label("descricao"), *aggregates).group_by(key).order_by(key)
+        if group_by != AgrupamentoVendas.MES:
+            query = query.join(Apartamento, Apartamento.id == Venda.apartamento_id)
+
+    query = query.select_from(Venda)
+    if data_inicio is not None:
+        query = query.where(Venda.data_venda >= data_inicio)
+    if data_fim is not None:
+        query = query.where(Venda.data_venda < data_fim)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
 
-    def __init__(self, db: Session):
-        self.db = db
+class VendaRepository(UnitOfWorkRepository):
+    """Venda repository."""
 
     def create(self, venda_data: VendaCreate) -> Venda:
         """Create a new venda."""
         venda = Venda(**venda_data.model_dump())
         self.db.add(venda)
-        self.db.commit()
-        self.db.refresh(venda)
+        self._commit(venda)
         return venda
 
-    def get_by_id(self, venda_id: int) -> Optional[Venda]:
-        """Get a venda by ID."""
-        return self.db.query(Venda).filter(Venda.id == venda_id).first()
+    def get_by_id(self, venda_id: int, expand: Collection[Expansao] = ()) -> Optional[Venda]:
+        """Get a venda by ID, loading the expanded relations in the same query."""
+        if not expand:
+            return self.db.get(Venda, venda_id)
+        query = select(Venda).where(Venda.id == venda_id).options(*eager_load_options(Venda, expand))
+        return (self.db.scalars(query)).first()
+
+    def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after_id: Optional[int] = None,
+        expand: Collection[Expansao] = (),
+    ) -> List[Venda]:
+        """Get all vendas, ordered by ID (keyset pagination when after_id is given).
+
+        The expanded relations are loaded in the same query.
+        """
+        query = self.db.query(Venda).options(*eager_load_options(Venda, expand))
+        if after_id is not None:
+            query = query.filter(Venda.id > after_id)
+        return query.order_by(Venda.id).offset(skip).limit(limit).all()
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[Venda]:
-        """Get all vendas."""
-        return self.db.query(Venda).offset(skip).limit(limit).all()
+    def stream_all(self, columns: Sequence[str], batch_size: int = 1000) -> Iterator[List[Row]]:
+        """Stream the given columns of every venda, batch_size rows at a time, in ID order."""
+        return stream_partitions(self.db, export_query(Venda, columns), batch_size)
 
-    def get_by_cliente_id(self, cliente_id: int, skip: int = 0, limit: int = 100) -> List[Venda]:
-        """Get vendas by cliente ID."""
-        return self.db.query(Venda).filter(Venda.cliente_id == cliente_id).offset(skip).limit(limit).all()
+    def get_by_cliente_id(
+        self, cliente_id: int, skip: int = 0, limit: int = 100, after_id: Optional[int] = None
+    ) -> List[Venda]:
+        """Get vendas by cliente ID, ordered by ID."""
+        query = self.db.query(Venda).filter(Venda.cliente_id == cliente_id)
+        if after_id is not None:
+            query = query.filter(Venda.id > after_id)
+        return query.order_by(Venda.id).offset(skip).limit(limit).all()
 
     def get_by_apartamento_id(self, apartamento_id: int) -> Optional[Venda]:
         """Get venda by apartamento ID."""
         return self.db.query(Venda).filter(Venda.apartamento_id == apartamento_id).first()
 
+    def summarize(
+        self, data_inicio: Optional[datetime] = None, data_fim: Optional[datetime] = None
+    ) -> Any:
+        """Count and sum the vendas in [data_inicio, data_fim)."""
+        return self.db.execute(build_summary_query(None, data_inicio, data_fim)).one()
+
+    def summarize_by(
+        self,
+        group_by: AgrupamentoVendas,
+        data_inicio: Optional[datetime] = None,
+        data_fim: Optional[datetime] = None,
+        limit: int = 100,
+    ) -> List[Any]:
+        """Count and sum the vendas in [data_inicio, data_fim) per group."""
+        return list(self.db.execute(build_summary_query(group_by, data_inicio, data_fim, limit)))
+
     def delete(self, venda_id: int) -> bool:
         """Delete a venda."""
         venda = self.get_by_id(venda_id)
@@ -41,5 +129,5 @@ class VendaRepository:
             return False
 
         self.db.delete(venda)
-        self.db.commit()
+        self._commit()
         return True
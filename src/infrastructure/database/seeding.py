@@ -0,0 +1,355 @@
+"""Deterministic bulk seeding of clientes, apartamentos, vendas and reservas.
+
+The rows only depend on the configuration: every table draws from a random
+stream of its own, seeded from the configured seed, and every date is an
+offset from the reference date. Rows carry explicit IDs, so vendas and
+reservas reference clientes and apartamentos without reading them back.
+
+The generated inventory respects the invariants VendaService and
+ReservaService enforce: a vendido unit has exactly one venda, a reservado
+unit exactly one active reserva, and a disponivel unit neither. Inactive
+reservas (reserved before the sale, or expired) add the history.
+"""
+import csv
+import enum
+import io
+import time
+from operator import mul
+from random import Random
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from sqlalchemy import Table, delete, exists, insert, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from src.infrastructure.database.models import Apartamento, ApartamentoResumo, Cliente, Reserva, Venda
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.models.cliente import CLIENTES_FTS_DDL
+from src.infrastructure.database.repositories.apartamento_resumo_repository import build_rebuild_statements
+
+SEED_CHUNK_SIZE = 10_000
+
+FIRST_NAMES = [
+    "Ana", "Bruno", "Carla", "Diego", "Elisa", "Felipe", "Gabriela", "Hugo", "Isabela", "João",
+    "Larissa", "Marcos", "Natália", "Otávio", "Paula", "Rafael", "Sofia", "Thiago", "Vitória", "Wagner",
+]
+LAST_NAMES = [
+    "Silva", "Souza", "Oliveira", "Santos", "Pereira", "Lima", "Costa", "Ribeiro", "Almeida", "Rocha",
+    "Carvalho", "Gomes", "Martins", "Araújo", "Barbosa", "Cardoso", "Teixeira", "Moreira", "Mendes", "Nunes",
+]
+EMAIL_DOMAINS = ["gmail.com", "hotmail.com", "outlook.com", "yahoo.com.br", "uol.com.br"]
+DDDS = ["11", "21", "31", "41", "51", "61", "71", "81", "85", "92"]
+# Lowercase ascii spelling of the names, for the e-mail addresses
+EMAIL_NAMES = {
+    name: name.lower().translate(str.maketrans("áãâéêíóôõúç", "aaaeeiooouc"))
+    for name in FIRST_NAMES + LAST_NAMES
+}
+
+FLOORS = 20
+UNITS_PER_FLOOR = 8
+UNITS_PER_BLOCO = FLOORS * UNITS_PER_FLOOR
+# numero is 'T<bloco>-<andar><unidade>' and has to fit its String(10)
+MAX_BLOCOS = 9999
+# Weighted draw of the number of quartos, and the base area of each
+QUARTOS = (1,) * 3 + (2,) * 8 + (3,) * 7 + (4,) * 2
+AREA_BY_QUARTOS = {1: 35.0, 2: 55.0, 3: 75.0, 4: 110.0}
+# Weights of the CPF digits in the second check digit; the first check digit drops the 11
+CPF_WEIGHTS = tuple(range(11, 1, -1))
+
+CLIENTE_COLUMNS = ("id", "nome", "cpf", "email", "telefone", "created_at", "updated_at")
+APARTAMENTO_COLUMNS = (
+    "id", "numero", "bloco", "andar", "quartos", "area", "preco", "status", "version", "created_at", "updated_at",
+)
+VENDA_COLUMNS = (
+    "id", "cliente_id", "apartamento_id", "valor_venda", "valor_entrada", "data_venda", "created_at", "updated_at",
+)
+RESERVA_COLUMNS = (
+    "id", "cliente_id", "apartamento_id", "data_reserva", "data_expiracao", "ativa", "created_at", "updated_at",
+)
+
+# SQLite full-text triggers on clientes suspended while loading
+FTS_SUSPENDED_TRIGGERS = ("clientes_fts_insert", "clientes_fts_delete")
+
+Row = Tuple
+
+
+class SeedConfig(NamedTuple):
+    """Size and shape of a seeded dataset."""
+
+    clientes: int
+    apartamentos: int
+    reference_date: datetime
+    seed: int = 42
+    # Share of the units sold and reserved; the rest is disponivel
+    vendido_ratio: float = 0.3
+    reservado_ratio: float = 0.1
+    chunk_size: int = SEED_CHUNK_SIZE
+
+
+class Inventory(NamedTuple):
+    """One chunk of apartamentos with their vendas and reservas."""
+
+    apartamentos: List[Row]
+    vendas: List[Row]
+    reservas: List[Row]
+
+
+def validate_config(config: SeedConfig) -> None:
+    """Reject configurations that cannot produce a consistent dataset."""
+    if config.clientes < 0 or config.apartamentos < 0:
+        raise ValueError("Row counts cannot be negative")
+    if config.chunk_size < 1:
+        raise ValueError("The chunk size must be positive")
+    if config.apartamentos > MAX_BLOCOS * UNITS_PER_BLOCO:
+        raise ValueError(f"At most {MAX_BLOCOS * UNITS_PER_BLOCO} apartamentos can be numbered")
+    if not (0 <= config.vendido_ratio and 0 <= config.reservado_ratio
+            and config.vendido_ratio + config.reservado_ratio <= 1):
+        raise ValueError("The vendido and reservado ratios must add up to at most 1")
+    if config.apartamentos and not config.clientes and config.vendido_ratio + config.reservado_ratio:
+        raise ValueError("Vendas and reservas need at least one cliente")
+
+
+def cpf(number: int) -> str:
+    """The valid CPF whose first nine digits are `number`."""
+    base = f"{number:09d}"
+    digits = list(map(int, base))
+    first = sum(map(mul, digits, CPF_WEIGHTS[1:])) * 10 % 11 % 10
+    second = (sum(map(mul, digits, CPF_WEIGHTS)) + first * 2) * 10 % 11 % 10
+    return f"{base}{first}{second}"
+
+
+def generate_clientes(config: SeedConfig) -> Iterator[Row]:
+    """Cliente rows, with IDs 1..clientes and a distinct CPF and e-mail each."""
+    # random() indexing is several times cheaper than choice() and randrange()
+    random = Random(f"{config.seed}:clientes").random
+    oldest = timedelta(days=3 * 365).total_seconds()
+    for id in range(1, config.clientes + 1):
+        first = FIRST_NAMES[int(random() * len(FIRST_NAMES))]
+        middle = LAST_NAMES[int(random() * len(LAST_NAMES))]
+        last = LAST_NAMES[int(random() * len(LAST_NAMES))]
+        domain = EMAIL_DOMAINS[int(random() * len(EMAIL_DOMAINS))]
+        telefone = f"{DDDS[int(random() * len(DDDS))]}9{int(random() * 10 ** 8):08d}"
+        created_at = config.reference_date - timedelta(seconds=int(random() * oldest))
+        yield (
+            id, f"{first} {middle} {last}", cpf(id), f"{EMAIL_NAMES[first]}.{EMAIL_NAMES[last]}{id}@{domain}",
+            telefone, created_at, created_at,
+        )
+
+
+def generate_inventory(config: SeedConfig) -> Iterator[Inventory]:
+    """Apartamento rows with their vendas and reservas, `chunk_size` units at a time."""
+    rng = Random(f"{config.seed}:apartamentos")
+    launch = config.reference_date - timedelta(days=3 * 365)
+    sales_window = int(timedelta(days=2 * 365).total_seconds())
+    venda_id = reserva_id = 0
+    preco_m2 = 0.0
+    chunk = Inventory([], [], [])
+    for index in range(config.apartamentos):
+        bloco_index, position = divmod(index, UNITS_PER_BLOCO)
+        andar, unidade = divmod(position, UNITS_PER_FLOOR)
+        andar += 1
+        if position == 0:
+            preco_m2 = rng.uniform(7000, 13000)
+        quartos = rng.choice(QUARTOS)
+        area = round(AREA_BY_QUARTOS[quartos] + rng.uniform(-5, 20), 2)
+        # Higher floors cost more
+        preco = round(area * preco_m2 * (1 + andar / 100), -2)
+        draw = rng.random()
+        if draw < config.vendido_ratio:
+            status = StatusApartamento.VENDIDO
+        elif draw < config.vendido_ratio + config.reservado_ratio:
+            status = StatusApartamento.RESERVADO
+        else:
+            status = StatusApartamento.DISPONIVEL
+
+        id = index + 1
+        updated_at = launch
+        if status is StatusApartamento.VENDIDO:
+            cliente_id = rng.randint(1, config.clientes)
+            data_venda = config.reference_date - timedelta(seconds=rng.randrange(sales_window))
+            valor_venda = round(preco * rng.uniform(0.92, 1.0), 2)
+            valor_entrada = round(valor_venda * rng.uniform(0.1, 0.3), 2)
+            venda_id += 1
+            chunk.vendas.append(
+                (venda_id, cliente_id, id, valor_venda, valor_entrada, data_venda, data_venda, data_venda)
+            )
+            updated_at = data_venda
+            # Half of the sales closed a reserva of the same cliente
+            if rng.random() < 0.5:
+                data_reserva = data_venda - timedelta(days=rng.randint(1, 10))
+                reserva_id += 1
+                chunk.reservas.append(
+                    (reserva_id, cliente_id, id, data_reserva, data_reserva + timedelta(days=15), False,
+                     data_reserva, data_venda)
+                )
+        elif status is StatusApartamento.RESERVADO:
+            data_reserva = config.reference_date - timedelta(seconds=rng.randrange(7 * 24 * 3600))
+            data_expiracao = config.reference_date + timedelta(days=rng.randint(1, 30))
+            reserva_id += 1
+            chunk.reservas.append(
+                (reserva_id, rng.randint(1, config.clientes), id, data_reserva, data_expiracao, True,
+                 data_reserva, data_reserva)
+            )
+            updated_at = data_reserva
+        elif config.clientes and rng.random() < 0.1:
+            # A reserva that expired without a sale
+            data_reserva = config.reference_date - timedelta(days=rng.randint(30, 365))
+            data_expiracao = data_reserva + timedelta(days=7)
+            reserva_id += 1
+            chunk.reservas.append(
+                (reserva_id, rng.randint(1, config.clientes), id, data_reserva, data_expiracao, False,
+                 data_reserva, data_expiracao)
+            )
+            updated_at = data_expiracao
+
+        chunk.apartamentos.append(
+            (id, f"T{bloco_index + 1}-{andar}{unidade + 1:02d}", f"T{bloco_index + 1}", andar, quartos, area,
+             preco, status, 1, launch, updated_at)
+        )
+        if len(chunk.apartamentos) == config.chunk_size:
+            yield chunk
+            chunk = Inventory([], [], [])
+    if chunk.apartamentos:
+        yield chunk
+
+
+def chunked(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    """Split a row stream into lists of at most `size` rows."""
+    chunk: List[Row] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def copy_value(value: object) -> object:
+    """The text COPY expects for a value: enum columns store the member name."""
+    return value.name if isinstance(value, enum.Enum) else value
+
+
+def copy_rows(conn: Connection, table: Table, columns: Sequence[str], rows: List[Row]) -> None:
+    """Load rows with PostgreSQL's COPY, through the connection's psycopg2 cursor."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows([copy_value(value) for value in row] for row in rows)
+    buffer.seek(0)
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+
+def insert_rows(conn: Connection, table: Table, columns: Sequence[str], rows: List[Row]) -> None:
+    """Load rows with one executemany INSERT on the DBAPI cursor.
+
+    The values go through the column types' bind processors, as they would
+    through insert(table), without the per-row cost of the ORM/Core layer.
+    """
+    compiled = insert(table).compile(dialect=conn.dialect, column_keys=list(columns))
+    processors = [table.c[column].type.bind_processor(conn.dialect) for column in columns]
+    processed = [
+        [value if process is None else process(value) for process, value in zip(processors, row)]
+        for row in rows
+    ]
+    if conn.dialect.positional:
+        order = [columns.index(name) for name in compiled.positiontup]
+        parameters = [tuple(row[i] for i in order) for row in processed]
+    else:
+        parameters = [dict(zip(columns, row)) for row in processed]
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.executemany(compiled.string, parameters)
+    finally:
+        cursor.close()
+
+
+class Seeder:
+    """Loads a generated dataset into empty tables, in one transaction."""
+
+    TABLES = (Reserva.__table__, Venda.__table__, ApartamentoResumo.__table__, Apartamento.__table__,
+              Cliente.__table__)
+
+    def __init__(self, engine: Engine, config: SeedConfig):
+        validate_config(config)
+        self.engine = engine
+        self.config = config
+        self.load = copy_rows if engine.dialect.name == "postgresql" else insert_rows
+
+    def seed(self, reset: bool = False) -> Dict[str, int]:
+        """Load the dataset and return the number of rows per table.
+
+        Raises ValueError when a table already has rows, unless `reset`
+        empties them first.
+        """
+        counts = {table.name: 0 for table in (Cliente.__table__, Apartamento.__table__,
+                                               Venda.__table__, Reserva.__table__)}
+        self.suspend_fts_triggers()
+        try:
+            with self.engine.begin() as conn:
+                self.prepare(conn, reset)
+                for rows in chunked(generate_clientes(self.config), self.config.chunk_size):
+                    self.load(conn, Cliente.__table__, CLIENTE_COLUMNS, rows)
+                    counts["clientes"] += len(rows)
+                for chunk in generate_inventory(self.config):
+                    for table, columns, rows in (
+                        (Apartamento.__table__, APARTAMENTO_COLUMNS, chunk.apartamentos),
+                        (Venda.__table__, VENDA_COLUMNS, chunk.vendas),
+                        (Reserva.__table__, RESERVA_COLUMNS, chunk.reservas),
+                    ):
+                        if rows:
+                            self.load(conn, table, columns, rows)
+                            counts[table.name] += len(rows)
+                self.finish(conn)
+        finally:
+            self.restore_fts_triggers()
+        return counts
+
+    def suspend_fts_triggers(self) -> None:
+        """Drop the SQLite triggers indexing clientes_fts row by row.
+
+        Indexing row by row costs more than the inserts themselves; finish()
+        rebuilds the index in one pass instead.
+        """
+        if self.engine.dialect.name == "sqlite":
+            with self.engine.begin() as conn:
+                for trigger in FTS_SUSPENDED_TRIGGERS:
+                    conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+
+    def restore_fts_triggers(self) -> None:
+        if self.engine.dialect.name == "sqlite":
+            with self.engine.begin() as conn:
+                for statement in CLIENTES_FTS_DDL:
+                    if any(trigger in statement for trigger in FTS_SUSPENDED_TRIGGERS):
+                        conn.execute(text(statement))
+
+    def prepare(self, conn: Connection, reset: bool) -> None:
+        for table in self.TABLES:
+            if reset:
+                conn.execute(delete(table))
+            elif conn.scalar(select(exists().select_from(table))):
+                raise ValueError(f"Table {table.name} already has rows; reset the tables to seed them")
+
+    def finish(self, conn: Connection) -> None:
+        # The rows bypassed the repositories, which keep the inventory summary
+        for stmt in build_rebuild_statements():
+            conn.execute(stmt)
+        if self.engine.dialect.name == "sqlite":
+            conn.execute(text("INSERT INTO clientes_fts (clientes_fts) VALUES ('rebuild')"))
+        if self.engine.dialect.name == "postgresql":
+            # The explicit IDs did not advance the sequences
+            for table in (Cliente.__table__, Apartamento.__table__, Venda.__table__, Reserva.__table__):
+                conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                    f"COALESCE(MAX(id), 0) + 1, false) FROM {table.name}"
+                ))
+        conn.execute(text("ANALYZE"))
+
+
+def seed_database(engine: Engine, config: SeedConfig, reset: bool = False) -> Tuple[Dict[str, int], float]:
+    """Seed the database and return the rows per table and the elapsed seconds."""
+    start = time.perf_counter()
+    counts = Seeder(engine, config).seed(reset)
+    return counts, time.perf_counter() - start
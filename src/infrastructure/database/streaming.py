@@ -0,0 +1,27 @@
+from typing import Any, AsyncIterator, Iterator, List, Sequence
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+def export_query(model: Any, columns: Sequence[str]) -> Select:
+    """Select the given columns of every row of model, in ID order."""
+    return select(*(getattr(model, column) for column in columns)).order_by(model.id)
+
+
+def stream_partitions(db: Session, query: Select, batch_size: int) -> Iterator[List[Row]]:
+    """Fetch query results batch_size rows at a time.
+
+    yield_per turns on server-side cursors (stream_results) where the driver
+    supports them, so memory stays bounded by one batch whatever the table size.
+    """
+    result = db.execute(query.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        yield partition
+
+
+async def astream_partitions(db: AsyncSession, query: Select, batch_size: int) -> AsyncIterator[List[Row]]:
+    """Async version of stream_partitions, over AsyncSession.stream()."""
+    result = await db.stream(query.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield partition
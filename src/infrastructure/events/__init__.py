@@ -0,0 +1,13 @@
+from .backplane import InMemoryBackplane, PostgresBackplane
+from .broadcaster import Broadcaster, Subscription
+from .apartamento_events import apartamento_broadcaster, create_backplane, record_status_change
+
+__all__ = [
+    "InMemoryBackplane",
+    "PostgresBackplane",
+    "Broadcaster",
+    "Subscription",
+    "apartamento_broadcaster",
+    "create_backplane",
+    "record_status_change",
+]
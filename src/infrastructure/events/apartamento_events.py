@@ -0,0 +1,50 @@
+from typing import Any
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+from src.infrastructure.database.config import settings
+from .backplane import InMemoryBackplane, PostgresBackplane
+from .broadcaster import Broadcaster
+
+# Session.info key holding the status changes to publish once the transaction commits
+PENDING_EVENTS = "apartamento_status_events"
+
+
+def create_backplane(backplane: str, database_url: str) -> Any:
+    """Build the configured events backplane."""
+    if backplane == "memory":
+        return InMemoryBackplane()
+    if backplane == "postgres":
+        # asyncpg takes a plain libpq URL, without the SQLAlchemy driver suffix
+        dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        return PostgresBackplane(dsn)
+    raise ValueError(f"Unknown events backplane '{backplane}'")
+
+
+def record_status_change(db: Any, apartamento_id: int, numero: str, bloco: str, status: Any) -> None:
+    """Publish an apartamento status change when db commits."""
+    db.info.setdefault(PENDING_EVENTS, []).append(
+        {
+            "apartamento_id": apartamento_id,
+            "numero": numero,
+            "bloco": bloco,
+            "status": getattr(status, "value", status),
+        }
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    for status_change in session.info.pop(PENDING_EVENTS, ()):
+        apartamento_broadcaster.publish(status_change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_EVENTS, None)
+
+
+apartamento_broadcaster = Broadcaster(
+    create_backplane(settings.EVENTS_BACKPLANE, settings.DATABASE_URL),
+    queue_size=settings.EVENTS_QUEUE_SIZE,
+)
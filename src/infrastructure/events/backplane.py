@@ -0,0 +1,176 @@
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+Event = Dict[str, Any]
+Deliver = Callable[[Event], None]
+
+
+class InMemoryBackplane:
+    """Single-process backplane: published events go straight to local subscribers."""
+
+    def __init__(self):
+        self._deliver: Optional[Deliver] = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def stop(self) -> None:
+        self._deliver = None
+
+    def publish(self, event: Event) -> None:
+        if self._deliver is not None:
+            self._deliver(event)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"connected": self._deliver is not None}
+
+
+class PostgresBackplane:
+    """Relays events between workers through PostgreSQL LISTEN/NOTIFY.
+
+    Every worker LISTENs on the channel with one dedicated asyncpg connection;
+    a worker also receives its own notifications, so local subscribers are fed
+    from the same path as remote ones.
+
+    When that connection is lost (or cannot be opened at startup) the backplane
+    reconnects in the background, waiting reconnect_delay seconds and doubling
+    it up to max_reconnect_delay, and LISTENs again. Events published while
+    disconnected are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        channel: str = "apartamento_status",
+        connect: Optional[Callable[[str], Awaitable[Any]]] = None,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+    ):
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._connect = connect
+        self._connection: Any = None
+        self._deliver: Optional[Deliver] = None
+        self._pending: "set[asyncio.Task]" = set()
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+        self.reconnects = 0
+        self.errors = 0
+        self.unsent = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None
+
+    async def start(self, deliver: Deliver) -> None:
+        if self._connect is None:
+            import asyncpg
+
+            self._connect = asyncpg.connect
+        self._deliver = deliver
+        try:
+            await self._listen()
+        except Exception as e:
+            self._record_error("connect failed", e)
+            self._schedule_reconnect()
+
+    async def stop(self) -> None:
+        self._deliver = None
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            await asyncio.gather(self._reconnect_task, return_exceptions=True)
+            self._reconnect_task = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        connection, self._connection = self._connection, None
+        if connection is None:
+            return
+        connection.remove_termination_listener(self._on_termination)
+        try:
+            await connection.remove_listener(self.channel, self._on_notification)
+        finally:
+            await connection.close()
+
+    def publish(self, event: Event) -> None:
+        if self._connection is None:
+            self.unsent += 1
+            return
+        task = asyncio.ensure_future(
+            self._connection.execute("SELECT pg_notify($1, $2)", self.channel, json.dumps(event))
+        )
+        # Keep a reference until the NOTIFY is sent
+        self._pending.add(task)
+        task.add_done_callback(self._on_sent)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "connected": self.connected,
+            "reconnects": self.reconnects,
+            "errors": self.errors,
+            "unsent": self.unsent,
+            "last_error": self.last_error,
+        }
+
+    async def _listen(self) -> None:
+        connection = await self._connect(self.dsn)
+        try:
+            await connection.add_listener(self.channel, self._on_notification)
+        except BaseException:
+            await connection.close()
+            raise
+        connection.add_termination_listener(self._on_termination)
+        self._connection = connection
+
+    def _on_notification(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        if self._deliver is None:
+            return
+        try:
+            event = json.loads(payload)
+        except ValueError as e:
+            self._record_error("invalid notification payload", e)
+            return
+        self._deliver(event)
+
+    def _on_sent(self, task: asyncio.Task) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.unsent += 1
+            self._record_error("NOTIFY failed", task.exception())
+
+    def _on_termination(self, connection: Any) -> None:
+        # Fired when the LISTEN connection closes without stop() being called
+        if connection is not self._connection:
+            return
+        self._connection = None
+        self._record_error("LISTEN connection lost", None)
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self) -> None:
+        if self._deliver is not None and (self._reconnect_task is None or self._reconnect_task.done()):
+            self._reconnect_task = asyncio.ensure_future(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        delay = self.reconnect_delay
+        while self._deliver is not None:
+            await asyncio.sleep(delay)
+            try:
+                await self._listen()
+            except Exception as e:
+                self._record_error("reconnect failed", e)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+            self.reconnects += 1
+            logger.info("Events backplane listening on %s again", self.channel)
+            return
+
+    def _record_error(self, message: str, error: Optional[BaseException]) -> None:
+        self.errors += 1
+        self.last_error = message if error is None else f"{message}: {error!r}"
+        logger.warning("Events backplane %s", self.last_error)
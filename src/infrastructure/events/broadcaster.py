@@ -0,0 +1,107 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional, Set
+from .backplane import Event, InMemoryBackplane
+
+
+class Subscription:
+    """One subscriber's bounded queue of events."""
+
+    def __init__(self, bloco: Optional[str], queue_size: int):
+        self.bloco = bloco
+        self.dropped = 0
+        self._queue: "asyncio.Queue[Event]" = asyncio.Queue(maxsize=queue_size)
+
+    def push(self, event: Event) -> bool:
+        """Queue an event, dropping the oldest one when the subscriber lags behind.
+
+        Returns whether an event was dropped.
+        """
+        dropped = self._queue.full()
+        if dropped:
+            self._queue.get_nowait()
+            self.dropped += 1
+        self._queue.put_nowait(event)
+        return dropped
+
+    async def get(self) -> Event:
+        """Wait for the next event."""
+        return await self._queue.get()
+
+
+class Broadcaster:
+    """Fans events out to subscribers on one event loop.
+
+    Subscribers are indexed by bloco, so publishing only touches the queues
+    that want the event, and every push is a non-blocking put on a bounded
+    queue. publish() is thread-safe: events committed from worker threads
+    are handed over to the loop before reaching the backplane.
+    """
+
+    def __init__(self, backplane: Any = None, queue_size: int = 100):
+        self.backplane = backplane or InMemoryBackplane()
+        self.queue_size = queue_size
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self._subscribers: Dict[Optional[str], Set[Subscription]] = defaultdict(set)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscribers.values())
+
+    async def start(self) -> None:
+        """Bind to the running loop and connect the backplane."""
+        self._loop = asyncio.get_running_loop()
+        await self.backplane.start(self._dispatch)
+
+    async def stop(self) -> None:
+        """Disconnect the backplane; later publishes are dropped."""
+        self._loop = None
+        await self.backplane.stop()
+
+    def subscribe(self, bloco: Optional[str] = None) -> Subscription:
+        """Subscribe to the events of one bloco, or of every bloco when None."""
+        subscription = Subscription(bloco, self.queue_size)
+        self._subscribers[bloco].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering events to a subscription."""
+        self._subscribers[subscription.bloco].discard(subscription)
+
+    def publish(self, event: Event) -> None:
+        """Publish an event from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        with self._lock:
+            self.published += 1
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self.backplane.publish(event)
+        else:
+            loop.call_soon_threadsafe(self.backplane.publish, event)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the subscriber gauges and event counters."""
+        return {
+            "backplane": type(self.backplane).__name__,
+            "subscribers": self.subscriber_count,
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+    def _dispatch(self, event: Event) -> None:
+        for bloco in (event.get("bloco"), None):
+            for subscription in tuple(self._subscribers.get(bloco, ())):
+                if subscription.push(event):
+                    self.dropped += 1
+                self.delivered += 1
@@ -0,0 +1,17 @@
+from .registry import DEFAULT_BUCKETS, Counter, Histogram, MetricsRegistry, metrics_registry
+from .queries import QueryStats, current_query_stats
+from .profiler import ProfiledQuery, QueryProfile, current_query_profile, profile_queries
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Counter",
+    "Histogram",
+    "MetricsRegistry",
+    "metrics_registry",
+    "QueryStats",
+    "current_query_stats",
+    "ProfiledQuery",
+    "QueryProfile",
+    "current_query_profile",
+    "profile_queries",
+]
@@ -0,0 +1,131 @@
+import hashlib
+import logging
+import time
+from collections import Counter as Tally
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+EXPLAIN_PREFIXES = {
+    "sqlite": "EXPLAIN QUERY PLAN ",
+    # Plain EXPLAIN: ANALYZE would run the statement a second time
+    "postgresql": "EXPLAIN ",
+}
+
+
+class ProfiledQuery(NamedTuple):
+    """One SQL statement run while profiling; plan is set for slow SELECTs.
+
+    Parameters are kept as a digest, enough to spot duplicates. An executemany
+    keeps only its row count, since its parameters can be a whole upload.
+    """
+
+    statement: str
+    parameters_digest: Optional[str]
+    seconds: float
+    plan: Optional[str] = None
+    rows: int = 1
+
+
+def parameters_digest(parameters: Any) -> str:
+    """Short fingerprint of a statement's parameters."""
+    return hashlib.blake2b(repr(parameters).encode(), digest_size=16).hexdigest()
+
+
+class QueryProfile:
+    """The SQL statements of one unit of work (usually a request), in order.
+
+    A statement repeated with the same parameters is a duplicate; one repeated
+    with different parameters at least repeat_threshold times is the
+    signature of an N+1 loop.
+    """
+
+    def __init__(self, slow_seconds: float = 0.1, repeat_threshold: int = 5):
+        self.slow_seconds = slow_seconds
+        self.repeat_threshold = repeat_threshold
+        self.queries: List[ProfiledQuery] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def seconds(self) -> float:
+        return sum(query.seconds for query in self.queries)
+
+    def slow(self) -> List[ProfiledQuery]:
+        """Statements that took at least slow_seconds."""
+        return [query for query in self.queries if query.seconds >= self.slow_seconds]
+
+    def duplicates(self) -> List[Tuple[str, int]]:
+        """Statements run more than once with the same parameters, with their run count.
+
+        Executemany batches carry no parameters digest and are never duplicates.
+        """
+        tally = Tally(
+            (query.statement, query.parameters_digest)
+            for query in self.queries
+            if query.parameters_digest is not None
+        )
+        return [(statement, runs) for (statement, _), runs in tally.items() if runs > 1]
+
+    def repeated(self) -> List[Tuple[str, int]]:
+        """Statements run at least repeat_threshold times, with their run count (N+1 suspects)."""
+        tally = Tally(query.statement for query in self.queries)
+        return [(statement, runs) for statement, runs in tally.items() if runs >= self.repeat_threshold]
+
+
+current_query_profile: ContextVar[Optional[QueryProfile]] = ContextVar("current_query_profile", default=None)
+
+
+@contextmanager
+def profile_queries(slow_seconds: float = 0.1, repeat_threshold: int = 5) -> Iterator[QueryProfile]:
+    """Record the SQL statements run in this context, on any engine."""
+    profile = QueryProfile(slow_seconds, repeat_threshold)
+    token = current_query_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        current_query_profile.reset(token)
+
+
+def explain(conn, statement: str, parameters: Any) -> Optional[str]:
+    """Query plan of a SELECT, fetched on a raw DBAPI cursor so it is not profiled itself."""
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+    if prefix is None or not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+        return None
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return "\n".join(" | ".join(str(column) for column in row) for row in cursor.fetchall())
+    except Exception as e:
+        return f"EXPLAIN failed: {e}"
+    finally:
+        cursor.close()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_profile_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and current_query_profile.get() is not None:
+        context._profiler_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _profile_query(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_profiler_started", None)
+    profile = current_query_profile.get()
+    if started is None or profile is None:
+        return
+    seconds = time.perf_counter() - started
+    plan = None
+    if seconds >= profile.slow_seconds and not executemany:
+        plan = explain(conn, statement, parameters)
+        logger.warning("Slow query (%.1fms): %s\n%s", seconds * 1000, statement, plan or "(no plan)")
+    if executemany:
+        profile.queries.append(ProfiledQuery(statement, None, seconds, plan, rows=len(parameters)))
+    else:
+        profile.queries.append(ProfiledQuery(statement, parameters_digest(parameters), seconds, plan))
@@ -1,17 +1,51 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from src.infrastructure.database import settings, engine
+from src.infrastructure.database.config import get_async_engine
+from src.infrastructure.database.pool import pool_status
+from src.infrastructure.auth import password_hasher, principal_cache
+from src.infrastructure.cache import apartamento_cache
+from src.infrastructure.events import apartamento_broadcaster
+from src.infrastructure.metrics import metrics_registry
+from src.presentation.api.metrics import PROMETHEUS_CONTENT_TYPE, MetricsMiddleware
+from src.presentation.api.profiler import QueryProfilerMiddleware
 from src.presentation.api.routes import (
     auth_router,
     clientes_router,
     apartamentos_router,
     vendas_router,
     reservas_router,
+    relatorios_router,
+    async_auth_router,
+    async_clientes_router,
+    async_apartamentos_router,
+    async_vendas_router,
+    async_reservas_router,
+    async_relatorios_router,
 )
+from src.presentation.workers import idempotency_cleanup_worker, reserva_expiration_worker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop the background workers."""
+    await apartamento_broadcaster.start()
+    if settings.RESERVA_EXPIRATION_ENABLED:
+        reserva_expiration_worker.start()
+    if settings.IDEMPOTENCY_CLEANUP_ENABLED:
+        idempotency_cleanup_worker.start()
+    yield
+    await idempotency_cleanup_worker.stop()
+    await reserva_expiration_worker.stop()
+    await apartamento_broadcaster.stop()
+
 
 app = FastAPI(
     title="Direcional API",
     description="API for managing real estate sales",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -21,14 +55,33 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Server-Timing", "Idempotent-Replayed", "ETag"],
 )
 
-# Include routers
-app.include_router(auth_router)
-app.include_router(clientes_router)
-app.include_router(apartamentos_router)
-app.include_router(vendas_router)
-app.include_router(reservas_router)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+if settings.SQL_PROFILER_ENABLED:
+    app.add_middleware(
+        QueryProfilerMiddleware,
+        slow_seconds=settings.SQL_PROFILER_SLOW_QUERY_MS / 1000,
+        repeat_threshold=settings.SQL_PROFILER_REPEAT_THRESHOLD,
+    )
+
+# Include routers (USE_ASYNC_DB switches between the sync and async database stacks)
+if settings.USE_ASYNC_DB:
+    app.include_router(async_auth_router)
+    app.include_router(async_clientes_router)
+    app.include_router(async_apartamentos_router)
+    app.include_router(async_vendas_router)
+    app.include_router(async_reservas_router)
+    app.include_router(async_relatorios_router)
+else:
+    app.include_router(auth_router)
+    app.include_router(clientes_router)
+    app.include_router(apartamentos_router)
+    app.include_router(vendas_router)
+    app.include_router(reservas_router)
+    app.include_router(relatorios_router)
 
 
 @app.get("/")
@@ -43,5 +96,45 @@ async def root():
 
 @app.get("/health")
 async def health():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+    """Health check endpoint; degraded while the events backplane is disconnected."""
+    backplane = apartamento_broadcaster.backplane.stats()
+    return {"status": "healthy" if backplane["connected"] else "degraded", "events_backplane": backplane}
+
+
+@app.get("/health/pool")
+async def health_pool():
+    """Connection pool and password hashing pool gauges and counters."""
+    pools = {"sync": pool_status(engine.pool)}
+    if settings.USE_ASYNC_DB:
+        pools["async"] = pool_status(get_async_engine().pool)
+    pools["password_hasher"] = password_hasher.stats()
+    return pools
+
+
+@app.get("/health/cache")
+async def health_cache():
+    """Cache hit/miss counters."""
+    return {
+        "apartamentos": apartamento_cache.stats(),
+        "principals": {
+            "hits": principal_cache.hits,
+            "misses": principal_cache.misses,
+            "size": len(principal_cache),
+        },
+    }
+
+
+@app.get("/health/workers")
+async def health_workers():
+    """Background worker gauges, counters and lag."""
+    return {
+        "reserva_expiration": reserva_expiration_worker.stats(),
+        "idempotency_cleanup": idempotency_cleanup_worker.stats(),
+        "apartamento_events": apartamento_broadcaster.stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Request, latency and SQL metrics in the Prometheus text format."""
+    return Response(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,82 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional, Tuple
+from fastapi import Request, Response, status
+
+# Responses hold authenticated data: only the client may store them, and it revalidates every reuse
+CACHE_CONTROL = "private, no-cache"
+
+
+def entity_etag(entity_id: int, updated_at: datetime) -> str:
+    """Strong ETag of one resource: an unchanged row always serializes to the same bytes."""
+    return f'"{entity_id}-{updated_at:%Y%m%d%H%M%S%f}"'
+
+
+def collection_etag(stamps: Iterable[Tuple[int, datetime]]) -> str:
+    """Weak ETag of a listing page, from the (id, updated_at) of its items in order."""
+    digest = hashlib.sha256()
+    for entity_id, updated_at in stamps:
+        digest.update(f"{entity_id}:{updated_at.isoformat()};".encode())
+    return f'W/"{digest.hexdigest()[:32]}"'
+
+
+def http_date(updated_at: datetime) -> str:
+    """Format a naive UTC timestamp as an HTTP date."""
+    return format_datetime(updated_at.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def is_conditional(request: Request) -> bool:
+    """Whether the client sent a validator, so checking it first can save the full load."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def unmodified_since(if_modified_since: str, updated_at: datetime) -> bool:
+    """Whether updated_at is not after an If-Modified-Since date; invalid dates never match."""
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    # HTTP dates have a resolution of one second
+    return updated_at.replace(microsecond=0) <= since
+
+
+def set_validators(response: Response, etag: str, updated_at: Optional[datetime] = None) -> None:
+    """Set the ETag, Last-Modified and Cache-Control headers."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if updated_at is not None:
+        response.headers["Last-Modified"] = http_date(updated_at)
+
+
+def not_modified(request: Request, etag: str, updated_at: Optional[datetime] = None) -> Optional[Response]:
+    """A bodiless 304 when the client's copy is current, otherwise None.
+
+    If-Modified-Since is only considered without If-None-Match, and only
+    for resources with a Last-Modified date.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        current = etag_matches(if_none_match, etag)
+    else:
+        current = (
+            updated_at is not None
+            and if_modified_since is not None
+            and unmodified_since(if_modified_since, updated_at)
+        )
+    if not current:
+        return None
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, updated_at)
+    return response
@@ -1,3 +1,3 @@
-from .auth import get_current_user
+from .auth import get_current_user, get_current_user_async
 
-__all__ = ["get_current_user"]
+__all__ = ["get_current_user", "get_current_user_async"]
@@ -1,9 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from src.infrastructure.database import get_db
-from src.infrastructure.auth import decode_access_token
-from src.infrastructure.database.repositories import UsuarioRepository
+from src.infrastructure.database import get_db, get_async_db
+from src.infrastructure.auth import decode_access_token, Principal, principal_cache
+from src.infrastructure.database.repositories import UsuarioRepository, AsyncUsuarioRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
@@ -22,12 +23,49 @@ async def get_current_user(
     if username is None:
         raise credentials_exception
 
-    usuario_repo = UsuarioRepository(db)
-    user = usuario_repo.get_by_username(username)
-    if user is None:
+    # Cached principals skip the usuarios lookup entirely
+    principal = principal_cache.get(username)
+    if principal is None:
+        usuario_repo = UsuarioRepository(db)
+        user = usuario_repo.get_by_username(username)
+        if user is None:
+            raise credentials_exception
+
+        principal = Principal.from_usuario(user)
+        principal_cache.set(username, principal)
+
+    if not principal.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+
+    return principal
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)
+):
+    """Get current authenticated user using the async database stack."""
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    username = decode_access_token(token)
+    if username is None:
         raise credentials_exception
 
-    if not user.is_active:
+    # Cached principals skip the usuarios lookup entirely
+    principal = principal_cache.get(username)
+    if principal is None:
+        usuario_repo = AsyncUsuarioRepository(db)
+        user = await usuario_repo.get_by_username(username)
+        if user is None:
+            raise credentials_exception
+
+        principal = Principal.from_usuario(user)
+        principal_cache.set(username, principal)
+
+    if not principal.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
-    return user
+    return principal
@@ -0,0 +1,42 @@
+from typing import Any, FrozenSet, Type, TypeVar
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+from src.application.dtos import Expansao
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+RELATIONS = frozenset(relation.value for relation in Expansao)
+
+
+def expand_param(
+    expand: str | None = Query(
+        None, description="Comma-separated relations to embed in the response: cliente, apartamento"
+    ),
+) -> FrozenSet[Expansao]:
+    """Read the relations to embed from the expand query parameter."""
+    if not expand:
+        return frozenset()
+    names = [name.strip() for name in expand.split(",") if name.strip()]
+    unknown = [name for name in names if name not in RELATIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot expand {', '.join(unknown)}; expected {', '.join(sorted(RELATIONS))}",
+        )
+    return frozenset(Expansao(name) for name in names)
+
+
+def expand_response(
+    response_model: Type[ResponseModel], item: Any, expand: FrozenSet[Expansao]
+) -> ResponseModel:
+    """Build response_model from item, embedding only the expanded relations.
+
+    Relations left out are never read from item, so they are neither lazy
+    loaded nor, with response_model_exclude_unset, rendered.
+    """
+    data = {
+        name: getattr(item, name)
+        for name in response_model.model_fields
+        if name not in RELATIONS or Expansao(name) in expand
+    }
+    return response_model.model_validate(data, from_attributes=True)
@@ -0,0 +1,154 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Sequence, Type
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+
+class ExportFormat(str, Enum):
+    """File formats of the export endpoints."""
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+# OpenAPI description of the raw CSV body taken by the import endpoints
+CSV_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {MEDIA_TYPES[ExportFormat.CSV]: {"schema": {"type": "string", "format": "binary"}}},
+    }
+}
+
+
+def export_columns(schema: Type[BaseModel]) -> List[str]:
+    """Columns of an export: the fields of the response schema, ID first."""
+    return ["id"] + [field for field in schema.model_fields if field != "id"]
+
+
+# Converters looked up by exact type: one dict lookup per value instead of
+# an isinstance chain, which dominates the cost of large exports
+_JSON_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: float,
+}
+_CSV_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    **_JSON_CONVERTERS,
+    # Keep the exact NUMERIC value in CSV
+    Decimal: str,
+    bool: lambda value: "true" if value else "false",
+}
+
+
+def _convert(converters: Dict[type, Callable[[Any], Any]], row: Sequence[Any]) -> List[Any]:
+    values = []
+    for value in row:
+        converter = converters.get(type(value))
+        values.append(value if converter is None else converter(value))
+    return values
+
+
+class ExportEncoder:
+    """Encodes batches of rows as CSV or NDJSON bytes, optionally gzip-compressed."""
+
+    def __init__(self, columns: Sequence[str], format: ExportFormat, compress: bool = False):
+        self.columns = list(columns)
+        self.format = format
+        # wbits=31 writes the gzip container, so the output is a regular .gz file
+        self._compressor = zlib.compressobj(wbits=31) if compress else None
+
+    def header(self) -> bytes:
+        """Bytes written before the first row."""
+        if self.format == ExportFormat.CSV:
+            return self._output(self._csv([self.columns]))
+        return b""
+
+    def encode(self, rows: Iterable[Sequence[Any]]) -> bytes:
+        """Encode one batch of rows."""
+        if self.format == ExportFormat.CSV:
+            return self._output(self._csv(_convert(_CSV_CONVERTERS, row) for row in rows))
+        lines = (
+            json.dumps(dict(zip(self.columns, _convert(_JSON_CONVERTERS, row)))) + "\n" for row in rows
+        )
+        return self._output("".join(lines))
+
+    def finish(self) -> bytes:
+        """Bytes written after the last row."""
+        return self._compressor.flush() if self._compressor is not None else b""
+
+    def _csv(self, rows: Iterable[Sequence[Any]]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(rows)
+        return buffer.getvalue()
+
+    def _output(self, text: str) -> bytes:
+        data = text.encode("utf-8")
+        return self._compressor.compress(data) if self._compressor is not None else data
+
+
+def _streaming_response(body: Any, name: str, format: ExportFormat, compress: bool) -> StreamingResponse:
+    filename = f"{name}.{format.value}" + (".gz" if compress else "")
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if compress else MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def export_response(
+    db: Any,
+    columns: Sequence[str],
+    batches: Iterator[Sequence[Sequence[Any]]],
+    name: str,
+    format: ExportFormat,
+    compress: bool = False,
+) -> StreamingResponse:
+    """Stream batches of rows as a file download, one chunk per batch."""
+    encoder = ExportEncoder(columns, format, compress)
+
+    def body() -> Iterator[bytes]:
+        # The response outlives the request's session dependency, so the
+        # generator owns the session and releases it when the download ends
+        try:
+            yield encoder.header()
+            for rows in batches:
+                yield encoder.encode(rows)
+            yield encoder.finish()
+        finally:
+            db.close()
+
+    return _streaming_response(body(), name, format, compress)
+
+
+def async_export_response(
+    db: Any,
+    columns: Sequence[str],
+    batches: AsyncIterator[Sequence[Sequence[Any]]],
+    name: str,
+    format: ExportFormat,
+    compress: bool = False,
+) -> StreamingResponse:
+    """Async version of export_response, for batches from an AsyncSession."""
+    encoder = ExportEncoder(columns, format, compress)
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            yield encoder.header()
+            async for rows in batches:
+                yield encoder.encode(rows)
+            yield encoder.finish()
+        finally:
+            await db.close()
+
+    return _streaming_response(body(), name, format, compress)
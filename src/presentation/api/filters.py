@@ -0,0 +1,33 @@
+from typing import List
+from fastapi import Query
+from src.application.dtos import ApartamentoFiltro, OrdenacaoApartamentos
+from src.infrastructure.database.models.apartamento import StatusApartamento
+
+
+def apartamento_filtro(
+    status: StatusApartamento | None = Query(None, description="Filter by status"),
+    bloco: str | None = Query(None, description="Filter by bloco"),
+    quartos: List[int] | None = Query(None, description="Accepted numbers of quartos; repeat to accept several"),
+    min_preco: float | None = Query(None, ge=0, description="Minimum preco"),
+    max_preco: float | None = Query(None, ge=0, description="Maximum preco"),
+    min_area: float | None = Query(None, ge=0, description="Minimum area"),
+    max_area: float | None = Query(None, ge=0, description="Maximum area"),
+    min_andar: int | None = Query(None, ge=0, description="Lowest andar"),
+    max_andar: int | None = Query(None, ge=0, description="Highest andar"),
+    sort: OrdenacaoApartamentos = Query(
+        OrdenacaoApartamentos.ID, description="Sort by id, preco or area; prefix with '-' for descending"
+    ),
+) -> ApartamentoFiltro:
+    """Read the apartamentos search filters from the query string."""
+    return ApartamentoFiltro(
+        status=status,
+        bloco=bloco,
+        quartos=quartos,
+        min_preco=min_preco,
+        max_preco=max_preco,
+        min_area=min_area,
+        max_area=max_area,
+        min_andar=min_andar,
+        max_andar=max_andar,
+        sort=sort,
+    )
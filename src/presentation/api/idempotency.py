@@ -0,0 +1,98 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Optional
+from fastapi import Header, Response, status
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.application.dtos import IdempotentRequest
+from src.application.use_cases import AsyncIdempotencyService, IdempotencyService
+from src.infrastructure.database import settings
+from src.infrastructure.database.models import IdempotencyKey
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+
+def idempotency_key_header(
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias=IDEMPOTENCY_KEY_HEADER,
+        min_length=1,
+        max_length=255,
+        description="Client-generated key; retries with the same key replay the first response",
+    ),
+) -> Optional[str]:
+    """Read the optional Idempotency-Key header."""
+    return idempotency_key
+
+
+def idempotent_request(
+    current_user: Any,
+    endpoint: str,
+    key: Optional[str],
+    body: BaseModel,
+    status_code: int = status.HTTP_201_CREATED,
+) -> Optional[IdempotentRequest]:
+    """Describe a keyed request, or return None when no key was sent."""
+    if key is None:
+        return None
+    return IdempotentRequest(
+        usuario_id=current_user.id,
+        endpoint=endpoint,
+        key=key,
+        fingerprint=hashlib.sha256(body.model_dump_json().encode()).hexdigest(),
+        status_code=status_code,
+        expires_at=datetime.utcnow() + timedelta(hours=settings.IDEMPOTENCY_KEY_TTL_HOURS),
+    )
+
+
+def replay_response(stored: IdempotencyKey) -> Response:
+    """The stored first response, sent as is without validating it again."""
+    return Response(
+        stored.response_body,
+        status_code=stored.status_code,
+        media_type="application/json",
+        headers={REPLAYED_HEADER: "true"},
+    )
+
+
+def run_idempotent(db: Session, request: Optional[IdempotentRequest], create: Callable[[], Any]) -> Any:
+    """Run create once per key, answering retries with the stored response.
+
+    Raises IdempotencyKeyReusedError when the key was sent with another body.
+    """
+    if request is None:
+        return create()
+    idempotency_service = IdempotencyService(db)
+    stored = idempotency_service.find(request)
+    if stored is None:
+        try:
+            return create()
+        except ValueError:
+            # A retry racing the first try fails on the unit that try took;
+            # once the first try has committed, answer with its response
+            stored = idempotency_service.find(request)
+            if stored is None:
+                raise
+    return replay_response(stored)
+
+
+async def run_idempotent_async(
+    db: AsyncSession, request: Optional[IdempotentRequest], create: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Async version of run_idempotent."""
+    if request is None:
+        return await create()
+    idempotency_service = AsyncIdempotencyService(db)
+    stored = await idempotency_service.find(request)
+    if stored is None:
+        try:
+            return await create()
+        except ValueError:
+            # A retry racing the first try fails on the unit that try took;
+            # once the first try has committed, answer with its response
+            stored = await idempotency_service.find(request)
+            if stored is None:
+                raise
+    return replay_response(stored)
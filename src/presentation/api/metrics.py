@@ -0,0 +1,76 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.metrics import MetricsRegistry, QueryStats, current_query_stats, metrics_registry
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Route label of requests that matched no route, so unknown paths cannot blow up the series count
+UNMATCHED_ROUTE = "unmatched"
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class HttpMetrics:
+    """Per-route request, latency and database query metrics."""
+
+    def __init__(self, registry: MetricsRegistry):
+        labels = ("method", "route")
+        self.requests = registry.counter(
+            "http_requests_total", "Requests handled, by route template and status code", labels + ("status",)
+        )
+        self.duration = registry.histogram(
+            "http_request_duration_seconds", "Time to handle a request, response body included", labels
+        )
+        self.queries = registry.histogram(
+            "http_request_db_queries", "SQL statements run per request", labels, buckets=QUERY_COUNT_BUCKETS
+        )
+        self.query_seconds = registry.counter(
+            "http_request_db_query_seconds_total", "Time spent in SQL statements", labels
+        )
+
+    def record(self, method: str, route: str, status: int, seconds: float, queries: QueryStats) -> None:
+        """Record one finished request."""
+        labels = (method, route)
+        self.requests.inc(labels + (str(status),))
+        self.duration.observe(labels, seconds)
+        self.queries.observe(labels, queries.count)
+        self.query_seconds.inc(labels, queries.seconds)
+
+
+http_metrics = HttpMetrics(metrics_registry)
+
+
+class MetricsMiddleware:
+    """ASGI middleware feeding http_metrics.
+
+    Requests are labelled by route template (/vendas/{venda_id}), not by
+    path. The SQL statements of a request are counted by the engine event
+    hooks into a QueryStats bound to the request context.
+    """
+
+    def __init__(self, app: ASGIApp, metrics: HttpMetrics = http_metrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        queries = QueryStats()
+        token = current_query_stats.set(queries)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            current_query_stats.reset(token)
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self.metrics.record(scope["method"], route, status, elapsed, queries)
@@ -0,0 +1,57 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, Optional, Sequence, Tuple
+from fastapi import HTTPException, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(last_id: int, sorted_by: Optional[str] = None, last_value: Any = None) -> str:
+    """Encode the last seen ID, and its sort value for sorted listings, as an opaque cursor."""
+    payload: Dict[str, Any] = {"id": last_id}
+    if sorted_by is not None:
+        payload[sorted_by] = last_value
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _decode_payload(cursor: str) -> Dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, ValueError):
+        payload = None
+    if not isinstance(payload, dict) or not isinstance(payload.get("id"), int):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return payload
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Decode an opaque cursor into the last seen ID."""
+    if cursor is None:
+        return None
+    return _decode_payload(cursor)["id"]
+
+
+def decode_sorted_cursor(
+    cursor: Optional[str], sorted_by: Optional[str]
+) -> Tuple[Optional[int], Optional[float]]:
+    """Decode a cursor of a listing sorted by sorted_by and id into the last seen ID and value."""
+    if cursor is None:
+        return None, None
+    payload = _decode_payload(cursor)
+    if sorted_by is None:
+        return payload["id"], None
+    value = payload.get(sorted_by)
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return payload["id"], value
+
+
+def set_next_cursor(response: Response, items: Sequence, limit: int, sorted_by: Optional[str] = None) -> None:
+    """Set the X-Next-Cursor header when a full page was returned."""
+    if limit > 0 and len(items) == limit:
+        last = items[-1]
+        last_value = getattr(last, sorted_by) if sorted_by is not None else None
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.id, sorted_by, last_value)
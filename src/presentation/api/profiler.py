@@ -0,0 +1,58 @@
+import logging
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.metrics import QueryProfile, profile_queries
+
+logger = logging.getLogger(__name__)
+
+
+def server_timing(profile: QueryProfile, elapsed: float) -> str:
+    """Summarize a request's SQL as a Server-Timing header value (durations in ms)."""
+    description = f"{profile.count} {'query' if profile.count == 1 else 'queries'}"
+    duplicates = sum(runs - 1 for _, runs in profile.duplicates())
+    if duplicates:
+        description += f", {duplicates} duplicates"
+    return f'db;dur={profile.seconds * 1000:.2f};desc="{description}", app;dur={elapsed * 1000:.2f}'
+
+
+def report(request: str, profile: QueryProfile) -> None:
+    """Log the duplicate statements and N+1 suspects of a request."""
+    for statement, runs in profile.duplicates():
+        logger.warning("Duplicate query on %s, run %d times: %s", request, runs, statement)
+    for statement, runs in profile.repeated():
+        logger.warning("Possible N+1 on %s, statement run %d times: %s", request, runs, statement)
+
+
+class QueryProfilerMiddleware:
+    """ASGI middleware profiling the SQL statements of every request.
+
+    Slow statements are logged with their plan as they finish; duplicates and
+    N+1 suspects are logged once the request is done. Responses carry a
+    Server-Timing header with the SQL time and count up to the response start.
+    """
+
+    def __init__(self, app: ASGIApp, slow_seconds: float = 0.1, repeat_threshold: int = 5):
+        self.app = app
+        self.slow_seconds = slow_seconds
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with profile_queries(self.slow_seconds, self.repeat_threshold) as profile:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(profile, time.perf_counter() - started))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                route = getattr(scope.get("route"), "path", scope["path"])
+                report(f"{scope['method']} {route}", profile)
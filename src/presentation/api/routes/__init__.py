@@ -3,6 +3,13 @@ from .clientes import router as clientes_router
 from .apartamentos import router as apartamentos_router
 from .vendas import router as vendas_router
 from .reservas import router as reservas_router
+from .relatorios import router as relatorios_router
+from .async_auth import router as async_auth_router
+from .async_clientes import router as async_clientes_router
+from .async_apartamentos import router as async_apartamentos_router
+from .async_vendas import router as async_vendas_router
+from .async_reservas import router as async_reservas_router
+from .async_relatorios import router as async_relatorios_router
 
 __all__ = [
     "auth_router",
@@ -10,4 +17,11 @@ __all__ = [
     "apartamentos_router",
     "vendas_router",
     "reservas_router",
+    "relatorios_router",
+    "async_auth_router",
+    "async_clientes_router",
+    "async_apartamentos_router",
+    "async_vendas_router",
+    "async_reservas_router",
+    "async_relatorios_router",
 ]
@@ -1,11 +1,31 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from src.infrastructure.database import get_db
+from src.infrastructure.database import get_db, settings
+from src.infrastructure.events import apartamento_broadcaster
+from src.domain.exceptions import ConcurrentUpdateError
 from src.application.use_cases import ApartamentoService
-from src.application.dtos import ApartamentoCreate, ApartamentoUpdate, ApartamentoResponse
-from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.application.dtos import (
+    ApartamentoCreate,
+    ApartamentoBulkCreate,
+    ApartamentoUpdate,
+    ApartamentoFiltro,
+    ApartamentoResponse,
+    ApartamentoResumoResponse,
+    BulkCreateResponse,
+)
+from src.presentation.api.conditional import (
+    collection_etag,
+    entity_etag,
+    is_conditional,
+    not_modified,
+    set_validators,
+)
 from src.presentation.api.dependencies import get_current_user
+from src.presentation.api.filters import apartamento_filtro
+from src.presentation.api.pagination import decode_sorted_cursor, set_next_cursor
+from src.presentation.api.sse import status_event_stream
 
 router = APIRouter(prefix="/apartamentos", tags=["Apartamentos"])
 
@@ -26,33 +46,96 @@ async def create_apartamento(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def create_apartamentos_bulk(
+    bulk_data: ApartamentoBulkCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Create a batch of apartamentos, returning one result per item."""
+    try:
+        apartamento_service = ApartamentoService(db)
+        return apartamento_service.create_apartamentos_bulk(bulk_data.items)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get("/", response_model=List[ApartamentoResponse])
 async def get_apartamentos(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
-    status: StatusApartamento | None = Query(None, description="Filter by status"),
+    cursor: str | None = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    filtro: ApartamentoFiltro = Depends(apartamento_filtro),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Get all apartamentos, optionally filtered by status."""
+    """Get all apartamentos, filtered and sorted in the database; 304 when the page is unchanged."""
+    sorted_by = filtro.sort.field
+    after_id, after_value = decode_sorted_cursor(cursor, sorted_by)
     apartamento_service = ApartamentoService(db)
-    if status:
-        return apartamento_service.get_apartamentos_by_status(status, skip, limit)
-    return apartamento_service.get_all_apartamentos(skip, limit)
+    if is_conditional(request):
+        stamps = apartamento_service.search_apartamentos_updated_at(
+            filtro, skip, limit, after_id, after_value
+        )
+        unchanged = not_modified(request, collection_etag(stamps))
+        if unchanged is not None:
+            return unchanged
+    apartamentos = apartamento_service.search_apartamentos(filtro, skip, limit, after_id, after_value)
+    set_next_cursor(response, apartamentos, limit, sorted_by)
+    set_validators(response, collection_etag((item.id, item.updated_at) for item in apartamentos))
+    return apartamentos
+
+
+@router.get("/resumo", response_model=ApartamentoResumoResponse)
+async def get_apartamentos_resumo(
+    bloco: str | None = Query(None, description="Only summarize this bloco"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Get the number of apartamentos per status, per bloco and andar."""
+    apartamento_service = ApartamentoService(db)
+    return apartamento_service.get_resumo(bloco)
+
+
+@router.get("/stream")
+async def stream_apartamento_status(
+    bloco: str | None = Query(None, description="Only stream changes of this bloco"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Stream apartamento status changes as Server-Sent Events."""
+    # The stream can stay open for hours: hand the authentication connection back to the pool
+    db.close()
+    return StreamingResponse(
+        status_event_stream(apartamento_broadcaster, bloco, settings.EVENTS_KEEPALIVE_SECONDS),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.get("/{apartamento_id}", response_model=ApartamentoResponse)
 async def get_apartamento(
     apartamento_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Get an apartamento by ID."""
+    """Get an apartamento by ID; 304 when If-None-Match or If-Modified-Since still hold."""
     try:
         apartamento_service = ApartamentoService(db)
-        return apartamento_service.get_apartamento(apartamento_id)
+        if is_conditional(request):
+            updated_at = apartamento_service.get_apartamento_updated_at(apartamento_id)
+            unchanged = not_modified(request, entity_etag(apartamento_id, updated_at), updated_at)
+            if unchanged is not None:
+                return unchanged
+        apartamento = apartamento_service.get_apartamento(apartamento_id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    set_validators(response, entity_etag(apartamento.id, apartamento.updated_at), apartamento.updated_at)
+    return apartamento
 
 
 @router.get("/{apartamento_id}/disponibilidade")
@@ -81,6 +164,8 @@ async def update_apartamento(
     try:
         apartamento_service = ApartamentoService(db)
         return apartamento_service.update_apartamento(apartamento_id, apartamento_data)
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -95,5 +180,7 @@ async def delete_apartamento(
     try:
         apartamento_service = ApartamentoService(db)
         apartamento_service.delete_apartamento(apartamento_id)
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database import get_async_db
+from src.infrastructure.auth import PasswordHasherBusyError
+from src.application.use_cases import AsyncAuthService
+from src.application.dtos import UserCreate, Token, UserLogin
+from src.presentation.api.dependencies import get_current_user_async
+
+router = APIRouter(prefix="/auth", tags=["Authentication"])
+
+
+@router.post("/register", status_code=status.HTTP_201_CREATED)
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """Register a new user."""
+    try:
+        auth_service = AsyncAuthService(db)
+        user = await auth_service.register(user_data)
+        return {"message": "User created successfully", "username": user.username}
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+
+@router.post("/login", response_model=Token)
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    """Login and get access token."""
+    auth_service = AsyncAuthService(db)
+    try:
+        token = await auth_service.authenticate(user_data)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect username or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return token
+
+
+@router.post("/deactivate", status_code=status.HTTP_204_NO_CONTENT)
+async def deactivate(
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Deactivate the current user's account.
+
+    Takes effect at once on this worker; other workers keep the cached
+    principal for up to AUTH_CACHE_TTL_SECONDS.
+    """
+    try:
+        await AsyncAuthService(db).set_user_active(current_user.username, False)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
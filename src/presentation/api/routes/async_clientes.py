@@ -0,0 +1,180 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database import get_async_db, settings
+from src.application.use_cases import AsyncClienteService
+from src.application.dtos import (
+    ClienteCreate,
+    ClienteBulkCreate,
+    ClienteUpdate,
+    ClienteResponse,
+    BulkCreateResponse,
+    ClienteImportResponse,
+)
+from src.presentation.api.conditional import (
+    collection_etag,
+    entity_etag,
+    is_conditional,
+    not_modified,
+    set_validators,
+)
+from src.presentation.api.dependencies import get_current_user_async
+from src.presentation.api.export import CSV_REQUEST_BODY, ExportFormat, export_columns, async_export_response
+from src.presentation.api.pagination import decode_cursor, set_next_cursor
+
+router = APIRouter(prefix="/clientes", tags=["Clientes"])
+
+
+@router.post(
+    "/", response_model=ClienteResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_cliente(
+    cliente_data: ClienteCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Create a new cliente."""
+    try:
+        cliente_service = AsyncClienteService(db)
+        return await cliente_service.create_cliente(cliente_data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def create_clientes_bulk(
+    bulk_data: ClienteBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Create a batch of clientes, returning one result per item."""
+    try:
+        cliente_service = AsyncClienteService(db)
+        return await cliente_service.create_clientes_bulk(bulk_data.items)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/import", response_model=ClienteImportResponse, openapi_extra=CSV_REQUEST_BODY)
+async def import_clientes(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Import clientes from a CSV body (nome,cpf,email,telefone), upserting by CPF.
+
+    The body is read as it arrives and written in chunks; invalid rows are
+    reported without aborting the import.
+    """
+    try:
+        cliente_service = AsyncClienteService(db)
+        return await cliente_service.import_clientes(
+            request.stream(), settings.CLIENTE_IMPORT_CHUNK_SIZE
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/", response_model=List[ClienteResponse])
+async def get_clientes(
+    request: Request,
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Get all clientes; 304 when the page is unchanged."""
+    after_id = decode_cursor(cursor)
+    cliente_service = AsyncClienteService(db)
+    if is_conditional(request):
+        stamps = await cliente_service.get_all_clientes_updated_at(skip, limit, after_id)
+        unchanged = not_modified(request, collection_etag(stamps))
+        if unchanged is not None:
+            return unchanged
+    clientes = await cliente_service.get_all_clientes(skip, limit, after_id)
+    set_next_cursor(response, clientes, limit)
+    set_validators(response, collection_etag((cliente.id, cliente.updated_at) for cliente in clientes))
+    return clientes
+
+
+@router.get("/search", response_model=List[ClienteResponse])
+async def search_clientes(
+    q: str = Query(..., description="CPF prefix, or part of the nome, email or telefone"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Search clientes, best matches first."""
+    try:
+        cliente_service = AsyncClienteService(db)
+        return await cliente_service.search_clientes(q, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/export")
+async def export_clientes(
+    format: ExportFormat = Query(ExportFormat.CSV, description="File format"),
+    gzip: bool = Query(False, description="Compress the file with gzip"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Export every cliente as a CSV or NDJSON file, streamed in batches."""
+    columns = export_columns(ClienteResponse)
+    cliente_service = AsyncClienteService(db)
+    batches = cliente_service.export_clientes(columns, settings.EXPORT_BATCH_SIZE)
+    return async_export_response(db, columns, batches, "clientes", format, gzip)
+
+
+@router.get("/{cliente_id}", response_model=ClienteResponse)
+async def get_cliente(
+    cliente_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Get a cliente by ID; 304 when If-None-Match or If-Modified-Since still hold."""
+    try:
+        cliente_service = AsyncClienteService(db)
+        if is_conditional(request):
+            updated_at = await cliente_service.get_cliente_updated_at(cliente_id)
+            unchanged = not_modified(request, entity_etag(cliente_id, updated_at), updated_at)
+            if unchanged is not None:
+                return unchanged
+        cliente = await cliente_service.get_cliente(cliente_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    set_validators(response, entity_etag(cliente.id, cliente.updated_at), cliente.updated_at)
+    return cliente
+
+
+@router.put("/{cliente_id}", response_model=ClienteResponse)
+async def update_cliente(
+    cliente_id: int,
+    cliente_data: ClienteUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Update a cliente."""
+    try:
+        cliente_service = AsyncClienteService(db)
+        return await cliente_service.update_cliente(cliente_id, cliente_data)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.delete("/{cliente_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_cliente(
+    cliente_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Delete a cliente."""
+    try:
+        cliente_service = AsyncClienteService(db)
+        await cliente_service.delete_cliente(cliente_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,26 @@
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database import get_async_db
+from src.application.use_cases import AsyncVendaService
+from src.application.dtos import AgrupamentoVendas, RelatorioVendasResponse
+from src.presentation.api.dependencies import get_current_user_async
+
+router = APIRouter(prefix="/relatorios", tags=["Relatórios"])
+
+
+@router.get("/vendas", response_model=RelatorioVendasResponse)
+async def get_relatorio_vendas(
+    group_by: AgrupamentoVendas | None = Query(None, description="Group the totals by this dimension"),
+    data_inicio: date | None = Query(None, description="Include vendas from this date on"),
+    data_fim: date | None = Query(None, description="Include vendas before this date (exclusive)"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of groups"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Get vendas totals, average ticket and entrada ratio."""
+    try:
+        venda_service = AsyncVendaService(db)
+        return await venda_service.get_relatorio(group_by, data_inicio, data_fim, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
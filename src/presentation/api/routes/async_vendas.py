@@ -0,0 +1,100 @@
+from typing import FrozenSet, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.infrastructure.database import get_async_db, settings
+from src.domain.exceptions import ConcurrentUpdateError, IdempotencyKeyReusedError
+from src.application.use_cases import AsyncVendaService
+from src.application.dtos import Expansao, VendaCreate, VendaResponse, VendaExpandidaResponse
+from src.presentation.api.dependencies import get_current_user_async
+from src.presentation.api.expand import expand_param, expand_response
+from src.presentation.api.idempotency import idempotency_key_header, idempotent_request, run_idempotent_async
+from src.presentation.api.export import ExportFormat, export_columns, async_export_response
+from src.presentation.api.pagination import decode_cursor, set_next_cursor
+
+router = APIRouter(prefix="/vendas", tags=["Vendas"])
+
+
+@router.post("/", response_model=VendaResponse, status_code=status.HTTP_201_CREATED)
+async def create_venda(
+    venda_data: VendaCreate,
+    idempotency_key: Optional[str] = Depends(idempotency_key_header),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Create a new venda; retries with the same Idempotency-Key replay the first response."""
+    try:
+        venda_service = AsyncVendaService(db)
+        idempotency = idempotent_request(current_user, "POST /vendas", idempotency_key, venda_data)
+        return await run_idempotent_async(
+            db, idempotency, lambda: venda_service.create_venda(venda_data, idempotency)
+        )
+    except IdempotencyKeyReusedError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/", response_model=List[VendaExpandidaResponse], response_model_exclude_unset=True)
+async def get_vendas(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    expand: FrozenSet[Expansao] = Depends(expand_param),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Get all vendas."""
+    after_id = decode_cursor(cursor)
+    venda_service = AsyncVendaService(db)
+    vendas = await venda_service.get_all_vendas(skip, limit, after_id, expand)
+    set_next_cursor(response, vendas, limit)
+    return [expand_response(VendaExpandidaResponse, venda, expand) for venda in vendas]
+
+
+@router.get("/export")
+async def export_vendas(
+    format: ExportFormat = Query(ExportFormat.CSV, description="File format"),
+    gzip: bool = Query(False, description="Compress the file with gzip"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Export every venda as a CSV or NDJSON file, streamed in batches."""
+    columns = export_columns(VendaResponse)
+    venda_service = AsyncVendaService(db)
+    batches = venda_service.export_vendas(columns, settings.EXPORT_BATCH_SIZE)
+    return async_export_response(db, columns, batches, "vendas", format, gzip)
+
+
+@router.get("/{venda_id}", response_model=VendaExpandidaResponse, response_model_exclude_unset=True)
+async def get_venda(
+    venda_id: int,
+    expand: FrozenSet[Expansao] = Depends(expand_param),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Get a venda by ID."""
+    try:
+        venda_service = AsyncVendaService(db)
+        venda = await venda_service.get_venda(venda_id, expand)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return expand_response(VendaExpandidaResponse, venda, expand)
+
+
+@router.delete("/{venda_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_venda(
+    venda_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async),
+):
+    """Delete a venda."""
+    try:
+        venda_service = AsyncVendaService(db)
+        await venda_service.delete_venda(venda_id)
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from src.infrastructure.database import get_db
+from src.infrastructure.auth import PasswordHasherBusyError
 from src.application.use_cases import AuthService
 from src.application.dtos import UserCreate, Token, UserLogin
+from src.presentation.api.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -12,17 +14,22 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     """Register a new user."""
     try:
         auth_service = AuthService(db)
-        user = auth_service.register(user_data)
+        user = await auth_service.register(user_data)
         return {"message": "User created successfully", "username": user.username}
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except PasswordHasherBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
 
 
 @router.post("/login", response_model=Token)
 async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     """Login and get access token."""
     auth_service = AuthService(db)
-    token = auth_service.authenticate(user_data)
+    try:
+        token = await auth_service.authenticate(user_data)
+    except PasswordHasherBusyError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
 
     if not token:
         raise HTTPException(
@@ -32,3 +39,19 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
         )
 
     return token
+
+
+@router.post("/deactivate", status_code=status.HTTP_204_NO_CONTENT)
+async def deactivate(
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Deactivate the current user's account.
+
+    Takes effect at once on this worker; other workers keep the cached
+    principal for up to AUTH_CACHE_TTL_SECONDS.
+    """
+    try:
+        AuthService(db).set_user_active(current_user.username, False)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
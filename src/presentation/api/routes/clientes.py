@@ -1,10 +1,26 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.orm import Session
-from src.infrastructure.database import get_db
+from src.infrastructure.database import get_db, settings
 from src.application.use_cases import ClienteService
-from src.application.dtos import ClienteCreate, ClienteUpdate, ClienteResponse
+from src.application.dtos import (
+    ClienteCreate,
+    ClienteBulkCreate,
+    ClienteUpdate,
+    ClienteResponse,
+    BulkCreateResponse,
+    ClienteImportResponse,
+)
+from src.presentation.api.conditional import (
+    collection_etag,
+    entity_etag,
+    is_conditional,
+    not_modified,
+    set_validators,
+)
 from src.presentation.api.dependencies import get_current_user
+from src.presentation.api.export import CSV_REQUEST_BODY, ExportFormat, export_columns, export_response
+from src.presentation.api.pagination import decode_cursor, set_next_cursor
 
 router = APIRouter(prefix="/clientes", tags=["Clientes"])
 
@@ -25,30 +41,115 @@ async def create_cliente(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def create_clientes_bulk(
+    bulk_data: ClienteBulkCreate,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Create a batch of clientes, returning one result per item."""
+    try:
+        cliente_service = ClienteService(db)
+        return cliente_service.create_clientes_bulk(bulk_data.items)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/import", response_model=ClienteImportResponse, openapi_extra=CSV_REQUEST_BODY)
+async def import_clientes(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Import clientes from a CSV body (nome,cpf,email,telefone), upserting by CPF.
+
+    The body is read as it arrives and written in chunks; invalid rows are
+    reported without aborting the import.
+    """
+    try:
+        cliente_service = ClienteService(db)
+        importer = cliente_service.start_import(settings.CLIENTE_IMPORT_CHUNK_SIZE)
+        async for piece in request.stream():
+            importer.feed(piece)
+        return importer.finish()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.get("/", response_model=List[ClienteResponse])
 async def get_clientes(
+    request: Request,
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Get all clientes; 304 when the page is unchanged."""
+    after_id = decode_cursor(cursor)
+    cliente_service = ClienteService(db)
+    if is_conditional(request):
+        stamps = cliente_service.get_all_clientes_updated_at(skip, limit, after_id)
+        unchanged = not_modified(request, collection_etag(stamps))
+        if unchanged is not None:
+            return unchanged
+    clientes = cliente_service.get_all_clientes(skip, limit, after_id)
+    set_next_cursor(response, clientes, limit)
+    set_validators(response, collection_etag((cliente.id, cliente.updated_at) for cliente in clientes))
+    return clientes
+
+
+@router.get("/search", response_model=List[ClienteResponse])
+async def search_clientes(
+    q: str = Query(..., description="CPF prefix, or part of the nome, email or telefone"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Search clientes, best matches first."""
+    try:
+        cliente_service = ClienteService(db)
+        return cliente_service.search_clientes(q, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get("/export")
+async def export_clientes(
+    format: ExportFormat = Query(ExportFormat.CSV, description="File format"),
+    gzip: bool = Query(False, description="Compress the file with gzip"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Get all clientes."""
+    """Export every cliente as a CSV or NDJSON file, streamed in batches."""
+    columns = export_columns(ClienteResponse)
     cliente_service = ClienteService(db)
-    return cliente_service.get_all_clientes(skip, limit)
+    batches = cliente_service.export_clientes(columns, settings.EXPORT_BATCH_SIZE)
+    return export_response(db, columns, batches, "clientes", format, gzip)
 
 
 @router.get("/{cliente_id}", response_model=ClienteResponse)
 async def get_cliente(
     cliente_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Get a cliente by ID."""
+    """Get a cliente by ID; 304 when If-None-Match or If-Modified-Since still hold."""
     try:
         cliente_service = ClienteService(db)
-        return cliente_service.get_cliente(cliente_id)
+        if is_conditional(request):
+            updated_at = cliente_service.get_cliente_updated_at(cliente_id)
+            unchanged = not_modified(request, entity_etag(cliente_id, updated_at), updated_at)
+            if unchanged is not None:
+                return unchanged
+        cliente = cliente_service.get_cliente(cliente_id)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    set_validators(response, entity_etag(cliente.id, cliente.updated_at), cliente.updated_at)
+    return cliente
 
 
 @router.put("/{cliente_id}", response_model=ClienteResponse)
@@ -1,10 +1,15 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import FrozenSet, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
-from src.infrastructure.database import get_db
+from src.infrastructure.database import get_db, settings
+from src.domain.exceptions import ConcurrentUpdateError, IdempotencyKeyReusedError
 from src.application.use_cases import ReservaService
-from src.application.dtos import ReservaCreate, ReservaResponse
+from src.application.dtos import Expansao, ReservaCreate, ReservaResponse, ReservaExpandidaResponse
 from src.presentation.api.dependencies import get_current_user
+from src.presentation.api.expand import expand_param, expand_response
+from src.presentation.api.idempotency import idempotency_key_header, idempotent_request, run_idempotent
+from src.presentation.api.export import ExportFormat, export_columns, export_response
+from src.presentation.api.pagination import decode_cursor, set_next_cursor
 
 router = APIRouter(prefix="/reservas", tags=["Reservas"])
 
@@ -12,41 +17,71 @@ router = APIRouter(prefix="/reservas", tags=["Reservas"])
 @router.post("/", response_model=ReservaResponse, status_code=status.HTTP_201_CREATED)
 async def create_reserva(
     reserva_data: ReservaCreate,
+    idempotency_key: Optional[str] = Depends(idempotency_key_header),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Create a new reserva."""
+    """Create a new reserva; retries with the same Idempotency-Key replay the first response."""
     try:
         reserva_service = ReservaService(db)
-        return reserva_service.create_reserva(reserva_data)
+        idempotency = idempotent_request(current_user, "POST /reservas", idempotency_key, reserva_data)
+        return run_idempotent(
+            db, idempotency, lambda: reserva_service.create_reserva(reserva_data, idempotency)
+        )
+    except IdempotencyKeyReusedError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
-@router.get("/", response_model=List[ReservaResponse])
+@router.get("/", response_model=List[ReservaExpandidaResponse], response_model_exclude_unset=True)
 async def get_reservas(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = Query(None, description="Opaque cursor from the X-Next-Cursor header"),
+    expand: FrozenSet[Expansao] = Depends(expand_param),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Get all reservas."""
+    after_id = decode_cursor(cursor)
     reserva_service = ReservaService(db)
-    return reserva_service.get_all_reservas(skip, limit)
+    reservas = reserva_service.get_all_reservas(skip, limit, after_id, expand)
+    set_next_cursor(response, reservas, limit)
+    return [expand_response(ReservaExpandidaResponse, reserva, expand) for reserva in reservas]
 
 
-@router.get("/{reserva_id}", response_model=ReservaResponse)
+@router.get("/export")
+async def export_reservas(
+    format: ExportFormat = Query(ExportFormat.CSV, description="File format"),
+    gzip: bool = Query(False, description="Compress the file with gzip"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Export every reserva as a CSV or NDJSON file, streamed in batches."""
+    columns = export_columns(ReservaResponse)
+    reserva_service = ReservaService(db)
+    batches = reserva_service.export_reservas(columns, settings.EXPORT_BATCH_SIZE)
+    return export_response(db, columns, batches, "reservas", format, gzip)
+
+
+@router.get("/{reserva_id}", response_model=ReservaExpandidaResponse, response_model_exclude_unset=True)
 async def get_reserva(
     reserva_id: int,
+    expand: FrozenSet[Expansao] = Depends(expand_param),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Get a reserva by ID."""
     try:
         reserva_service = ReservaService(db)
-        return reserva_service.get_reserva(reserva_id)
+        reserva = reserva_service.get_reserva(reserva_id, expand)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return expand_response(ReservaExpandidaResponse, reserva, expand)
 
 
 @router.post("/{reserva_id}/cancel", response_model=dict)
@@ -60,6 +95,8 @@ async def cancel_reserva(
         reserva_service = ReservaService(db)
         reserva_service.cancel_reserva(reserva_id)
         return {"message": "Reserva cancelled successfully"}
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
 
@@ -74,5 +111,7 @@ async def delete_reserva(
     try:
         reserva_service = ReservaService(db)
         reserva_service.delete_reserva(reserva_id)
+    except ConcurrentUpdateError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
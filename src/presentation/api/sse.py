@@ -0,0 +1,23 @@
+import asyncio
+import json
+from typing import AsyncIterator, Optional
+from src.infrastructure.events import Broadcaster
+
+
+async def status_event_stream(
+    broadcaster: Broadcaster, bloco: Optional[str], keepalive_seconds: float
+) -> AsyncIterator[str]:
+    """Server-Sent Events for apartamento status changes, with keep-alive comments."""
+    subscription = broadcaster.subscribe(bloco)
+    try:
+        yield ": connected\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), keepalive_seconds)
+            except asyncio.TimeoutError:
+                # Keeps proxies from closing idle connections
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: status\ndata: {json.dumps(event)}\n\n"
+    finally:
+        broadcaster.unsubscribe(subscription)
@@ -0,0 +1,50 @@
+"""Import clientes from a CSV file (nome,cpf,email,telefone), upserting by CPF.
+
+Usage:
+    python -m src.presentation.cli.import_clientes leads.csv
+    gunzip -c leads.csv.gz | python -m src.presentation.cli.import_clientes - --chunk-size 5000
+"""
+import argparse
+import sys
+from typing import BinaryIO, Iterator, List, Optional
+
+from src.application.use_cases import ClienteService
+from src.infrastructure.database.config import SessionLocal, settings
+
+READ_SIZE = 64 * 1024
+
+
+def read_pieces(file: BinaryIO, size: int = READ_SIZE) -> Iterator[bytes]:
+    """Read a binary file piece by piece."""
+    while piece := file.read(size):
+        yield piece
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="CSV file, or - for stdin")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=settings.CLIENTE_IMPORT_CHUNK_SIZE,
+        help="rows per upsert and commit",
+    )
+    args = parser.parse_args(argv)
+
+    file = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    try:
+        with SessionLocal() as db:
+            report = ClienteService(db).import_clientes(read_pieces(file), args.chunk_size)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if file is not sys.stdin.buffer:
+            file.close()
+
+    print(report.model_dump_json(indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
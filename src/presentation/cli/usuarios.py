@@ -0,0 +1,36 @@
+"""Activate or deactivate a user account.
+
+Running API workers keep a cached principal for up to AUTH_CACHE_TTL_SECONDS,
+so a deactivated user may still be served by them until it expires.
+
+Usage:
+    python -m src.presentation.cli.usuarios deactivate corretor01
+    python -m src.presentation.cli.usuarios activate corretor01
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from src.application.use_cases import AuthService
+from src.infrastructure.database.config import SessionLocal
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("action", choices=["activate", "deactivate"])
+    parser.add_argument("username")
+    args = parser.parse_args(argv)
+
+    try:
+        with SessionLocal() as db:
+            AuthService(db).set_user_active(args.username, args.action == "activate")
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{args.username} {args.action}d")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+from .periodic import PeriodicBatchWorker
+from .reserva_expiration import ReservaExpirationWorker, reserva_expiration_worker
+from .idempotency_cleanup import IdempotencyCleanupWorker, idempotency_cleanup_worker
+
+__all__ = [
+    "PeriodicBatchWorker",
+    "ReservaExpirationWorker",
+    "reserva_expiration_worker",
+    "IdempotencyCleanupWorker",
+    "idempotency_cleanup_worker",
+]
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Any, Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.application.use_cases import AsyncIdempotencyService, IdempotencyService
+from src.infrastructure.database.config import settings
+from .periodic import PeriodicBatchWorker
+
+
+class IdempotencyCleanupWorker(PeriodicBatchWorker):
+    """Background task that deletes expired idempotency keys in batches."""
+
+    total_stat = "deleted_total"
+
+    def __init__(
+        self,
+        interval_seconds: float = 300.0,
+        batch_size: int = 1000,
+        use_async: bool = False,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        super().__init__(interval_seconds, batch_size, use_async, session_factory)
+
+    def _process_batch(self, db: Session, now: datetime) -> int:
+        return IdempotencyService(db).delete_expired(now, self.batch_size)
+
+    async def _process_batch_async(self, db: AsyncSession, now: datetime) -> int:
+        return await AsyncIdempotencyService(db).delete_expired(now, self.batch_size)
+
+
+idempotency_cleanup_worker = IdempotencyCleanupWorker(
+    interval_seconds=settings.IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS,
+    batch_size=settings.IDEMPOTENCY_CLEANUP_BATCH_SIZE,
+    use_async=settings.USE_ASYNC_DB,
+)
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+from src.infrastructure.database.config import SessionLocal, get_async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicBatchWorker(ABC):
+    """Background task that works through due rows in batches, every interval_seconds.
+
+    A run repeats batches, one transaction each, until one comes back short.
+    Subclasses supply the batch for each stack (_process_batch and
+    _process_batch_async) and name the counter of rows it handled.
+    """
+
+    # stats() key of the rows handled since startup
+    total_stat = "processed_total"
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        batch_size: int,
+        use_async: bool = False,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        # A run stops at the first batch shorter than batch_size, so it must be positive
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.use_async = use_async
+        # Resolved lazily so the async engine is only created when it is used
+        self._session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+
+        self.runs = 0
+        self.errors = 0
+        self.processed_total = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_run_seconds = 0.0
+
+    @property
+    def session_factory(self) -> Callable[[], Any]:
+        if self._session_factory is None:
+            self._session_factory = get_async_sessionmaker() if self.use_async else SessionLocal
+        return self._session_factory
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the periodic task on the running event loop."""
+        if not self.running:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Cancel the periodic task and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self, now: Optional[datetime] = None) -> int:
+        """Process every row due at now, one batch per transaction."""
+        now = now or datetime.utcnow()
+        start = time.perf_counter()
+        processed = 0
+        while True:
+            count = self._record_batch(now, await self._run_batch(now))
+            processed += count
+            if count < self.batch_size:
+                break
+
+        self.runs += 1
+        self.processed_total += processed
+        self.last_run_at = now
+        self.last_run_seconds = time.perf_counter() - start
+        return processed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the worker gauges and counters."""
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval_seconds,
+            "batch_size": self.batch_size,
+            "runs": self.runs,
+            "errors": self.errors,
+            self.total_stat: self.processed_total,
+            "last_run_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_run_seconds": round(self.last_run_seconds, 6),
+        }
+
+    def _record_batch(self, now: datetime, result: Any) -> int:
+        """Account for the result of one batch, returning how many rows it handled."""
+        return result
+
+    @abstractmethod
+    def _process_batch(self, db: Any, now: datetime) -> Any:
+        """Handle one batch due at now on a sync session."""
+
+    @abstractmethod
+    async def _process_batch_async(self, db: Any, now: datetime) -> Any:
+        """Handle one batch due at now on an async session."""
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                self.errors += 1
+                logger.exception("%s run failed", type(self).__name__)
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _run_batch(self, now: datetime) -> Any:
+        if self.use_async:
+            async with self.session_factory() as db:
+                return await self._process_batch_async(db, now)
+        # The sync stack blocks, so it runs off the event loop
+        return await asyncio.to_thread(self._run_batch_sync, now)
+
+    def _run_batch_sync(self, now: datetime) -> Any:
+        with self.session_factory() as db:
+            return self._process_batch(db, now)
@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from src.application.use_cases import AsyncReservaService, ReservaService
+from src.infrastructure.database.config import settings
+from .periodic import PeriodicBatchWorker
+
+
+class ReservaExpirationWorker(PeriodicBatchWorker):
+    """Background task that expires reservas past data_expiracao in batches."""
+
+    total_stat = "expired_total"
+
+    def __init__(
+        self,
+        interval_seconds: float = 30.0,
+        batch_size: int = 500,
+        use_async: bool = False,
+        session_factory: Optional[Callable[[], Any]] = None,
+    ):
+        super().__init__(interval_seconds, batch_size, use_async, session_factory)
+        self.lag_seconds_last = 0.0
+        self.lag_seconds_max = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the worker gauges and counters."""
+        return {
+            **super().stats(),
+            "lag_seconds_last": round(self.lag_seconds_last, 3),
+            "lag_seconds_max": round(self.lag_seconds_max, 3),
+        }
+
+    def _record_batch(self, now: datetime, expiracoes: List[datetime]) -> int:
+        if expiracoes:
+            # Lag: how long after data_expiracao the reserva was actually expired
+            seconds = (now - min(expiracoes)).total_seconds()
+            self.lag_seconds_last = seconds
+            self.lag_seconds_max = max(self.lag_seconds_max, seconds)
+        return len(expiracoes)
+
+    def _process_batch(self, db: Session, now: datetime) -> List[datetime]:
+        return ReservaService(db).expire_due_reservas(now, self.batch_size)
+
+    async def _process_batch_async(self, db: AsyncSession, now: datetime) -> List[datetime]:
+        return await AsyncReservaService(db).expire_due_reservas(now, self.batch_size)
+
+
+reserva_expiration_worker = ReservaExpirationWorker(
+    interval_seconds=settings.RESERVA_EXPIRATION_INTERVAL_SECONDS,
+    batch_size=settings.RESERVA_EXPIRATION_BATCH_SIZE,
+    use_async=settings.USE_ASYNC_DB,
+)
@@ -1,22 +1,73 @@
+import fnmatch
+import time
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from src.infrastructure.auth import principal_cache
+from src.infrastructure.cache import apartamento_cache
 from src.infrastructure.database.models import Base
 from src.main import app
-from src.infrastructure.database import get_db
+from src.infrastructure.database import get_db, get_async_db
+from src.presentation.api.routes import (
+    async_auth_router,
+    async_clientes_router,
+    async_apartamentos_router,
+    async_vendas_router,
+    async_reservas_router,
+    async_relatorios_router,
+)
 
 # Test database URL
 TEST_DATABASE_URL = "sqlite:///./test.db"
+TEST_ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+# NullPool keeps aiosqlite connections from outliving the TestClient event loop
+async_engine = create_async_engine(TEST_ASYNC_DATABASE_URL, poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of the redis client used by RedisCache."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        entry = self.data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            self.data.pop(key, None)
+            return None
+        return entry[1]
+
+    def set(self, key, value, px=None):
+        expires_at = time.monotonic() + px / 1000 if px is not None else float("inf")
+        self.data[key] = (expires_at, value.encode())
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match="*"):
+        return [key for key in list(self.data) if fnmatch.fnmatch(key, match)]
 
 
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database for each test."""
     Base.metadata.create_all(bind=engine)
+    principal_cache.clear()
+    apartamento_cache.clear()
     db = TestingSessionLocal()
     try:
         yield db
@@ -41,6 +92,26 @@ def client(db_session):
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def async_client(db_session):
+    """Create a test client for an app mounted on the async database stack."""
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
+    async_app = FastAPI()
+    async_app.include_router(async_auth_router)
+    async_app.include_router(async_clientes_router)
+    async_app.include_router(async_apartamentos_router)
+    async_app.include_router(async_vendas_router)
+    async_app.include_router(async_reservas_router)
+    async_app.include_router(async_relatorios_router)
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    with TestClient(async_app) as test_client:
+        yield test_client
+
+
 @pytest.fixture
 def auth_token(client):
     """Create a user and return an auth token."""
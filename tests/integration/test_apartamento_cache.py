@@ -0,0 +1,148 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from src.infrastructure.cache import RedisCache, apartamento_cache
+from tests.conftest import FakeRedis, engine
+
+APARTAMENTO_DATA = {
+    "numero": "101",
+    "bloco": "A",
+    "andar": 1,
+    "quartos": 2,
+    "area": 65.5,
+    "preco": 250000.0,
+}
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def statements():
+    """Collect the SQL statements executed while the test runs."""
+    executed = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", collect)
+    yield executed
+    event.remove(engine, "before_cursor_execute", collect)
+
+
+def selects_from_apartamentos(statements):
+    return [s for s in statements if s.startswith("SELECT") and "FROM apartamentos" in s]
+
+
+@pytest.mark.integration
+def test_get_apartamento_served_from_cache(client, headers, statements, db_session):
+    """Test that repeated reads of a unit skip the database."""
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    # Start from an empty identity map so the first read has to query
+    db_session.expunge_all()
+    statements.clear()
+    hits, misses = apartamento_cache.hits, apartamento_cache.misses
+
+    for _ in range(3):
+        assert client.get(f"/apartamentos/{apartamento_id}", headers=headers).status_code == 200
+    response = client.get(f"/apartamentos/{apartamento_id}/disponibilidade", headers=headers)
+
+    assert response.json()["disponivel"] is True
+    assert len(selects_from_apartamentos(statements)) == 1
+    stats = client.get("/health/cache").json()["apartamentos"]
+    assert stats["hits"] - hits == 3
+    assert stats["misses"] - misses == 1
+
+
+@pytest.mark.integration
+def test_list_served_from_cache_until_write(client, headers, statements):
+    """Test that list pages are cached and dropped by any apartamento write."""
+    client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers)
+    statements.clear()
+
+    client.get("/apartamentos/", headers=headers)
+    client.get("/apartamentos/", headers=headers)
+    assert len(selects_from_apartamentos(statements)) == 1
+
+    client.post("/apartamentos/", json={**APARTAMENTO_DATA, "numero": "102"}, headers=headers)
+    response = client.get("/apartamentos/", headers=headers)
+    assert [item["numero"] for item in response.json()] == ["101", "102"]
+
+
+@pytest.mark.integration
+def test_cache_invalidated_by_update_and_delete(client, headers):
+    """Test that update and delete invalidate the cached unit."""
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    client.get(f"/apartamentos/{apartamento_id}", headers=headers)
+
+    client.put(f"/apartamentos/{apartamento_id}", json={"preco": 300000.0}, headers=headers)
+    assert client.get(f"/apartamentos/{apartamento_id}", headers=headers).json()["preco"] == 300000.0
+
+    client.delete(f"/apartamentos/{apartamento_id}", headers=headers)
+    assert client.get(f"/apartamentos/{apartamento_id}", headers=headers).status_code == 404
+
+
+@pytest.mark.integration
+def test_cache_invalidated_by_reserva_and_venda(client, headers):
+    """Test that reserva and venda creation refresh the cached status."""
+    cliente_data = {
+        "nome": "João Silva",
+        "cpf": "12345678901",
+        "email": "joao@example.com",
+        "telefone": "11999999999",
+    }
+    cliente_id = client.post("/clientes/", json=cliente_data, headers=headers).json()["id"]
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    client.get(f"/apartamentos/{apartamento_id}", headers=headers)
+    client.get("/apartamentos/?status=disponivel", headers=headers)
+
+    reserva_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "data_expiracao": (datetime.now() + timedelta(days=7)).isoformat(),
+    }
+    client.post("/reservas/", json=reserva_data, headers=headers)
+    assert client.get(f"/apartamentos/{apartamento_id}", headers=headers).json()["status"] == "reservado"
+    assert client.get("/apartamentos/?status=disponivel", headers=headers).json() == []
+
+    venda_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "valor_venda": 250000.0,
+        "valor_entrada": 50000.0,
+    }
+    client.post("/vendas/", json=venda_data, headers=headers)
+    assert client.get(f"/apartamentos/{apartamento_id}", headers=headers).json()["status"] == "vendido"
+
+
+@pytest.mark.integration
+def test_rolled_back_write_keeps_cache(client, headers, db_session):
+    """Test that only committed writes invalidate the cache."""
+    from src.application.dtos import ApartamentoUpdate
+    from src.infrastructure.database.repositories import ApartamentoRepository
+
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    client.get(f"/apartamentos/{apartamento_id}", headers=headers)
+    invalidations = apartamento_cache.invalidations
+
+    ApartamentoRepository(db_session, auto_commit=False).update(apartamento_id, ApartamentoUpdate(preco=1.0))
+    db_session.rollback()
+
+    assert apartamento_cache.invalidations == invalidations
+    assert apartamento_cache.get(apartamento_id)["preco"] == 250000.0
+
+
+@pytest.mark.integration
+def test_redis_backend(client, headers, monkeypatch):
+    """Test the read-through cache on a Redis-compatible backend."""
+    monkeypatch.setattr(apartamento_cache, "backend", RedisCache(FakeRedis(), ttl=60))
+
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    client.get(f"/apartamentos/{apartamento_id}", headers=headers)
+    assert apartamento_cache.backend.client.get(f"direcional:apartamento:{apartamento_id}") is not None
+
+    client.put(f"/apartamentos/{apartamento_id}", json={"quartos": 3}, headers=headers)
+    assert client.get(f"/apartamentos/{apartamento_id}", headers=headers).json()["quartos"] == 3
@@ -0,0 +1,148 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.repositories import ApartamentoRepository
+from src.infrastructure.events import apartamento_broadcaster
+from src.presentation.workers import ReservaExpirationWorker
+from tests.conftest import TestingSessionLocal
+
+APARTAMENTO_DATA = {
+    "numero": "101",
+    "bloco": "A",
+    "andar": 1,
+    "quartos": 2,
+    "area": 65.5,
+    "preco": 250000.0,
+}
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def cliente_id(client, headers):
+    """Create a cliente and return its ID."""
+    cliente = {"nome": "João Silva", "cpf": "12345678901", "email": "joao@example.com", "telefone": "11999999999"}
+    return client.post("/clientes/", json=cliente, headers=headers).json()["id"]
+
+
+@pytest.fixture
+def subscribe(client):
+    """Subscribe to the app's broadcaster, returning a function that drains a subscription."""
+    subscriptions = []
+
+    def drain(subscription):
+        # Deliveries are scheduled on the app's event loop, which the test client runs in a portal
+        async def collect():
+            await asyncio.sleep(0)
+            events = []
+            while not subscription._queue.empty():
+                events.append(await subscription.get())
+            return events
+
+        return client.portal.call(collect)
+
+    def subscribe_(bloco=None):
+        subscription = apartamento_broadcaster.subscribe(bloco)
+        subscriptions.append(subscription)
+        return subscription
+
+    subscribe_.drain = drain
+    yield subscribe_
+    for subscription in subscriptions:
+        apartamento_broadcaster.unsubscribe(subscription)
+
+
+@pytest.mark.integration
+def test_reserva_and_venda_publish_status_changes(client, headers, cliente_id, subscribe):
+    """Test that committed status changes reach subscribers of the unit's bloco."""
+    bloco_a = subscribe("A")
+    bloco_b = subscribe("B")
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+
+    reserva = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "data_expiracao": (datetime.now() + timedelta(days=7)).isoformat(),
+    }
+    assert client.post("/reservas/", json=reserva, headers=headers).status_code == 201
+    venda = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "valor_venda": 250000.0,
+        "valor_entrada": 50000.0,
+    }
+    assert client.post("/vendas/", json=venda, headers=headers).status_code == 201
+
+    events = subscribe.drain(bloco_a)
+    assert [(event["apartamento_id"], event["status"]) for event in events] == [
+        (apartamento_id, "reservado"),
+        (apartamento_id, "vendido"),
+    ]
+    assert events[0]["numero"] == "101"
+    assert subscribe.drain(bloco_b) == []
+
+
+@pytest.mark.integration
+def test_rejected_changes_are_not_published(client, headers, subscribe, db_session):
+    """Test that rolled-back and unchanged updates publish nothing."""
+    subscription = subscribe()
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+
+    # Same status and non-status fields do not publish
+    client.put(f"/apartamentos/{apartamento_id}", json={"status": "disponivel", "preco": 1.0}, headers=headers)
+    # A status change that is rolled back is discarded
+    ApartamentoRepository(db_session, auto_commit=False).update_status(
+        apartamento_id, StatusApartamento.VENDIDO
+    )
+    db_session.rollback()
+    # ...and not carried over to the session's next commit
+    db_session.commit()
+
+    assert subscribe.drain(subscription) == []
+
+
+@pytest.mark.integration
+def test_expired_reservas_publish_disponivel(client, headers, cliente_id, subscribe):
+    """Test that units released by the expiration worker are published."""
+    subscription = subscribe("A")
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    reserva = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "data_expiracao": (datetime.now() + timedelta(minutes=1)).isoformat(),
+    }
+    client.post("/reservas/", json=reserva, headers=headers)
+
+    worker = ReservaExpirationWorker(session_factory=TestingSessionLocal)
+    assert client.portal.call(worker.run_once, datetime.now() + timedelta(minutes=2)) == 1
+
+    events = subscribe.drain(subscription)
+    assert [event["status"] for event in events] == ["reservado", "disponivel"]
+
+
+@pytest.mark.integration
+def test_stream_requires_auth(client):
+    """Test that the status stream requires authentication."""
+    response = client.get("/apartamentos/stream")
+    assert response.status_code == 401
+
+
+@pytest.mark.integration
+def test_health_workers_reports_events(client):
+    """Test the broadcaster metrics in the worker health endpoint."""
+    response = client.get("/health/workers")
+    assert response.json()["apartamento_events"]["backplane"] == "InMemoryBackplane"
+
+
+@pytest.mark.integration
+def test_health_reports_backplane(client):
+    """Test that /health includes the events backplane connection."""
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy", "events_backplane": {"connected": True}}
@@ -0,0 +1,145 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event, func, select
+from src.infrastructure.database.models import Apartamento, ApartamentoResumo
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.repositories import ApartamentoRepository, ApartamentoResumoRepository
+from src.presentation.workers import ReservaExpirationWorker
+from tests.conftest import TestingSessionLocal, engine
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+def apartamento(numero, bloco="A", andar=1):
+    return {"numero": numero, "bloco": bloco, "andar": andar, "quartos": 2, "area": 65.5, "preco": 250000.0}
+
+
+def summary(db_session):
+    """Non-empty summary rows as {(bloco, andar, status): quantidade}."""
+    db_session.expire_all()
+    return {
+        (row.bloco, row.andar, row.status): row.quantidade
+        for row in ApartamentoResumoRepository(db_session).get_all()
+    }
+
+
+def recount(db_session):
+    """The same counts computed by scanning apartamentos."""
+    rows = db_session.execute(
+        select(Apartamento.bloco, Apartamento.andar, Apartamento.status, func.count()).group_by(
+            Apartamento.bloco, Apartamento.andar, Apartamento.status
+        )
+    )
+    return {(bloco, andar, status): quantidade for bloco, andar, status, quantidade in rows}
+
+
+@pytest.mark.integration
+def test_summary_follows_every_write(client, headers, db_session):
+    """Test that creates, updates, deletes, reservas, vendas and expirations keep the summary exact."""
+    cliente = {"nome": "João Silva", "cpf": "12345678901", "email": "joao@example.com", "telefone": "11999999999"}
+    cliente_id = client.post("/clientes/", json=cliente, headers=headers).json()["id"]
+    ids = [
+        client.post("/apartamentos/", json=apartamento(str(100 + i), andar=1 + i % 2), headers=headers).json()["id"]
+        for i in range(4)
+    ]
+    client.post(
+        "/apartamentos/bulk",
+        json={"items": [apartamento("201", bloco="B"), apartamento("202", bloco="B", andar=2)]},
+        headers=headers,
+    )
+
+    expiracao = (datetime.now() + timedelta(minutes=1)).isoformat()
+    for apartamento_id in ids[:2]:
+        client.post(
+            "/reservas/",
+            json={"cliente_id": cliente_id, "apartamento_id": apartamento_id, "data_expiracao": expiracao},
+            headers=headers,
+        )
+    venda = {"cliente_id": cliente_id, "apartamento_id": ids[2], "valor_venda": 250000.0, "valor_entrada": 50000.0}
+    client.post("/vendas/", json=venda, headers=headers)
+    client.put(f"/apartamentos/{ids[3]}", json={"bloco": "B", "andar": 7}, headers=headers)
+    client.delete(f"/apartamentos/{ids[0]}", headers=headers)
+
+    assert summary(db_session) == recount(db_session)
+    assert summary(db_session)[("A", 2, StatusApartamento.RESERVADO)] == 1
+
+    worker = ReservaExpirationWorker(session_factory=TestingSessionLocal)
+    asyncio.run(worker.run_once(datetime.now() + timedelta(minutes=2)))
+
+    assert summary(db_session) == recount(db_session)
+    assert summary(db_session)[("A", 2, StatusApartamento.DISPONIVEL)] == 1
+
+
+@pytest.mark.integration
+def test_resumo_endpoint(client, headers):
+    """Test the per-andar pivot, the totals and the bloco filter."""
+    for numero, bloco, andar in [("101", "A", 1), ("102", "A", 1), ("201", "A", 2), ("301", "B", 3)]:
+        client.post("/apartamentos/", json=apartamento(numero, bloco, andar), headers=headers)
+    apartamento_id = client.get("/apartamentos/", headers=headers).json()[0]["id"]
+    client.put(f"/apartamentos/{apartamento_id}", json={"status": "vendido"}, headers=headers)
+
+    response = client.get("/apartamentos/resumo", headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["totais"] == {"disponivel": 3, "reservado": 0, "vendido": 1, "total": 4}
+    assert data["andares"][0] == {
+        "bloco": "A", "andar": 1, "disponivel": 1, "reservado": 0, "vendido": 1, "total": 2
+    }
+    assert [(andar["bloco"], andar["andar"]) for andar in data["andares"]] == [("A", 1), ("A", 2), ("B", 3)]
+
+    data = client.get("/apartamentos/resumo?bloco=B", headers=headers).json()
+    assert data["totais"]["total"] == 1
+    assert [andar["bloco"] for andar in data["andares"]] == ["B"]
+
+
+@pytest.mark.integration
+def test_resumo_does_not_scan_apartamentos(client, headers):
+    """Test that the summary is read from the summary table only."""
+    client.post("/apartamentos/", json=apartamento("101"), headers=headers)
+    executed = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", collect)
+    try:
+        client.get("/apartamentos/resumo", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", collect)
+
+    assert any("FROM apartamentos_resumo" in statement for statement in executed)
+    assert not any("FROM apartamentos " in statement or statement.endswith("FROM apartamentos") for statement in executed)
+
+
+@pytest.mark.integration
+def test_rolled_back_write_leaves_summary_unchanged(client, headers, db_session):
+    """Test that summary deltas roll back with the write that produced them."""
+    client.post("/apartamentos/", json=apartamento("101"), headers=headers)
+    apartamento_id = client.get("/apartamentos/", headers=headers).json()[0]["id"]
+    before = summary(db_session)
+
+    ApartamentoRepository(db_session, auto_commit=False).update_status(
+        apartamento_id, StatusApartamento.VENDIDO
+    )
+    db_session.rollback()
+
+    assert summary(db_session) == before == {("A", 1, StatusApartamento.DISPONIVEL): 1}
+
+
+@pytest.mark.integration
+def test_rebuild_repairs_drift(db_session):
+    """Test recomputing the summary after writes that bypassed the repositories."""
+    db_session.add(Apartamento(numero="101", bloco="A", andar=1, quartos=2, area=65.5, preco=250000.0))
+    db_session.add(ApartamentoResumo(bloco="Z", andar=9, status=StatusApartamento.VENDIDO, quantidade=5))
+    db_session.commit()
+
+    ApartamentoResumoRepository(db_session).rebuild()
+    db_session.commit()
+
+    assert summary(db_session) == {("A", 1, StatusApartamento.DISPONIVEL): 1}
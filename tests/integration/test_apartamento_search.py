@@ -0,0 +1,132 @@
+import pytest
+from sqlalchemy import text
+from src.application.dtos import ApartamentoFiltro, OrdenacaoApartamentos
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.repositories.apartamento_repository import build_search_query
+from tests.conftest import engine
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def apartamentos(client, headers):
+    """Create twelve apartamentos over two blocos, selling the last one."""
+    items = [
+        {
+            "numero": f"{bloco}{andar}0{i}",
+            "bloco": bloco,
+            "andar": andar,
+            "quartos": 1 + i,
+            "area": 50.0 + 10 * i + andar,
+            "preco": 200000.0 + 50000 * i + 10000 * andar,
+        }
+        for bloco in ("A", "B")
+        for andar in (1, 2)
+        for i in range(3)
+    ]
+    created = client.post("/apartamentos/bulk", json={"items": items}, headers=headers).json()
+    ids = [result["id"] for result in created["results"]]
+    cliente = {"nome": "Ana", "cpf": "00000000001", "email": "ana@example.com", "telefone": "11999999999"}
+    cliente_id = client.post("/clientes/", json=cliente, headers=headers).json()["id"]
+    venda = {"cliente_id": cliente_id, "apartamento_id": ids[-1], "valor_venda": 330000.0, "valor_entrada": 1.0}
+    client.post("/vendas/", json=venda, headers=headers)
+    return ids
+
+
+def numeros(response):
+    return [apartamento["numero"] for apartamento in response.json()]
+
+
+@pytest.mark.integration
+def test_search_combines_filters(client, headers, apartamentos):
+    """Test that every filter narrows the result."""
+    response = client.get(
+        "/apartamentos/?quartos=2&quartos=3&min_preco=250000&max_preco=300000&min_area=60",
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert numeros(response) == ["A101", "A201", "B101", "B201"]
+
+    response = client.get("/apartamentos/?bloco=B&min_andar=2&status=disponivel", headers=headers)
+    assert numeros(response) == ["B200", "B201"]
+
+    response = client.get("/apartamentos/?max_area=60.5&max_andar=1", headers=headers)
+    assert numeros(response) == ["A100", "B100"]
+
+
+@pytest.mark.integration
+def test_search_sorted_by_preco_and_area(client, headers, apartamentos):
+    """Test sorting by preco and area, with ties broken by id."""
+    ascending = client.get("/apartamentos/?sort=preco&bloco=A", headers=headers).json()
+    precos = [apartamento["preco"] for apartamento in ascending]
+    assert precos == sorted(precos)
+    assert [apartamento["numero"] for apartamento in ascending[:2]] == ["A100", "A200"]
+
+    descending = client.get("/apartamentos/?sort=-area&bloco=A", headers=headers).json()
+    areas = [apartamento["area"] for apartamento in descending]
+    assert areas == sorted(areas, reverse=True)
+
+
+@pytest.mark.integration
+def test_search_sorted_keyset_pagination(client, headers, apartamentos):
+    """Test that the cursor of a sorted listing walks every page once, in order."""
+    expected = numeros(client.get("/apartamentos/?sort=-preco", headers=headers))
+    seen = []
+    url = "/apartamentos/?sort=-preco&limit=5"
+    while True:
+        response = client.get(url, headers=headers)
+        seen += numeros(response)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        url = f"/apartamentos/?sort=-preco&limit=5&cursor={cursor}"
+
+    assert seen == expected
+    assert len(seen) == 12
+
+    first_page = client.get("/apartamentos/?sort=-preco&limit=5", headers=headers)
+    cursor = first_page.headers["X-Next-Cursor"]
+    # A cursor only fits the sort order it was issued for
+    response = client.get(f"/apartamentos/?sort=area&cursor={cursor}", headers=headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+def test_search_rejects_invalid_parameters(client, headers):
+    """Test validation of the search parameters."""
+    assert client.get("/apartamentos/?sort=numero", headers=headers).status_code == 422
+    assert client.get("/apartamentos/?min_preco=-1", headers=headers).status_code == 422
+    assert client.get("/apartamentos/?quartos=dois", headers=headers).status_code == 422
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "filtro, index",
+    [
+        (
+            ApartamentoFiltro(status=StatusApartamento.DISPONIVEL, sort=OrdenacaoApartamentos.PRECO_DESC),
+            "ix_apartamentos_status_preco",
+        ),
+        (
+            ApartamentoFiltro(
+                status=StatusApartamento.DISPONIVEL, min_area=60, max_area=80, sort=OrdenacaoApartamentos.AREA
+            ),
+            "ix_apartamentos_status_area",
+        ),
+        (ApartamentoFiltro(bloco="A", min_andar=2, max_andar=5), "ix_apartamentos_bloco_andar"),
+    ],
+)
+def test_search_query_uses_indexes(db_session, filtro, index):
+    """Test that the common searches are answered from the composite indexes, without sorting."""
+    query = build_search_query(filtro, after_id=10, after_value=100.0).limit(50)
+    sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+
+    plan = " ".join(row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+
+    assert index in plan
+    if filtro.sort.field is not None:
+        assert "TEMP B-TREE" not in plan
@@ -130,3 +130,71 @@ def test_delete_apartamento(client, auth_token):
         headers={"Authorization": f"Bearer {auth_token}"},
     )
     assert response.status_code == 204
+
+
+@pytest.mark.integration
+def test_create_apartamentos_bulk(client, auth_token):
+    """Test bulk creating apartamentos with per-item results."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    apartamento_data = {"bloco": "A", "andar": 1, "quartos": 2, "area": 65.5, "preco": 250000.0}
+    client.post("/apartamentos/", json={**apartamento_data, "numero": "101"}, headers=headers)
+
+    items = [{**apartamento_data, "numero": numero} for numero in ["101", "102", "103", "102"]]
+    response = client.post("/apartamentos/bulk", json={"items": items}, headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 2
+    assert [result["index"] for result in data["results"]] == [0, 1, 2, 3]
+    assert data["results"][0]["error"] == "Apartamento number already exists"
+    assert data["results"][3]["error"] == "Apartamento number repeated in batch"
+
+    created = client.get(f"/apartamentos/{data['results'][2]['id']}", headers=headers)
+    assert created.json()["numero"] == "103"
+    assert created.json()["status"] == "disponivel"
+
+
+@pytest.mark.integration
+def test_create_apartamentos_bulk_large_batch(client, auth_token, db_session):
+    """Test that a large batch is inserted without per-row round trips."""
+    from sqlalchemy import event
+    from tests.conftest import engine
+
+    items = [
+        {"numero": str(i), "bloco": "B", "andar": i // 10, "quartos": 2, "area": 65.5, "preco": 250000.0}
+        for i in range(5000)
+    ]
+    statements = []
+
+    def count_statements(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count_statements)
+    try:
+        response = client.post(
+            "/apartamentos/bulk",
+            json={"items": items},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statements)
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 5000
+    ids = [result["id"] for result in response.json()["results"]]
+    assert ids == sorted(ids)
+    inserts = [statement for statement in statements if statement.startswith("INSERT")]
+    assert len(inserts) < 50
+
+
+@pytest.mark.integration
+def test_create_apartamentos_bulk_rejects_invalid_item(client, auth_token):
+    """Test that schema errors reject the whole batch."""
+    items = [{"numero": "101", "bloco": "A", "andar": 1, "quartos": 0, "area": 65.5, "preco": 1.0}]
+    response = client.post(
+        "/apartamentos/bulk",
+        json={"items": items},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 422
@@ -0,0 +1,321 @@
+import pytest
+from datetime import datetime, timedelta
+
+
+@pytest.fixture
+def async_auth_headers(async_client):
+    """Register a user on the async stack and return auth headers."""
+    user_data = {
+        "username": "asyncuser",
+        "email": "async@example.com",
+        "password": "test123",
+    }
+    async_client.post("/auth/register", json=user_data)
+
+    login_data = {"username": "asyncuser", "password": "test123"}
+    response = async_client.post("/auth/login", json=login_data)
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def create_cliente_and_apartamento(async_client, headers):
+    """Create a cliente and an apartamento, returning their IDs."""
+    cliente_data = {
+        "nome": "João Silva",
+        "cpf": "12345678901",
+        "email": "joao@example.com",
+        "telefone": "11999999999",
+    }
+    cliente_response = async_client.post("/clientes/", json=cliente_data, headers=headers)
+
+    apartamento_data = {
+        "numero": "101",
+        "bloco": "A",
+        "andar": 1,
+        "quartos": 2,
+        "area": 65.5,
+        "preco": 250000.0,
+    }
+    apartamento_response = async_client.post(
+        "/apartamentos/", json=apartamento_data, headers=headers
+    )
+    return cliente_response.json()["id"], apartamento_response.json()["id"]
+
+
+@pytest.mark.integration
+def test_async_login_invalid_credentials(async_client):
+    """Test async login with invalid credentials."""
+    login_data = {"username": "nonexistent", "password": "wrong"}
+    response = async_client.post("/auth/login", json=login_data)
+    assert response.status_code == 401
+
+
+@pytest.mark.integration
+def test_async_deactivate(async_client, async_auth_headers):
+    """Test that a deactivated account is rejected on the async stack."""
+    assert async_client.post("/auth/deactivate", headers=async_auth_headers).status_code == 204
+
+    response = async_client.get("/clientes/", headers=async_auth_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+
+@pytest.mark.integration
+def test_async_cliente_crud(async_client, async_auth_headers):
+    """Test creating, updating and deleting a cliente on the async stack."""
+    cliente_data = {
+        "nome": "Maria Silva",
+        "cpf": "98765432109",
+        "email": "maria@example.com",
+        "telefone": "11888888888",
+    }
+    response = async_client.post("/clientes/", json=cliente_data, headers=async_auth_headers)
+    assert response.status_code == 201
+    cliente_id = response.json()["id"]
+
+    # Duplicate CPF is rejected
+    response = async_client.post("/clientes/", json=cliente_data, headers=async_auth_headers)
+    assert response.status_code == 400
+
+    response = async_client.put(
+        f"/clientes/{cliente_id}", json={"nome": "Maria Souza"}, headers=async_auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["nome"] == "Maria Souza"
+
+    response = async_client.delete(f"/clientes/{cliente_id}", headers=async_auth_headers)
+    assert response.status_code == 204
+
+    response = async_client.get(f"/clientes/{cliente_id}", headers=async_auth_headers)
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_async_create_venda(async_client, async_auth_headers):
+    """Test that an async venda marks the apartamento as vendido."""
+    cliente_id, apartamento_id = create_cliente_and_apartamento(async_client, async_auth_headers)
+
+    venda_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "valor_venda": 250000.0,
+        "valor_entrada": 50000.0,
+    }
+    response = async_client.post("/vendas/", json=venda_data, headers=async_auth_headers)
+    assert response.status_code == 201
+
+    response = async_client.post("/vendas/", json=venda_data, headers=async_auth_headers)
+    assert response.status_code == 400
+
+    apartamento_check = async_client.get(
+        f"/apartamentos/{apartamento_id}", headers=async_auth_headers
+    )
+    assert apartamento_check.json()["status"] == "vendido"
+
+
+@pytest.mark.integration
+def test_async_reserva_cancel(async_client, async_auth_headers):
+    """Test reserving and cancelling an apartamento on the async stack."""
+    cliente_id, apartamento_id = create_cliente_and_apartamento(async_client, async_auth_headers)
+
+    reserva_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "data_expiracao": (datetime.utcnow() + timedelta(days=7)).isoformat(),
+    }
+    response = async_client.post("/reservas/", json=reserva_data, headers=async_auth_headers)
+    assert response.status_code == 201
+    reserva_id = response.json()["id"]
+
+    response = async_client.get(
+        f"/apartamentos/{apartamento_id}/disponibilidade", headers=async_auth_headers
+    )
+    assert response.json()["disponivel"] is False
+
+    response = async_client.post(f"/reservas/{reserva_id}/cancel", headers=async_auth_headers)
+    assert response.status_code == 200
+
+    response = async_client.get(
+        f"/apartamentos/{apartamento_id}/disponibilidade", headers=async_auth_headers
+    )
+    assert response.json()["disponivel"] is True
+
+
+@pytest.mark.integration
+def test_async_create_apartamentos_bulk(async_client, async_auth_headers):
+    """Test bulk creating apartamentos on the async stack."""
+    items = [
+        {"numero": numero, "bloco": "A", "andar": 1, "quartos": 2, "area": 65.5, "preco": 250000.0}
+        for numero in ["101", "102", "101"]
+    ]
+    response = async_client.post("/apartamentos/bulk", json={"items": items}, headers=async_auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["results"][2]["error"] == "Apartamento number repeated in batch"
+
+    response = async_client.get(f"/apartamentos/{data['results'][1]['id']}", headers=async_auth_headers)
+    assert response.json()["numero"] == "102"
+
+
+@pytest.mark.integration
+def test_async_relatorio_vendas(async_client, async_auth_headers):
+    """Test the vendas report on the async stack."""
+    cliente_id, apartamento_id = create_cliente_and_apartamento(async_client, async_auth_headers)
+    venda_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "valor_venda": 250000.0,
+        "valor_entrada": 50000.0,
+    }
+    async_client.post("/vendas/", json=venda_data, headers=async_auth_headers)
+
+    response = async_client.get("/relatorios/vendas?group_by=mes", headers=async_auth_headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"]["quantidade"] == 1
+    assert data["total"]["razao_entrada"] == 0.2
+    assert data["grupos"][0]["grupo"] == datetime.utcnow().strftime("%Y-%m")
+
+
+@pytest.mark.integration
+def test_async_apartamentos_resumo(async_client, async_auth_headers):
+    """Test that the inventory summary is maintained on the async stack."""
+    cliente_id, apartamento_id = create_cliente_and_apartamento(async_client, async_auth_headers)
+    venda_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "valor_venda": 250000.0,
+        "valor_entrada": 50000.0,
+    }
+    async_client.post("/vendas/", json=venda_data, headers=async_auth_headers)
+
+    response = async_client.get("/apartamentos/resumo", headers=async_auth_headers)
+
+    assert response.status_code == 200
+    assert response.json()["totais"] == {"disponivel": 0, "reservado": 0, "vendido": 1, "total": 1}
+
+
+@pytest.mark.integration
+def test_async_export_vendas(async_client, async_auth_headers):
+    """Test streaming the vendas export on the async stack."""
+    cliente_id, apartamento_id = create_cliente_and_apartamento(async_client, async_auth_headers)
+    venda_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "valor_venda": 250000.0,
+        "valor_entrada": 50000.0,
+    }
+    async_client.post("/vendas/", json=venda_data, headers=async_auth_headers)
+
+    response = async_client.get("/vendas/export?format=ndjson", headers=async_auth_headers)
+
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert len(lines) == 1
+    assert '"apartamento_id": %d' % apartamento_id in lines[0]
+
+
+@pytest.mark.integration
+def test_async_import_clientes(async_client, async_auth_headers):
+    """Test importing clientes from CSV on the async stack."""
+    body = b"nome,cpf,email,telefone\nAna,00000000001,ana@example.com,11999999999\nBruno,1,x,1\n"
+
+    response = async_client.post(
+        "/clientes/import", content=body, headers={**async_auth_headers, "Content-Type": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["created"] == 1
+    assert response.json()["failed"] == 1
+    assert async_client.get("/clientes/", headers=async_auth_headers).json()[0]["cpf"] == "00000000001"
+
+
+@pytest.mark.integration
+def test_async_search_apartamentos(async_client, async_auth_headers):
+    """Test filtering, sorting and paginating apartamentos on the async stack."""
+    items = [
+        {"numero": str(100 + i), "bloco": "A", "andar": 1, "quartos": 1 + i % 3, "area": 60.0, "preco": 300000.0 - i}
+        for i in range(6)
+    ]
+    async_client.post("/apartamentos/bulk", json={"items": items}, headers=async_auth_headers)
+
+    first = async_client.get("/apartamentos/?quartos=1&quartos=2&sort=preco&limit=2", headers=async_auth_headers)
+    cursor = first.headers["X-Next-Cursor"]
+    second = async_client.get(
+        f"/apartamentos/?quartos=1&quartos=2&sort=preco&limit=2&cursor={cursor}", headers=async_auth_headers
+    )
+
+    assert [a["numero"] for a in first.json() + second.json()] == ["104", "103", "101", "100"]
+
+
+@pytest.mark.integration
+def test_async_search_clientes(async_client, async_auth_headers):
+    """Test searching clientes on the async stack."""
+    create_cliente_and_apartamento(async_client, async_auth_headers)
+
+    by_nome = async_client.get("/clientes/search?q=silva", headers=async_auth_headers)
+    by_cpf = async_client.get("/clientes/search?q=123.456", headers=async_auth_headers)
+
+    assert [cliente["nome"] for cliente in by_nome.json()] == ["João Silva"]
+    assert [cliente["cpf"] for cliente in by_cpf.json()] == ["12345678901"]
+
+
+@pytest.mark.integration
+def test_async_vendas_expanded(async_client, async_auth_headers):
+    """Test embedding the cliente and apartamento of vendas on the async stack."""
+    cliente_id, apartamento_id = create_cliente_and_apartamento(async_client, async_auth_headers)
+    venda_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "valor_venda": 250000.0,
+        "valor_entrada": 50000.0,
+    }
+    venda_id = async_client.post("/vendas/", json=venda_data, headers=async_auth_headers).json()["id"]
+
+    listed = async_client.get("/vendas/?expand=cliente,apartamento", headers=async_auth_headers).json()
+    detail = async_client.get(f"/vendas/{venda_id}?expand=cliente", headers=async_auth_headers).json()
+
+    assert listed[0]["cliente"]["nome"] == "João Silva"
+    assert listed[0]["apartamento"]["numero"] == "101"
+    assert detail["cliente"]["cpf"] == "12345678901"
+    assert "apartamento" not in detail
+
+
+@pytest.mark.integration
+def test_async_idempotent_reserva(async_client, async_auth_headers):
+    """Test that a retried reserva with the same Idempotency-Key replays the first response."""
+    cliente_id, apartamento_id = create_cliente_and_apartamento(async_client, async_auth_headers)
+    reserva_data = {
+        "cliente_id": cliente_id,
+        "apartamento_id": apartamento_id,
+        "data_expiracao": (datetime.utcnow() + timedelta(days=7)).isoformat(),
+    }
+    keyed = {**async_auth_headers, "Idempotency-Key": "reserva-1"}
+
+    first = async_client.post("/reservas/", json=reserva_data, headers=keyed)
+    retry = async_client.post("/reservas/", json=reserva_data, headers=keyed)
+    reused = async_client.post("/reservas/", json={**reserva_data, "cliente_id": 999}, headers=keyed)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert reused.status_code == 422
+    assert len(async_client.get("/reservas/", headers=async_auth_headers).json()) == 1
+
+
+@pytest.mark.integration
+def test_async_conditional_get(async_client, async_auth_headers):
+    """Test ETags and 304 responses on the async cliente and apartamento endpoints."""
+    cliente_id, apartamento_id = create_cliente_and_apartamento(async_client, async_auth_headers)
+
+    for path in (f"/clientes/{cliente_id}", "/clientes/", f"/apartamentos/{apartamento_id}", "/apartamentos/"):
+        etag = async_client.get(path, headers=async_auth_headers).headers["ETag"]
+        response = async_client.get(path, headers={**async_auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304, path
+        assert response.headers["ETag"] == etag
+
+    async_client.put(f"/clientes/{cliente_id}", json={"nome": "João Souza"}, headers=async_auth_headers)
+    response = async_client.get(f"/clientes/{cliente_id}", headers={**async_auth_headers, "If-None-Match": etag})
+    assert response.status_code == 200
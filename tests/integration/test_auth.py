@@ -60,3 +60,61 @@ def test_login_invalid_credentials(client):
     login_data = {"username": "nonexistent", "password": "wrong"}
     response = client.post("/auth/login", json=login_data)
     assert response.status_code == 401
+
+
+@pytest.mark.integration
+def test_authenticated_request_skips_user_lookup(client, auth_token):
+    """Test that a cached principal avoids querying usuarios."""
+    from sqlalchemy import event
+    from tests.conftest import engine
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(
+            "/clientes/", headers={"Authorization": f"Bearer {auth_token}"}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert not any("FROM usuarios" in statement for statement in statements)
+
+
+@pytest.mark.integration
+def test_deactivated_user_is_rejected(client, auth_token):
+    """Test that deactivating an account invalidates its cached principal."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    assert client.get("/clientes/", headers=headers).status_code == 200
+
+    assert client.post("/auth/deactivate", headers=headers).status_code == 204
+
+    response = client.get("/clientes/", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+    assert client.post("/auth/login", json={"username": "testuser", "password": "test123"}).status_code == 401
+
+
+@pytest.mark.integration
+def test_usuarios_cli(client, auth_token, db_session, monkeypatch, capsys):
+    """Test deactivating and reactivating a user from the command line."""
+    from src.presentation.cli import usuarios as usuarios_cli
+    from tests.conftest import TestingSessionLocal
+
+    monkeypatch.setattr(usuarios_cli, "SessionLocal", TestingSessionLocal)
+    headers = {"Authorization": f"Bearer {auth_token}"}
+
+    assert usuarios_cli.main(["deactivate", "testuser"]) == 0
+    assert client.get("/clientes/", headers=headers).status_code == 400
+    assert usuarios_cli.main(["activate", "testuser"]) == 0
+    # The CLI committed on its own session
+    db_session.expire_all()
+    assert client.get("/clientes/", headers=headers).status_code == 200
+    assert "testuser activated" in capsys.readouterr().out
+
+    assert usuarios_cli.main(["deactivate", "nobody"]) == 1
+    assert "User not found" in capsys.readouterr().err
@@ -0,0 +1,111 @@
+import pytest
+from sqlalchemy import event
+from src.infrastructure.database.models import Cliente
+from src.presentation.cli import import_clientes as import_clientes_cli
+from tests.conftest import TestingSessionLocal, engine
+
+CSV_HEADERS = {"Content-Type": "text/csv"}
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+def csv_body(rows):
+    """Build a clientes CSV file from (nome, cpf, email) tuples."""
+    lines = ["nome,cpf,email,telefone"] + [f"{nome},{cpf},{email},11999999999" for nome, cpf, email in rows]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def post_csv(client, headers, body):
+    """Upload a CSV body to the import endpoint."""
+    return client.post("/clientes/import", content=body, headers={**headers, **CSV_HEADERS})
+
+
+@pytest.mark.integration
+def test_import_clientes(client, headers, db_session):
+    """Test that valid rows are upserted and invalid ones reported without aborting the import."""
+    existing = {"nome": "Antigo", "cpf": "00000000001", "email": "antigo@example.com", "telefone": "11888888888"}
+    client.post("/clientes/", json=existing, headers=headers)
+    body = csv_body(
+        [
+            ("Ana", "00000000001", "ana@example.com"),
+            ("Bruno", "00000000002", "bruno@example.com"),
+            ("Bruno de novo", "00000000002", "bruno2@example.com"),
+            ("Carla", "00000000003", "email-invalido"),
+            ("Davi", "00000000004", "davi@example.com"),
+        ]
+    )
+
+    response = post_csv(client, headers, body)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["updated"], data["failed"]) == (2, 1, 2)
+    assert [(error["line"], error["cpf"]) for error in data["errors"]] == [
+        (4, "00000000002"),
+        (5, "00000000003"),
+    ]
+
+    clientes = {cliente.cpf: cliente for cliente in db_session.query(Cliente)}
+    assert sorted(clientes) == ["00000000001", "00000000002", "00000000004"]
+    # The existing cliente was updated in place
+    assert clientes["00000000001"].nome == "Ana"
+    assert clientes["00000000001"].telefone == "11999999999"
+    assert clientes["00000000002"].nome == "Bruno"
+
+
+@pytest.mark.integration
+def test_import_clientes_one_lookup_and_upsert_per_chunk(client, headers, monkeypatch):
+    """Test that every chunk costs one CPF lookup and one upsert."""
+    monkeypatch.setattr("src.presentation.api.routes.clientes.settings.CLIENTE_IMPORT_CHUNK_SIZE", 100)
+    body = csv_body([(f"Cliente {i}", f"{i:011d}", f"cliente{i}@example.com") for i in range(250)])
+    executed = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", collect)
+    try:
+        response = post_csv(client, headers, body)
+    finally:
+        event.remove(engine, "before_cursor_execute", collect)
+
+    assert response.json()["created"] == 250
+    statements = [statement for statement in executed if "clientes" in statement and "users" not in statement]
+    assert len(statements) == 6
+    assert all("ON CONFLICT (cpf) DO UPDATE" in statement for statement in statements[1::2])
+
+
+@pytest.mark.integration
+def test_import_clientes_invalid_header(client, headers):
+    """Test that a file without the required columns is rejected."""
+    response = post_csv(client, headers, b"nome;cpf\n")
+    assert response.status_code == 400
+    assert "missing the columns" in response.json()["detail"]
+
+
+@pytest.mark.integration
+def test_import_clientes_unauthorized(client):
+    """Test importing clientes without authentication."""
+    response = post_csv(client, {}, csv_body([]))
+    assert response.status_code == 401
+
+
+@pytest.mark.integration
+def test_import_clientes_cli(tmp_path, monkeypatch, capsys, db_session):
+    """Test the import command line."""
+    monkeypatch.setattr(import_clientes_cli, "SessionLocal", TestingSessionLocal)
+    path = tmp_path / "leads.csv"
+    path.write_bytes(csv_body([("Ana", "00000000001", "ana@example.com"), ("Bruno", "1", "bruno@example.com")]))
+
+    assert import_clientes_cli.main([str(path), "--chunk-size", "1"]) == 0
+
+    assert '"created": 1' in capsys.readouterr().out
+    assert db_session.query(Cliente).count() == 1
+
+    path.write_bytes(b"nome\n")
+    assert import_clientes_cli.main([str(path)]) == 1
+    assert "missing the columns" in capsys.readouterr().err
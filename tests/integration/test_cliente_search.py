@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy import text
+from tests.conftest import engine
+from src.infrastructure.database.repositories.cliente_repository import (
+    build_cpf_prefix_query,
+    build_text_search_query,
+)
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def clientes(client, headers):
+    """Create four clientes, returning their IDs by nome."""
+    data = [
+        ("João da Silva", "12345678901", "joao@example.com", "11987654321"),
+        ("Maria Silvana", "12399999999", "maria@corretora.com.br", "21912345678"),
+        ("Silvio Santos", "98765432100", "silvio@example.com", "11955554444"),
+        ("Ana Souza", "55544433322", "ana.souza@example.com", "31933332222"),
+    ]
+    ids = {}
+    for nome, cpf, email, telefone in data:
+        cliente = {"nome": nome, "cpf": cpf, "email": email, "telefone": telefone}
+        ids[nome] = client.post("/clientes/", json=cliente, headers=headers).json()["id"]
+    return ids
+
+
+def search(client, headers, q, **params):
+    response = client.get("/clientes/search", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200
+    return [cliente["nome"] for cliente in response.json()]
+
+
+@pytest.mark.integration
+def test_search_by_partial_nome_email_and_telefone(client, headers, clientes):
+    """Test substring search over nome, email and telefone, ignoring case."""
+    assert set(search(client, headers, "silv")) == {"João da Silva", "Maria Silvana", "Silvio Santos"}
+    assert search(client, headers, "JOÃO") == ["João da Silva"]
+    assert search(client, headers, "corretora") == ["Maria Silvana"]
+    assert search(client, headers, "5555") == ["Silvio Santos"]
+    assert search(client, headers, "silv", limit=2) == search(client, headers, "silv")[:2]
+    assert search(client, headers, "inexistente") == []
+
+
+@pytest.mark.integration
+def test_search_ranks_best_matches_first(client, headers, clientes):
+    """Test that clientes matching the term in several fields come first."""
+    assert search(client, headers, "silvio")[0] == "Silvio Santos"
+
+
+@pytest.mark.integration
+def test_search_by_cpf_prefix(client, headers, clientes):
+    """Test the CPF prefix fast path, with or without punctuation."""
+    assert search(client, headers, "123") == ["João da Silva", "Maria Silvana"]
+    assert search(client, headers, "123.999") == ["Maria Silvana"]
+    assert search(client, headers, "987.654.321-00") == ["Silvio Santos"]
+    # Digits that start no CPF still match telefones
+    assert search(client, headers, "3333") == ["Ana Souza"]
+
+
+@pytest.mark.integration
+def test_search_by_telefone_that_is_also_a_cpf_prefix(client, headers, clientes):
+    """Test that plain digits match telefones even when some CPF starts with them."""
+    # Silvio's CPF starts with 98765 and João's telefone contains it
+    assert search(client, headers, "98765") == ["Silvio Santos", "João da Silva"]
+    assert search(client, headers, "98765", limit=1) == ["Silvio Santos"]
+    # Punctuated or complete, the term is read as a CPF only
+    assert search(client, headers, "987.65") == ["Silvio Santos"]
+    assert search(client, headers, "98765432100") == ["Silvio Santos"]
+
+
+@pytest.mark.integration
+def test_search_follows_updates_and_deletes(client, headers, clientes):
+    """Test that the search index follows writes to clientes."""
+    client.put(f"/clientes/{clientes['Ana Souza']}", json={"nome": "Ana Beatriz"}, headers=headers)
+    client.delete(f"/clientes/{clientes['Silvio Santos']}", headers=headers)
+
+    assert search(client, headers, "beatriz") == ["Ana Beatriz"]
+    assert search(client, headers, "souza") == ["Ana Beatriz"]
+    assert search(client, headers, "santos") == []
+
+
+@pytest.mark.integration
+def test_search_validation(client, headers):
+    """Test the search term validation."""
+    assert client.get("/clientes/search?q=%20ab%20", headers=headers).status_code == 400
+    assert client.get("/clientes/search", headers=headers).status_code == 422
+    assert client.get("/clientes/search?q=silva").status_code == 401
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "query, index",
+    [
+        (build_cpf_prefix_query("123", 20), "sqlite_autoindex_clientes_1"),
+        (build_text_search_query("sqlite", "silva", 20), "VIRTUAL TABLE INDEX"),
+    ],
+)
+def test_search_queries_use_indexes(db_session, query, index):
+    """Test that both search paths are answered from an index."""
+    sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+
+    plan = [row[-1] for row in db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))]
+
+    assert any(index in step for step in plan)
+    assert "SCAN clientes" not in plan
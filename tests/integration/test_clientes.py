@@ -158,3 +158,66 @@ def test_unauthorized_access(client):
     """Test accessing clientes without authentication."""
     response = client.get("/clientes/")
     assert response.status_code == 401
+
+
+@pytest.mark.integration
+def test_get_clientes_cursor_pagination(client, auth_token):
+    """Test walking the clientes list with keyset cursors."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    for i in range(5):
+        cliente_data = {
+            "nome": f"Cliente {i}",
+            "cpf": f"1234567890{i}",
+            "email": f"cliente{i}@example.com",
+            "telefone": "11999999999",
+        }
+        client.post("/clientes/", json=cliente_data, headers=headers)
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/clientes/", params=params, headers=headers)
+        assert response.status_code == 200
+        seen.extend(cliente["cpf"] for cliente in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if not next_cursor:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+
+    assert seen == [f"1234567890{i}" for i in range(5)]
+
+
+@pytest.mark.integration
+def test_get_clientes_invalid_cursor(client, auth_token):
+    """Test that a malformed cursor is rejected."""
+    response = client.get(
+        "/clientes/",
+        params={"cursor": "not-a-cursor"},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.integration
+def test_create_clientes_bulk(client, auth_token):
+    """Test bulk creating clientes with per-item results."""
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    items = [
+        {
+            "nome": f"Cliente {i}",
+            "cpf": cpf,
+            "email": f"cliente{i}@example.com",
+            "telefone": "11999999999",
+        }
+        for i, cpf in enumerate(["12345678901", "12345678902", "12345678901"])
+    ]
+
+    response = client.post("/clientes/bulk", json={"items": items}, headers=headers)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["results"][2] == {"index": 2, "id": None, "error": "CPF repeated in batch"}
+
+    response = client.post("/clientes/bulk", json={"items": items[:1]}, headers=headers)
+    assert response.json()["results"] == [{"index": 0, "id": None, "error": "CPF already exists"}]
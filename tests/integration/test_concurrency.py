@@ -0,0 +1,159 @@
+import asyncio
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+from src.application.dtos import ApartamentoCreate, ClienteCreate, ReservaCreate, VendaCreate
+from src.application.use_cases import AsyncReservaService, ReservaService, VendaService
+from src.infrastructure.database.models import Apartamento, Reserva, Venda
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.repositories import ApartamentoRepository, ClienteRepository
+from tests.conftest import TEST_ASYNC_DATABASE_URL, TEST_DATABASE_URL
+
+# Each worker gets its own connection; the busy timeout lets SQLite queue writers
+stress_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False, "timeout": 60},
+    pool_size=20,
+    max_overflow=0,
+)
+StressSessionLocal = sessionmaker(autoflush=False, expire_on_commit=False, bind=stress_engine)
+async_stress_engine = create_async_engine(
+    TEST_ASYNC_DATABASE_URL, poolclass=NullPool, connect_args={"timeout": 60}
+)
+AsyncStressSessionLocal = async_sessionmaker(
+    bind=async_stress_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def seed(db_session, clientes: int, apartamentos: int):
+    """Create clientes and apartamentos, returning their IDs."""
+    cliente_repo = ClienteRepository(db_session)
+    apartamento_repo = ApartamentoRepository(db_session)
+    cliente_ids = [
+        cliente_repo.create(
+            ClienteCreate(
+                nome=f"Cliente {i}",
+                cpf=f"{i:011d}",
+                email=f"cliente{i}@example.com",
+                telefone="11999999999",
+            )
+        ).id
+        for i in range(clientes)
+    ]
+    apartamento_ids = [
+        apartamento_repo.create(
+            ApartamentoCreate(numero=str(i), bloco="A", andar=1, quartos=2, area=65.5, preco=250000.0)
+        ).id
+        for i in range(apartamentos)
+    ]
+    return cliente_ids, apartamento_ids
+
+
+def run_concurrently(func_, args_list, workers: int = 50):
+    """Run func_ for every args tuple in parallel, returning 'ok' or the raised exception."""
+
+    def call(args):
+        try:
+            func_(*args)
+            return "ok"
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(call, args_list))
+
+
+@pytest.fixture
+def stress_engine_cleanup():
+    """Release the stress connections before the test database is dropped."""
+    yield
+    stress_engine.dispose()
+
+
+@pytest.mark.integration
+def test_concurrent_reservas_single_winner(db_session, stress_engine_cleanup):
+    """Test that only one of many concurrent reservas for a unit succeeds."""
+    cliente_ids, (apartamento_id,) = seed(db_session, clientes=200, apartamentos=1)
+    expiracao = datetime.now() + timedelta(days=7)
+
+    def reservar(cliente_id):
+        with StressSessionLocal() as db:
+            ReservaService(db).create_reserva(
+                ReservaCreate(cliente_id=cliente_id, apartamento_id=apartamento_id, data_expiracao=expiracao)
+            )
+
+    results = run_concurrently(reservar, [(cliente_id,) for cliente_id in cliente_ids])
+
+    assert results.count("ok") == 1
+    # Every loser was rejected by a business rule or the version check
+    assert all(isinstance(result, ValueError) for result in results if result != "ok")
+
+    db_session.expire_all()
+    assert db_session.scalar(select(func.count()).select_from(Reserva)) == 1
+    apartamento = db_session.get(Apartamento, apartamento_id)
+    assert apartamento.status == StatusApartamento.RESERVADO
+    assert apartamento.version == 2
+
+
+@pytest.mark.integration
+def test_concurrent_vendas_one_winner_per_unit(db_session, stress_engine_cleanup):
+    """Test that concurrent vendas across several units sell each unit exactly once."""
+    cliente_ids, apartamento_ids = seed(db_session, clientes=40, apartamentos=5)
+
+    def vender(cliente_id, apartamento_id):
+        with StressSessionLocal() as db:
+            VendaService(db).create_venda(
+                VendaCreate(
+                    cliente_id=cliente_id,
+                    apartamento_id=apartamento_id,
+                    valor_venda=250000.0,
+                    valor_entrada=50000.0,
+                )
+            )
+
+    args_list = [
+        (cliente_id, apartamento_id) for apartamento_id in apartamento_ids for cliente_id in cliente_ids
+    ]
+    results = run_concurrently(vender, args_list)
+
+    assert results.count("ok") == len(apartamento_ids)
+    assert all(isinstance(result, ValueError) for result in results if result != "ok")
+
+    db_session.expire_all()
+    vendas_por_unidade = db_session.execute(
+        select(Venda.apartamento_id, func.count()).group_by(Venda.apartamento_id)
+    ).all()
+    assert sorted(vendas_por_unidade) == [(apartamento_id, 1) for apartamento_id in sorted(apartamento_ids)]
+    for apartamento_id in apartamento_ids:
+        assert db_session.get(Apartamento, apartamento_id).status == StatusApartamento.VENDIDO
+
+
+@pytest.mark.integration
+def test_concurrent_async_reservas_single_winner(db_session):
+    """Test that only one of many concurrent reservas succeeds on the async stack."""
+    cliente_ids, (apartamento_id,) = seed(db_session, clientes=100, apartamentos=1)
+    expiracao = datetime.now() + timedelta(days=7)
+
+    async def reservar(cliente_id):
+        async with AsyncStressSessionLocal() as db:
+            await AsyncReservaService(db).create_reserva(
+                ReservaCreate(cliente_id=cliente_id, apartamento_id=apartamento_id, data_expiracao=expiracao)
+            )
+
+    async def run():
+        return await asyncio.gather(
+            *(reservar(cliente_id) for cliente_id in cliente_ids), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert sum(result is None for result in results) == 1
+    assert all(isinstance(result, ValueError) for result in results if result is not None)
+
+    db_session.expire_all()
+    assert db_session.scalar(select(func.count()).select_from(Reserva)) == 1
+    assert db_session.get(Apartamento, apartamento_id).status == StatusApartamento.RESERVADO
@@ -0,0 +1,166 @@
+import pytest
+from sqlalchemy import event
+from tests.conftest import engine
+
+CLIENTE_DATA = {
+    "nome": "João Silva",
+    "cpf": "12345678901",
+    "email": "joao@example.com",
+    "telefone": "11999999999",
+}
+APARTAMENTO_DATA = {
+    "numero": "101",
+    "bloco": "A",
+    "andar": 1,
+    "quartos": 2,
+    "area": 65.5,
+    "preco": 250000.0,
+}
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def statements():
+    """Collect the SQL statements executed while the test runs."""
+    executed = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", collect)
+    yield executed
+    event.remove(engine, "before_cursor_execute", collect)
+
+
+def reading(statements, table):
+    return [s for s in statements if s.startswith("SELECT") and f"FROM {table}" in s]
+
+
+@pytest.mark.integration
+def test_cliente_not_modified(client, headers, statements):
+    """Test that a current If-None-Match gets a 304 after reading only updated_at."""
+    cliente_id = client.post("/clientes/", json=CLIENTE_DATA, headers=headers).json()["id"]
+    first = client.get(f"/clientes/{cliente_id}", headers=headers)
+    etag = first.headers["ETag"]
+
+    statements.clear()
+    response = client.get(f"/clientes/{cliente_id}", headers={**headers, "If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert not etag.startswith("W/")
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert response.headers["Last-Modified"] == first.headers["Last-Modified"]
+    [query] = reading(statements, "clientes")
+    assert "clientes.nome" not in query
+
+
+@pytest.mark.integration
+def test_cliente_modified_after_update(client, headers):
+    """Test that an update changes the ETag, so the old one gets the new body."""
+    cliente_id = client.post("/clientes/", json=CLIENTE_DATA, headers=headers).json()["id"]
+    etag = client.get(f"/clientes/{cliente_id}", headers=headers).headers["ETag"]
+
+    client.put(f"/clientes/{cliente_id}", json={"nome": "João Souza"}, headers=headers)
+    response = client.get(f"/clientes/{cliente_id}", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["nome"] == "João Souza"
+    assert response.headers["ETag"] != etag
+
+
+@pytest.mark.integration
+def test_cliente_if_modified_since(client, headers):
+    """Test If-Modified-Since, and that If-None-Match takes precedence over it."""
+    cliente_id = client.post("/clientes/", json=CLIENTE_DATA, headers=headers).json()["id"]
+    last_modified = client.get(f"/clientes/{cliente_id}", headers=headers).headers["Last-Modified"]
+
+    current = client.get(f"/clientes/{cliente_id}", headers={**headers, "If-Modified-Since": last_modified})
+    stale = client.get(
+        f"/clientes/{cliente_id}", headers={**headers, "If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+    )
+    mismatched = client.get(
+        f"/clientes/{cliente_id}",
+        headers={**headers, "If-Modified-Since": last_modified, "If-None-Match": '"other"'},
+    )
+
+    assert current.status_code == 304
+    assert stale.status_code == 200
+    assert mismatched.status_code == 200
+
+
+@pytest.mark.integration
+def test_conditional_get_of_missing_resource(client, headers):
+    """Test that a conditional GET of an unknown ID is still a 404."""
+    response = client.get("/clientes/999", headers={**headers, "If-None-Match": "*"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_clientes_page_not_modified(client, headers, statements):
+    """Test the listing ETag: 304 while the page is unchanged, 200 once a cliente on it changes."""
+    ids = [
+        client.post("/clientes/", json={**CLIENTE_DATA, "cpf": f"1234567890{i}"}, headers=headers).json()["id"]
+        for i in range(3)
+    ]
+    etag = client.get("/clientes/?limit=2", headers=headers).headers["ETag"]
+
+    statements.clear()
+    unchanged = client.get("/clientes/?limit=2", headers={**headers, "If-None-Match": etag})
+    [query] = reading(statements, "clientes")
+    # A cliente outside the page does not change its ETag
+    client.put(f"/clientes/{ids[2]}", json={"nome": "Maria"}, headers=headers)
+    still_unchanged = client.get("/clientes/?limit=2", headers={**headers, "If-None-Match": etag})
+    client.delete(f"/clientes/{ids[0]}", headers=headers)
+    changed = client.get("/clientes/?limit=2", headers={**headers, "If-None-Match": etag})
+
+    assert etag.startswith('W/"')
+    assert unchanged.status_code == still_unchanged.status_code == 304
+    assert "clientes.nome" not in query
+    assert changed.status_code == 200
+    assert [cliente["id"] for cliente in changed.json()] == ids[1:]
+    assert changed.headers["ETag"] != etag
+
+
+@pytest.mark.integration
+def test_apartamento_not_modified_from_cache(client, headers, statements):
+    """Test that revalidating a cached apartamento runs no apartamentos query."""
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    first = client.get(f"/apartamentos/{apartamento_id}", headers=headers)
+    etag = first.headers["ETag"]
+
+    statements.clear()
+    response = client.get(f"/apartamentos/{apartamento_id}", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["Last-Modified"] == first.headers["Last-Modified"]
+    assert reading(statements, "apartamentos") == []
+
+
+@pytest.mark.integration
+def test_apartamentos_page_changes_with_status(client, headers):
+    """Test that a reserva changes the ETag of the pages listing its apartamento."""
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    cliente_id = client.post("/clientes/", json=CLIENTE_DATA, headers=headers).json()["id"]
+    listing = "/apartamentos/?status=disponivel&sort=preco"
+    etag = client.get(listing, headers=headers).headers["ETag"]
+
+    unchanged = client.get(listing, headers={**headers, "If-None-Match": etag})
+    client.post(
+        "/reservas/",
+        json={"cliente_id": cliente_id, "apartamento_id": apartamento_id, "data_expiracao": "2099-01-01T00:00:00"},
+        headers=headers,
+    )
+    changed = client.get(listing, headers={**headers, "If-None-Match": etag})
+
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.json() == []
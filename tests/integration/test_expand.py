@@ -0,0 +1,151 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from src.infrastructure.database.models import Apartamento, Cliente, Reserva, Venda
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from tests.conftest import engine
+
+
+@pytest.fixture
+def headers(auth_token):
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def statements():
+    executed = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", collect)
+    yield executed
+    event.remove(engine, "before_cursor_execute", collect)
+
+
+def create_vendas(db_session, count):
+    """Create count vendas, each with its own cliente and apartamento, and one reserva per cliente."""
+    now = datetime.utcnow()
+    for i in range(count):
+        cliente = Cliente(
+            nome=f"Cliente {i}", cpf=f"{i:011d}", email=f"cliente{i}@example.com", telefone="11999999999"
+        )
+        apartamento = Apartamento(
+            numero=str(100 + i),
+            bloco="A",
+            andar=1,
+            quartos=2,
+            area=65.5,
+            preco=250000.0,
+            status=StatusApartamento.VENDIDO,
+        )
+        db_session.add_all([cliente, apartamento])
+        db_session.flush()
+        db_session.add_all(
+            [
+                Venda(
+                    cliente_id=cliente.id,
+                    apartamento_id=apartamento.id,
+                    valor_venda=250000.0,
+                    valor_entrada=50000.0,
+                ),
+                Reserva(
+                    cliente_id=cliente.id,
+                    apartamento_id=apartamento.id,
+                    data_expiracao=now + timedelta(days=1),
+                ),
+            ]
+        )
+    db_session.commit()
+    # Start from an empty identity map, as a new request would
+    db_session.expunge_all()
+
+
+@pytest.mark.integration
+def test_list_vendas_without_expand_keeps_shape(client, headers, db_session):
+    """Test that relations are left out of the response unless expanded."""
+    create_vendas(db_session, 1)
+
+    venda = client.get("/vendas/", headers=headers).json()[0]
+
+    assert "cliente" not in venda
+    assert "apartamento" not in venda
+    assert venda["valor_venda"] == 250000.0
+
+
+@pytest.mark.integration
+def test_list_vendas_expanded(client, headers, db_session):
+    """Test embedding the cliente and apartamento of each venda."""
+    create_vendas(db_session, 2)
+
+    response = client.get("/vendas/?expand=cliente,apartamento", headers=headers)
+
+    assert response.status_code == 200
+    vendas = response.json()
+    assert [venda["cliente"]["nome"] for venda in vendas] == ["Cliente 0", "Cliente 1"]
+    assert [venda["apartamento"]["numero"] for venda in vendas] == ["100", "101"]
+    assert all(venda["cliente"]["id"] == venda["cliente_id"] for venda in vendas)
+
+
+@pytest.mark.integration
+def test_list_vendas_expanded_in_constant_queries(client, headers, db_session, statements):
+    """Test that a page of expanded vendas costs the same statements whatever its size."""
+    create_vendas(db_session, 100)
+
+    counts = {}
+    for limit in (10, 100):
+        statements.clear()
+        response = client.get(f"/vendas/?expand=cliente,apartamento&limit={limit}", headers=headers)
+        assert len(response.json()) == limit
+        counts[limit] = len(statements)
+        db_session.expunge_all()
+
+    assert counts[10] == counts[100] == 1
+    assert "JOIN clientes" in statements[0] and "JOIN apartamentos" in statements[0]
+
+
+@pytest.mark.integration
+def test_get_venda_expands_only_requested_relation(client, headers, db_session, statements):
+    """Test that the detail endpoint embeds just the requested relation in one query."""
+    create_vendas(db_session, 1)
+    venda_id = client.get("/vendas/", headers=headers).json()[0]["id"]
+    db_session.expunge_all()
+    statements.clear()
+
+    venda = client.get(f"/vendas/{venda_id}?expand=apartamento", headers=headers).json()
+
+    assert venda["apartamento"]["numero"] == "100"
+    assert "cliente" not in venda
+    assert len(statements) == 1
+
+
+@pytest.mark.integration
+def test_reservas_expanded(client, headers, db_session, statements):
+    """Test expanding the relations of reservas, listed and by ID."""
+    create_vendas(db_session, 20)
+
+    statements.clear()
+    reservas = client.get("/reservas/?expand=cliente,apartamento", headers=headers).json()
+    assert len(statements) == 1
+    assert [reserva["cliente"]["cpf"] for reserva in reservas] == [f"{i:011d}" for i in range(20)]
+
+    reserva = client.get(f"/reservas/{reservas[3]['id']}?expand=cliente", headers=headers).json()
+    assert reserva["cliente"]["nome"] == "Cliente 3"
+    assert "apartamento" not in reserva
+
+
+@pytest.mark.integration
+def test_expand_unknown_relation(client, headers):
+    """Test that expanding an unknown relation is rejected."""
+    response = client.get("/vendas/?expand=cliente,usuario", headers=headers)
+
+    assert response.status_code == 400
+    assert "usuario" in response.json()["detail"]
+
+
+@pytest.mark.integration
+def test_get_venda_expanded_not_found(client, headers):
+    """Test expanding a venda that does not exist."""
+    response = client.get("/vendas/999?expand=cliente", headers=headers)
+
+    assert response.status_code == 404
@@ -0,0 +1,109 @@
+import csv
+import gzip
+import io
+import json
+import pytest
+from datetime import datetime, timedelta
+from src.application.dtos import VendaResponse
+from src.infrastructure.database.repositories import VendaRepository
+from src.presentation.api.export import export_columns
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def vendas(client, headers):
+    """Create three clientes, each buying one apartamento, and one reserva."""
+    apartamento_ids = []
+    for i in range(4):
+        cliente = {
+            "nome": f"Cliente {i}",
+            "cpf": f"{i:011d}",
+            "email": f"cliente{i}@example.com",
+            "telefone": "11999999999",
+        }
+        cliente_id = client.post("/clientes/", json=cliente, headers=headers).json()["id"]
+        apartamento = {"numero": str(100 + i), "bloco": "A", "andar": 1, "quartos": 2, "area": 65.5, "preco": 250000.0}
+        apartamento_id = client.post("/apartamentos/", json=apartamento, headers=headers).json()["id"]
+        apartamento_ids.append(apartamento_id)
+        if i < 3:
+            venda = {
+                "cliente_id": cliente_id,
+                "apartamento_id": apartamento_id,
+                "valor_venda": 250000.0 + i,
+                "valor_entrada": 50000.0,
+            }
+            client.post("/vendas/", json=venda, headers=headers)
+        else:
+            reserva = {
+                "cliente_id": cliente_id,
+                "apartamento_id": apartamento_id,
+                "data_expiracao": (datetime.now() + timedelta(days=7)).isoformat(),
+            }
+            client.post("/reservas/", json=reserva, headers=headers)
+    return apartamento_ids
+
+
+@pytest.mark.integration
+def test_export_vendas_csv(client, headers, vendas):
+    """Test exporting vendas as CSV."""
+    response = client.get("/vendas/export", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert response.headers["content-disposition"] == 'attachment; filename="vendas.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 3
+    assert list(rows[0]) == export_columns(VendaResponse)
+    assert [row["valor_venda"] for row in rows] == ["250000.00", "250001.00", "250002.00"]
+    assert rows[0]["apartamento_id"] == str(vendas[0])
+
+
+@pytest.mark.integration
+def test_export_reservas_ndjson(client, headers, vendas):
+    """Test exporting reservas as NDJSON."""
+    response = client.get("/reservas/export?format=ndjson", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    reservas = [json.loads(line) for line in response.text.splitlines()]
+    assert len(reservas) == 1
+    assert reservas[0]["apartamento_id"] == vendas[3]
+    assert reservas[0]["ativa"] is True
+
+
+@pytest.mark.integration
+def test_export_clientes_gzip(client, headers, vendas):
+    """Test exporting clientes as a gzip-compressed CSV file."""
+    response = client.get("/clientes/export?gzip=true", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert response.headers["content-disposition"] == 'attachment; filename="clientes.csv.gz"'
+    rows = list(csv.DictReader(io.StringIO(gzip.decompress(response.content).decode())))
+    assert [row["cpf"] for row in rows] == [f"{i:011d}" for i in range(4)]
+
+
+@pytest.mark.integration
+def test_export_empty_table(client, headers):
+    """Test that an empty export still has the CSV header."""
+    response = client.get("/vendas/export", headers=headers)
+    assert response.text == ",".join(export_columns(VendaResponse)) + "\n"
+
+
+@pytest.mark.integration
+def test_stream_all_fetches_in_batches(client, headers, vendas, db_session):
+    """Test that rows are fetched batch by batch rather than all at once."""
+    batches = list(VendaRepository(db_session).stream_all(["id", "valor_venda"], batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+
+
+@pytest.mark.integration
+def test_export_requires_auth(client):
+    """Test that exports require authentication."""
+    assert client.get("/vendas/export").status_code == 401
+    assert client.get("/clientes/export").status_code == 401
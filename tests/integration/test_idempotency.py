@@ -0,0 +1,170 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event, func, select, update
+from src.application.dtos import VendaCreate
+from src.application.use_cases import VendaService
+from src.infrastructure.auth import Principal
+from src.infrastructure.database.models import IdempotencyKey, Usuario, Venda
+from src.presentation.api.idempotency import idempotent_request, run_idempotent
+from src.presentation.workers import IdempotencyCleanupWorker
+from tests.conftest import TestingSessionLocal, engine
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def statements():
+    executed = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", collect)
+    yield executed
+    event.remove(engine, "before_cursor_execute", collect)
+
+
+@pytest.fixture
+def venda_data(client, headers):
+    """A venda request for a new cliente and apartamento."""
+    cliente = {"nome": "João Silva", "cpf": "12345678901", "email": "joao@example.com", "telefone": "11999999999"}
+    apartamento = {"numero": "101", "bloco": "A", "andar": 1, "quartos": 2, "area": 65.5, "preco": 250000.0}
+    return {
+        "cliente_id": client.post("/clientes/", json=cliente, headers=headers).json()["id"],
+        "apartamento_id": client.post("/apartamentos/", json=apartamento, headers=headers).json()["id"],
+        "valor_venda": 250000.0,
+        "valor_entrada": 50000.0,
+    }
+
+
+def count(db_session, model):
+    return db_session.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.integration
+def test_retry_replays_first_response(client, headers, venda_data, db_session, statements):
+    """Test that a retried venda gets the first response back from a single lookup."""
+    keyed = {**headers, "Idempotency-Key": "venda-1"}
+    first = client.post("/vendas/", json=venda_data, headers=keyed)
+
+    statements.clear()
+    retry = client.post("/vendas/", json=venda_data, headers=keyed)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert len(statements) == 1 and "idempotency_keys" in statements[0]
+    assert count(db_session, Venda) == 1
+    # Without a key the retry is a new request
+    assert client.post("/vendas/", json=venda_data, headers=headers).status_code == 400
+
+
+@pytest.mark.integration
+def test_key_reused_with_another_body(client, headers, venda_data):
+    """Test that a key sent again with a different body is rejected."""
+    keyed = {**headers, "Idempotency-Key": "venda-1"}
+    client.post("/vendas/", json=venda_data, headers=keyed)
+
+    response = client.post("/vendas/", json={**venda_data, "valor_entrada": 60000.0}, headers=keyed)
+
+    assert response.status_code == 422
+    assert "different request" in response.json()["detail"]
+
+
+@pytest.mark.integration
+def test_keys_are_scoped_to_the_endpoint(client, headers, venda_data, db_session):
+    """Test that the same key on /reservas is a request of its own."""
+    keyed = {**headers, "Idempotency-Key": "shared"}
+    reserva_data = {
+        "cliente_id": venda_data["cliente_id"],
+        "apartamento_id": venda_data["apartamento_id"],
+        "data_expiracao": (datetime.utcnow() + timedelta(days=7)).isoformat(),
+    }
+
+    reserva = client.post("/reservas/", json=reserva_data, headers=keyed)
+    venda = client.post("/vendas/", json=venda_data, headers=keyed)
+
+    assert reserva.status_code == venda.status_code == 201
+    assert client.post("/reservas/", json=reserva_data, headers=keyed).json() == reserva.json()
+    assert count(db_session, IdempotencyKey) == 2
+
+
+@pytest.mark.integration
+def test_failed_requests_are_not_stored(client, headers, venda_data, db_session):
+    """Test that an error leaves the key free for the corrected request."""
+    keyed = {**headers, "Idempotency-Key": "venda-1"}
+
+    failed = client.post("/vendas/", json={**venda_data, "cliente_id": 999}, headers=keyed)
+    response = client.post("/vendas/", json=venda_data, headers=keyed)
+
+    assert failed.status_code == 400
+    assert response.status_code == 201
+    assert count(db_session, IdempotencyKey) == 1
+
+
+@pytest.mark.integration
+def test_expired_key_is_not_replayed(client, headers, venda_data, db_session):
+    """Test that a key past its TTL runs the request again."""
+    keyed = {**headers, "Idempotency-Key": "venda-1"}
+    client.post("/vendas/", json=venda_data, headers=keyed)
+    db_session.execute(update(IdempotencyKey).values(expires_at=datetime.utcnow() - timedelta(seconds=1)))
+    db_session.commit()
+
+    response = client.post("/vendas/", json=venda_data, headers=keyed)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Apartamento is not available for sale"
+    assert count(db_session, IdempotencyKey) == 0
+
+
+@pytest.mark.integration
+def test_retry_racing_the_first_try(client, headers, venda_data, db_session):
+    """Test that a retry failing because the first try committed meanwhile replays that try."""
+    principal = Principal.from_usuario(db_session.scalars(select(Usuario)).one())
+    data = VendaCreate(**venda_data)
+    request = idempotent_request(principal, "POST /vendas", "venda-1", data)
+
+    def create():
+        # The first try commits between the retry's lookup and its own attempt
+        with TestingSessionLocal() as other:
+            VendaService(other).create_venda(data, request)
+        return VendaService(db_session).create_venda(data, request)
+
+    response = run_idempotent(db_session, request, create)
+
+    assert response.status_code == 201
+    assert response.headers["Idempotent-Replayed"] == "true"
+    assert count(db_session, Venda) == 1
+
+
+@pytest.mark.integration
+def test_cleanup_worker_deletes_expired_keys(client, headers, venda_data, db_session):
+    """Test that the cleanup deletes expired keys batch by batch and keeps the live ones."""
+    now = datetime.utcnow()
+    client.post("/vendas/", json=venda_data, headers={**headers, "Idempotency-Key": "live"})
+    live = db_session.scalars(select(IdempotencyKey)).one()
+    db_session.add_all(
+        IdempotencyKey(
+            usuario_id=live.usuario_id,
+            endpoint="POST /reservas",
+            key=f"old-{i}",
+            fingerprint=live.fingerprint,
+            status_code=201,
+            response_body="{}",
+            expires_at=now - timedelta(hours=i + 1),
+        )
+        for i in range(5)
+    )
+    db_session.commit()
+
+    worker = IdempotencyCleanupWorker(batch_size=2, session_factory=TestingSessionLocal)
+
+    assert asyncio.run(worker.run_once(now)) == 5
+    assert [key.key for key in db_session.scalars(select(IdempotencyKey))] == ["live"]
+    assert worker.stats()["deleted_total"] == 5
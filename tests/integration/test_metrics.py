@@ -0,0 +1,105 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.infrastructure.database import get_async_db
+from src.presentation.api.metrics import MetricsMiddleware, http_metrics
+from src.presentation.api.routes import async_apartamentos_router, async_auth_router
+from tests.conftest import TestingAsyncSessionLocal
+
+APARTAMENTO_DATA = {
+    "numero": "101",
+    "bloco": "A",
+    "andar": 1,
+    "quartos": 2,
+    "area": 65.5,
+    "preco": 250000.0,
+}
+
+
+@pytest.fixture
+def headers(auth_token):
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+def sample(text, line_prefix):
+    """Value of the first sample of the exposition starting with line_prefix."""
+    for line in text.splitlines():
+        if line.startswith(line_prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+@pytest.mark.integration
+def test_metrics_label_requests_by_route_template(client, headers):
+    """Test that requests are counted per route template and status code."""
+    apartamento_id = client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers).json()["id"]
+    route = '{method="GET",route="/apartamentos/{apartamento_id}"'
+    before = client.get("/metrics").text
+
+    client.get(f"/apartamentos/{apartamento_id}", headers=headers)
+    client.get("/apartamentos/999", headers=headers)
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    after = response.text
+    for status in ("200", "404"):
+        prefix = f'http_requests_total{route},status="{status}"}}'
+        assert sample(after, prefix) == sample(before, prefix) + 1
+    count = f"http_request_duration_seconds_count{route}}}"
+    assert sample(after, count) == sample(before, count) + 2
+    assert f"/apartamentos/{apartamento_id}" not in after
+
+
+@pytest.mark.integration
+def test_metrics_count_queries_per_request(client, headers):
+    """Test that the SQL statements of a request are counted against its route."""
+    client.post("/apartamentos/", json=APARTAMENTO_DATA, headers=headers)
+    labels = ("GET", "/vendas/")
+    requests = http_metrics.duration.count(labels)
+    queries = http_metrics.queries.sum(labels)
+
+    client.get("/vendas/", headers=headers)
+
+    assert http_metrics.duration.count(labels) == requests + 1
+    # One SELECT for the page; the authenticated principal comes from its cache
+    assert http_metrics.queries.sum(labels) == queries + 1
+    assert http_metrics.query_seconds.value(labels) > 0
+
+
+@pytest.mark.integration
+def test_metrics_unmatched_route(client):
+    """Test that unknown paths share a single series."""
+    labels = ("GET", "unmatched")
+    before = http_metrics.requests.value(labels + ("404",))
+
+    client.get("/does-not-exist/1")
+    client.get("/does-not-exist/2")
+
+    assert http_metrics.requests.value(labels + ("404",)) == before + 2
+
+
+@pytest.mark.integration
+def test_metrics_count_async_queries(db_session):
+    """Test counting the statements of the async database stack."""
+
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_auth_router)
+    app.include_router(async_apartamentos_router)
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.add_middleware(MetricsMiddleware)
+    labels = ("GET", "/apartamentos/")
+
+    with TestClient(app) as client:
+        user = {"username": "asyncuser", "email": "async@example.com", "password": "test123"}
+        client.post("/auth/register", json=user)
+        token = client.post("/auth/login", json=user).json()["access_token"]
+        queries = http_metrics.queries.sum(labels)
+        response = client.get("/apartamentos/", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert http_metrics.queries.sum(labels) == queries + 1
@@ -0,0 +1,93 @@
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.application.dtos import Expansao
+from src.application.use_cases import VendaService
+from src.infrastructure.database import get_db
+from src.infrastructure.metrics import profile_queries
+from src.presentation.api.profiler import QueryProfilerMiddleware
+from src.presentation.api.routes import auth_router, vendas_router
+from tests.integration.test_expand import create_vendas
+
+
+@pytest.fixture
+def profiled_client(db_session):
+    """A client for an app running the SQL profiler."""
+
+    def override_get_db():
+        yield db_session
+
+    app = FastAPI()
+    app.include_router(auth_router)
+    app.include_router(vendas_router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.add_middleware(QueryProfilerMiddleware)
+    with TestClient(app) as client:
+        user = {"username": "testuser", "email": "test@example.com", "password": "test123"}
+        client.post("/auth/register", json=user)
+        token = client.post("/auth/login", json=user).json()["access_token"]
+        client.headers["Authorization"] = f"Bearer {token}"
+        yield client
+
+
+@pytest.mark.integration
+def test_server_timing_header(profiled_client, db_session):
+    """Test that profiled responses report their SQL time and count."""
+    create_vendas(db_session, 3)
+
+    response = profiled_client.get("/vendas/?expand=cliente")
+
+    assert response.status_code == 200
+    db, app = response.headers["Server-Timing"].split(", ")
+    assert db.startswith("db;dur=") and db.endswith('desc="1 query"')
+    assert app.startswith("app;dur=")
+
+
+@pytest.mark.integration
+def test_lazy_loading_in_a_loop_is_flagged_as_n_plus_one(db_session):
+    """Test that touching a relation per row is reported, and expand is not."""
+    create_vendas(db_session, 5)
+    venda_service = VendaService(db_session)
+
+    with profile_queries(repeat_threshold=5) as lazy:
+        [venda.cliente.nome for venda in venda_service.get_all_vendas()]
+    db_session.expunge_all()
+    with profile_queries(repeat_threshold=5) as expanded:
+        [venda.cliente.nome for venda in venda_service.get_all_vendas(expand={Expansao.CLIENTE})]
+
+    assert lazy.count == 6
+    [(statement, runs)] = lazy.repeated()
+    assert "FROM clientes" in statement and runs == 5
+    assert expanded.count == 1
+    assert expanded.repeated() == []
+
+
+@pytest.mark.integration
+def test_delete_venda_runs_no_duplicate_query(db_session):
+    """Test that looking the venda up in both the service and the repository costs one SELECT."""
+    create_vendas(db_session, 1)
+    venda_id = VendaService(db_session).get_all_vendas()[0].id
+    db_session.expunge_all()
+
+    with profile_queries() as profile:
+        VendaService(db_session).delete_venda(venda_id)
+
+    assert profile.duplicates() == []
+    selects = [query.statement for query in profile.queries if query.statement.startswith("SELECT")]
+    assert sum("FROM vendas" in statement for statement in selects) == 1
+
+
+@pytest.mark.integration
+def test_slow_queries_are_logged_with_their_plan(db_session, caplog):
+    """Test that a statement over the threshold is logged with its query plan."""
+    create_vendas(db_session, 1)
+
+    with caplog.at_level(logging.WARNING, logger="src.infrastructure.metrics.profiler"):
+        with profile_queries(slow_seconds=0) as profile:
+            VendaService(db_session).get_all_vendas()
+
+    [query] = profile.queries
+    assert "SCAN vendas" in query.plan
+    assert caplog.records[0].getMessage().startswith("Slow query")
+    assert "SCAN vendas" in caplog.records[0].getMessage()
@@ -0,0 +1,160 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import event
+from src.infrastructure.database.models import Apartamento, Cliente, Venda
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from tests.conftest import engine
+
+
+@pytest.fixture
+def headers(auth_token):
+    """Authorization headers."""
+    return {"Authorization": f"Bearer {auth_token}"}
+
+
+@pytest.fixture
+def vendas(db_session):
+    """Create vendas across blocos, quartos, months and clientes."""
+    joao = Cliente(nome="João Silva", cpf="12345678901", email="joao@example.com", telefone="11999999999")
+    maria = Cliente(nome="Maria Souza", cpf="98765432100", email="maria@example.com", telefone="11988888888")
+    db_session.add_all([joao, maria])
+    # (bloco, quartos, cliente, valor_venda, valor_entrada, data_venda)
+    rows = [
+        ("A", 2, joao, 200000.0, 20000.0, datetime(2026, 1, 10)),
+        ("A", 3, maria, 300000.0, 60000.0, datetime(2026, 1, 20)),
+        ("B", 2, maria, 250000.0, 50000.0, datetime(2026, 2, 5)),
+        ("B", 3, maria, 350000.0, 70000.0, datetime(2026, 3, 1)),
+    ]
+    for i, (bloco, quartos, cliente, valor_venda, valor_entrada, data_venda) in enumerate(rows):
+        apartamento = Apartamento(
+            numero=str(100 + i),
+            bloco=bloco,
+            andar=1,
+            quartos=quartos,
+            area=65.5,
+            preco=valor_venda,
+            status=StatusApartamento.VENDIDO,
+        )
+        db_session.add(
+            Venda(
+                cliente=cliente,
+                apartamento=apartamento,
+                valor_venda=valor_venda,
+                valor_entrada=valor_entrada,
+                data_venda=data_venda,
+            )
+        )
+    db_session.commit()
+    return joao, maria
+
+
+def grupos(response):
+    return {grupo["grupo"]: grupo for grupo in response.json()["grupos"]}
+
+
+@pytest.mark.integration
+def test_relatorio_totals(client, headers, vendas):
+    """Test the overall totals, average ticket and entrada ratio."""
+    response = client.get("/relatorios/vendas", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["agrupamento"] is None
+    assert data["grupos"] == []
+    assert data["total"] == {
+        "quantidade": 4,
+        "valor_total": 1100000.0,
+        "ticket_medio": 275000.0,
+        "valor_entrada_total": 200000.0,
+        "razao_entrada": 0.1818,
+    }
+
+
+@pytest.mark.integration
+def test_relatorio_group_by_bloco_and_quartos(client, headers, vendas):
+    """Test grouping by the apartamento's bloco and quartos."""
+    por_bloco = grupos(client.get("/relatorios/vendas?group_by=bloco", headers=headers))
+    assert list(por_bloco) == ["A", "B"]
+    assert por_bloco["A"]["quantidade"] == 2
+    assert por_bloco["A"]["valor_total"] == 500000.0
+    assert por_bloco["A"]["ticket_medio"] == 250000.0
+    assert por_bloco["B"]["razao_entrada"] == 0.2
+
+    por_quartos = grupos(client.get("/relatorios/vendas?group_by=quartos", headers=headers))
+    assert list(por_quartos) == ["2", "3"]
+    assert por_quartos["3"]["valor_entrada_total"] == 130000.0
+
+
+@pytest.mark.integration
+def test_relatorio_group_by_mes_with_period(client, headers, vendas):
+    """Test grouping by month, with an inclusive start and exclusive end date."""
+    response = client.get(
+        "/relatorios/vendas?group_by=mes&data_inicio=2026-01-15&data_fim=2026-03-01", headers=headers
+    )
+    assert response.status_code == 200
+    por_mes = grupos(response)
+    assert list(por_mes) == ["2026-01", "2026-02"]
+    assert por_mes["2026-01"]["quantidade"] == 1
+    assert por_mes["2026-01"]["valor_total"] == 300000.0
+    assert response.json()["total"]["quantidade"] == 2
+
+
+@pytest.mark.integration
+def test_relatorio_group_by_cliente(client, headers, vendas):
+    """Test that the top clientes come first, with their names."""
+    joao, maria = vendas
+    response = client.get("/relatorios/vendas?group_by=cliente&limit=1", headers=headers)
+    data = response.json()
+    assert data["grupos"] == [
+        {
+            "grupo": str(maria.id),
+            "descricao": "Maria Souza",
+            "quantidade": 3,
+            "valor_total": 900000.0,
+            "ticket_medio": 300000.0,
+            "valor_entrada_total": 180000.0,
+            "razao_entrada": 0.2,
+        }
+    ]
+    # The limit only applies to the groups
+    assert data["total"]["quantidade"] == 4
+
+
+@pytest.mark.integration
+def test_relatorio_runs_two_aggregate_queries(client, headers, vendas):
+    """Test that the report is computed in SQL, without loading the vendas."""
+    executed = []
+
+    def collect(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", collect)
+    try:
+        client.get("/relatorios/vendas?group_by=bloco", headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", collect)
+
+    reports = [statement for statement in executed if "FROM vendas" in statement]
+    assert len(reports) == 2
+    assert all("sum(vendas.valor_venda)" in statement for statement in reports)
+    assert "GROUP BY apartamentos.bloco" in reports[1]
+
+
+@pytest.mark.integration
+def test_relatorio_empty(client, headers):
+    """Test the report when there are no vendas."""
+    data = client.get("/relatorios/vendas?group_by=mes", headers=headers).json()
+    assert data["total"]["quantidade"] == 0
+    assert data["total"]["ticket_medio"] == 0.0
+    assert data["total"]["razao_entrada"] == 0.0
+    assert data["grupos"] == []
+
+
+@pytest.mark.integration
+def test_relatorio_invalid_parameters(client, headers):
+    """Test rejecting reversed periods, unknown groupings and unauthenticated requests."""
+    response = client.get(
+        "/relatorios/vendas?data_inicio=2026-02-01&data_fim=2026-01-01", headers=headers
+    )
+    assert response.status_code == 400
+    assert client.get("/relatorios/vendas?group_by=andar", headers=headers).status_code == 422
+    assert client.get("/relatorios/vendas").status_code == 401
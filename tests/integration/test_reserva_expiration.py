@@ -0,0 +1,126 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from src.application.dtos import ApartamentoCreate, ClienteCreate, ReservaCreate, VendaCreate
+from src.application.use_cases import ReservaService, VendaService
+from src.infrastructure.database.models import Apartamento, Reserva
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.repositories import ApartamentoRepository, ClienteRepository
+from src.presentation.workers import ReservaExpirationWorker
+from tests.conftest import TestingAsyncSessionLocal, TestingSessionLocal
+
+
+def create_reservas(db_session, expiracoes):
+    """Create one cliente and one reserved apartamento per data_expiracao, returning the IDs."""
+    cliente = ClienteRepository(db_session).create(
+        ClienteCreate(nome="João Silva", cpf="12345678901", email="joao@example.com", telefone="11999999999")
+    )
+    apartamento_repo = ApartamentoRepository(db_session)
+    reserva_service = ReservaService(db_session)
+    reserva_ids = []
+    for i, data_expiracao in enumerate(expiracoes):
+        apartamento = apartamento_repo.create(
+            ApartamentoCreate(numero=str(100 + i), bloco="A", andar=1, quartos=2, area=65.5, preco=250000.0)
+        )
+        reserva = reserva_service.create_reserva(
+            ReservaCreate(cliente_id=cliente.id, apartamento_id=apartamento.id, data_expiracao=data_expiracao)
+        )
+        reserva_ids.append(reserva.id)
+    return cliente.id, reserva_ids
+
+
+@pytest.mark.integration
+def test_run_once_expires_due_reservas_in_batches(db_session):
+    """Test that due reservas are expired batch by batch and units are released."""
+    now = datetime.utcnow()
+    past = [now - timedelta(minutes=m) for m in (1, 5, 10, 30, 60)]
+    _, reserva_ids = create_reservas(db_session, past + [now + timedelta(days=1)])
+
+    worker = ReservaExpirationWorker(batch_size=2, session_factory=TestingSessionLocal)
+    expired = asyncio.run(worker.run_once(now))
+
+    assert expired == 5
+    db_session.expire_all()
+    reservas = [db_session.get(Reserva, reserva_id) for reserva_id in reserva_ids]
+    assert [reserva.ativa for reserva in reservas] == [False] * 5 + [True]
+    statuses = [db_session.get(Apartamento, reserva.apartamento_id).status for reserva in reservas]
+    assert statuses == [StatusApartamento.DISPONIVEL] * 5 + [StatusApartamento.RESERVADO]
+
+    stats = worker.stats()
+    assert stats["runs"] == 1
+    assert stats["expired_total"] == 5
+    assert stats["lag_seconds_max"] == pytest.approx(3600, abs=1)
+
+    # Nothing left to expire
+    assert asyncio.run(worker.run_once(now)) == 0
+
+
+@pytest.mark.integration
+def test_run_once_keeps_sold_apartamento_vendido(db_session):
+    """Test that expiring the reserva of a sold unit does not make it available."""
+    past = datetime.utcnow() - timedelta(hours=1)
+    cliente_id, (reserva_id,) = create_reservas(db_session, [past])
+    apartamento_id = db_session.get(Reserva, reserva_id).apartamento_id
+    VendaService(db_session).create_venda(
+        VendaCreate(
+            cliente_id=cliente_id, apartamento_id=apartamento_id, valor_venda=250000.0, valor_entrada=50000.0
+        )
+    )
+
+    worker = ReservaExpirationWorker(session_factory=TestingSessionLocal)
+    assert asyncio.run(worker.run_once()) == 1
+
+    db_session.expire_all()
+    assert db_session.get(Reserva, reserva_id).ativa is False
+    assert db_session.get(Apartamento, apartamento_id).status == StatusApartamento.VENDIDO
+
+
+@pytest.mark.integration
+def test_run_once_async_stack(db_session):
+    """Test expiring reservas through the async stack."""
+    now = datetime.utcnow()
+    _, reserva_ids = create_reservas(db_session, [now - timedelta(minutes=1), now + timedelta(days=1)])
+
+    worker = ReservaExpirationWorker(use_async=True, session_factory=TestingAsyncSessionLocal)
+    assert asyncio.run(worker.run_once(now)) == 1
+
+    db_session.expire_all()
+    reserva = db_session.get(Reserva, reserva_ids[0])
+    assert reserva.ativa is False
+    apartamento = db_session.get(Apartamento, reserva.apartamento_id)
+    assert apartamento.status == StatusApartamento.DISPONIVEL
+    # Releasing the unit bumps its version for optimistic concurrency
+    assert apartamento.version == 3
+
+
+@pytest.mark.integration
+def test_worker_runs_periodically(db_session):
+    """Test that the started worker keeps running until stopped."""
+    worker = ReservaExpirationWorker(interval_seconds=0.01, session_factory=TestingSessionLocal)
+
+    async def run():
+        worker.start()
+        await asyncio.sleep(0.2)
+        assert worker.running
+        await worker.stop()
+
+    asyncio.run(run())
+
+    assert not worker.running
+    assert worker.stats()["runs"] >= 2
+    assert worker.stats()["errors"] == 0
+
+
+@pytest.mark.integration
+def test_worker_rejects_empty_batches():
+    """Test that a batch_size below 1, which would never end a run, is refused."""
+    with pytest.raises(ValueError):
+        ReservaExpirationWorker(batch_size=0, session_factory=TestingSessionLocal)
+
+
+@pytest.mark.integration
+def test_health_workers(client):
+    """Test the worker metrics endpoint."""
+    response = client.get("/health/workers")
+    assert response.status_code == 200
+    assert response.json()["reserva_expiration"]["running"] is False
@@ -0,0 +1,77 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import func, select, text
+from src.application.dtos import ClienteCreate
+from src.infrastructure.database.models import Apartamento, ApartamentoResumo, Cliente, Reserva, Venda
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.repositories import ClienteRepository
+from src.infrastructure.database.seeding import FTS_SUSPENDED_TRIGGERS, SeedConfig, seed_database
+from src.presentation.cli import seed as seed_cli
+from tests.conftest import engine
+
+CONFIG = SeedConfig(clientes=300, apartamentos=500, reference_date=datetime(2026, 1, 1), chunk_size=64)
+
+
+def units_by_status(db_session, status):
+    """IDs of the apartamentos in a status."""
+    return sorted(db_session.scalars(select(Apartamento.id).where(Apartamento.status == status)))
+
+
+@pytest.mark.integration
+def test_seed_database(db_session):
+    """Test that the seeded rows keep the venda and reserva invariants and the derived data."""
+    counts, _ = seed_database(engine, CONFIG)
+
+    assert counts["clientes"] == db_session.scalar(select(func.count()).select_from(Cliente)) == 300
+    assert counts["apartamentos"] == db_session.scalar(select(func.count()).select_from(Apartamento)) == 500
+    # One venda per vendido unit, one active reserva per reservado unit
+    assert sorted(db_session.scalars(select(Venda.apartamento_id))) == units_by_status(
+        db_session, StatusApartamento.VENDIDO
+    )
+    assert sorted(db_session.scalars(select(Reserva.apartamento_id).where(Reserva.ativa))) == units_by_status(
+        db_session, StatusApartamento.RESERVADO
+    )
+    # The inventory summary and the full-text index were rebuilt
+    assert db_session.scalar(select(func.sum(ApartamentoResumo.quantidade))) == 500
+    nome = db_session.get(Cliente, 1).nome
+    assert 1 in [cliente.id for cliente in ClienteRepository(db_session).search(nome.split()[-1], 300)]
+
+
+@pytest.mark.integration
+def test_seed_keeps_new_rows_working(db_session):
+    """Test that the index triggers and ID sequences work again after seeding."""
+    seed_database(engine, CONFIG._replace(clientes=10, apartamentos=0))
+    repo = ClienteRepository(db_session)
+
+    cliente = repo.create(
+        ClienteCreate(nome="Zuleica Quintanilha", cpf="99999999999", email="z@example.com", telefone="11999999999")
+    )
+
+    assert cliente.id == 11
+    assert [found.id for found in repo.search("Quintanilha")] == [11]
+
+
+@pytest.mark.integration
+def test_seed_requires_empty_tables(db_session):
+    """Test that seeding over existing rows fails unless the tables are reset."""
+    seed_database(engine, CONFIG._replace(apartamentos=0))
+
+    with pytest.raises(ValueError, match="already has rows"):
+        seed_database(engine, CONFIG)
+
+    # The failed attempt restored the index triggers
+    triggers = db_session.scalars(text("SELECT name FROM sqlite_master WHERE type = 'trigger'"))
+    assert set(FTS_SUSPENDED_TRIGGERS) <= set(triggers)
+    counts, _ = seed_database(engine, CONFIG._replace(clientes=5, apartamentos=5), reset=True)
+    assert counts["clientes"] == db_session.scalar(select(func.count()).select_from(Cliente)) == 5
+
+
+@pytest.mark.integration
+def test_seed_cli(monkeypatch, capsys, db_session):
+    """Test the seed command line."""
+    monkeypatch.setattr(seed_cli, "engine", engine)
+
+    assert seed_cli.main(["--clientes", "20", "--apartamentos", "30", "--seed", "3"]) == 0
+    assert "Seeded" in capsys.readouterr().out
+    assert seed_cli.main(["--clientes", "20"]) == 1
+    assert "already has rows" in capsys.readouterr().err
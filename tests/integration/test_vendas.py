@@ -184,3 +184,59 @@ def test_get_vendas(client, auth_token):
     )
     assert response.status_code == 200
     assert len(response.json()) > 0
+
+
+@pytest.mark.integration
+def test_create_venda_single_commit(client, auth_token):
+    """Test that creating a venda issues a single commit and no refresh."""
+    from sqlalchemy import event
+    from tests.conftest import engine
+
+    headers = {"Authorization": f"Bearer {auth_token}"}
+    cliente_data = {
+        "nome": "João Silva",
+        "cpf": "12345678901",
+        "email": "joao@example.com",
+        "telefone": "11999999999",
+    }
+    cliente_id = client.post("/clientes/", json=cliente_data, headers=headers).json()["id"]
+    apartamento_data = {
+        "numero": "101",
+        "bloco": "A",
+        "andar": 1,
+        "quartos": 2,
+        "area": 65.5,
+        "preco": 250000.0,
+    }
+    apartamento_id = client.post(
+        "/apartamentos/", json=apartamento_data, headers=headers
+    ).json()["id"]
+
+    statements = []
+    commits = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    def record_commit(conn):
+        commits.append(conn)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    event.listen(engine, "commit", record_commit)
+    try:
+        venda_data = {
+            "cliente_id": cliente_id,
+            "apartamento_id": apartamento_id,
+            "valor_venda": 250000.0,
+            "valor_entrada": 50000.0,
+        }
+        response = client.post("/vendas/", json=venda_data, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+        event.remove(engine, "commit", record_commit)
+
+    assert response.status_code == 201
+    assert len(commits) == 1
+    # No refresh: nothing is re-read once the venda has been inserted
+    insert_index = next(i for i, s in enumerate(statements) if s.startswith("INSERT INTO vendas"))
+    assert not any(s.startswith("SELECT") for s in statements[insert_index:])
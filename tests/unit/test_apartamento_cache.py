@@ -0,0 +1,90 @@
+import pytest
+import time
+from src.infrastructure.cache import ApartamentoCache, RedisCache, TTLCache, create_cache_backend
+from tests.conftest import FakeRedis
+
+
+@pytest.mark.unit
+def test_redis_cache_round_trips_json():
+    """Test that values are stored as JSON under the prefix with a TTL."""
+    client = FakeRedis()
+    cache = RedisCache(client, ttl=60)
+
+    cache.set("apartamento:1", {"id": 1, "status": "disponivel"})
+
+    assert cache.get("apartamento:1") == {"id": 1, "status": "disponivel"}
+    assert "direcional:apartamento:1" in client.data
+    assert cache.get("apartamento:2") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.unit
+def test_redis_cache_entries_expire():
+    """Test that entries expire after their TTL."""
+    cache = RedisCache(FakeRedis(), ttl=0.05)
+    cache.set("key", [1, 2])
+    time.sleep(0.06)
+    assert cache.get("key") is None
+
+
+@pytest.mark.unit
+def test_redis_cache_outage_degrades_to_misses():
+    """Test that a failing client results in misses instead of errors."""
+
+    class BrokenRedis(FakeRedis):
+        def get(self, key):
+            raise ConnectionError("redis is down")
+
+        def set(self, key, value, px=None):
+            raise ConnectionError("redis is down")
+
+    cache = RedisCache(BrokenRedis(), ttl=60)
+    cache.set("key", 1)
+    assert cache.get("key", "default") == "default"
+    assert cache.errors == 2
+
+
+@pytest.mark.unit
+def test_redis_cache_clear_only_removes_prefix():
+    """Test that clear leaves keys outside the prefix alone."""
+    client = FakeRedis()
+    client.set("other:key", "1")
+    cache = RedisCache(client, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.clear()
+
+    assert list(client.data) == ["other:key"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "backend", [lambda: TTLCache(max_size=100, ttl=60), lambda: RedisCache(FakeRedis(), ttl=60)]
+)
+def test_apartamento_cache_invalidation(backend):
+    """Test that invalidation drops the item and every cached list."""
+    cache = ApartamentoCache(backend())
+    cache.set(1, {"id": 1})
+    cache.set(2, {"id": 2})
+    cache.set_list(("all", 0, 100, None), [{"id": 1}, {"id": 2}])
+    assert cache.get_list(("all", 0, 100, None)) == [{"id": 1}, {"id": 2}]
+
+    cache.invalidate([1])
+
+    assert cache.get(1) is None
+    assert cache.get(2) == {"id": 2}
+    assert cache.get_list(("all", 0, 100, None)) is None
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.unit
+def test_create_cache_backend():
+    """Test building the configured backend."""
+    assert isinstance(create_cache_backend("memory", max_size=10, ttl=5), TTLCache)
+    with pytest.raises(ValueError):
+        create_cache_backend("redis", max_size=10, ttl=5)
+    with pytest.raises(ValueError):
+        create_cache_backend("memcached", max_size=10, ttl=5)
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, MagicMock
 from src.application.use_cases.auth_service import AuthService
@@ -31,7 +32,7 @@ def test_register_new_user():
     # Act
     service = AuthService(mock_db)
     service.usuario_repo = mock_repo
-    result = service.register(user_data)
+    result = asyncio.run(service.register(user_data))
 
     # Assert
     assert result.username == "testuser"
@@ -66,7 +67,7 @@ def test_register_duplicate_username():
     service.usuario_repo = mock_repo
 
     with pytest.raises(ValueError, match="Username already exists"):
-        service.register(user_data)
+        asyncio.run(service.register(user_data))
 
 
 @pytest.mark.unit
@@ -96,7 +97,7 @@ def test_register_duplicate_email():
     service.usuario_repo = mock_repo
 
     with pytest.raises(ValueError, match="Email already exists"):
-        service.register(user_data)
+        asyncio.run(service.register(user_data))
 
 
 @pytest.mark.unit
@@ -123,7 +124,7 @@ def test_authenticate_valid_credentials():
     # Act
     service = AuthService(mock_db)
     service.usuario_repo = mock_repo
-    token = service.authenticate(login_data)
+    token = asyncio.run(service.authenticate(login_data))
 
     # Assert
     assert token is not None
@@ -144,7 +145,7 @@ def test_authenticate_invalid_username():
     # Act
     service = AuthService(mock_db)
     service.usuario_repo = mock_repo
-    token = service.authenticate(login_data)
+    token = asyncio.run(service.authenticate(login_data))
 
     # Assert
     assert token is None
@@ -173,7 +174,7 @@ def test_authenticate_invalid_password():
     # Act
     service = AuthService(mock_db)
     service.usuario_repo = mock_repo
-    token = service.authenticate(login_data)
+    token = asyncio.run(service.authenticate(login_data))
 
     # Assert
     assert token is None
@@ -202,7 +203,7 @@ def test_authenticate_inactive_user():
     # Act
     service = AuthService(mock_db)
     service.usuario_repo = mock_repo
-    token = service.authenticate(login_data)
+    token = asyncio.run(service.authenticate(login_data))
 
     # Assert
     assert token is None
@@ -0,0 +1,232 @@
+import asyncio
+import json
+import threading
+import pytest
+from src.infrastructure.events import Broadcaster, PostgresBackplane, create_backplane
+from src.presentation.api.sse import status_event_stream
+
+
+def status_event(apartamento_id, bloco, status="reservado"):
+    return {"apartamento_id": apartamento_id, "numero": str(apartamento_id), "bloco": bloco, "status": status}
+
+
+@pytest.mark.unit
+def test_broadcaster_filters_by_bloco():
+    """Test that subscribers only get their bloco, and None subscribes to all."""
+
+    async def run():
+        broadcaster = Broadcaster()
+        await broadcaster.start()
+        bloco_a = broadcaster.subscribe("A")
+        bloco_b = broadcaster.subscribe("B")
+        everything = broadcaster.subscribe()
+
+        broadcaster.publish(status_event(1, "A"))
+
+        assert (await bloco_a.get())["apartamento_id"] == 1
+        assert (await everything.get())["apartamento_id"] == 1
+        assert bloco_b._queue.empty()
+        assert broadcaster.stats()["delivered"] == 2
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_broadcaster_drops_oldest_for_slow_subscribers():
+    """Test that a full queue keeps the newest events."""
+
+    async def run():
+        broadcaster = Broadcaster(queue_size=2)
+        await broadcaster.start()
+        subscription = broadcaster.subscribe("A")
+
+        for apartamento_id in range(1, 5):
+            broadcaster.publish(status_event(apartamento_id, "A"))
+
+        assert [(await subscription.get())["apartamento_id"] for _ in range(2)] == [3, 4]
+        assert broadcaster.stats()["dropped"] == 2
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_broadcaster_publish_from_another_thread():
+    """Test that events committed on worker threads reach the loop."""
+
+    async def run():
+        broadcaster = Broadcaster()
+        await broadcaster.start()
+        subscription = broadcaster.subscribe("A")
+
+        thread = threading.Thread(target=broadcaster.publish, args=(status_event(7, "A"),))
+        thread.start()
+        thread.join()
+
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert event["apartamento_id"] == 7
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_broadcaster_many_subscribers():
+    """Test fan-out to thousands of subscribers."""
+
+    async def run():
+        broadcaster = Broadcaster()
+        await broadcaster.start()
+        subscriptions = [broadcaster.subscribe("A") for _ in range(5000)]
+
+        broadcaster.publish(status_event(1, "A"))
+
+        assert all(subscription._queue.qsize() == 1 for subscription in subscriptions)
+        for subscription in subscriptions:
+            broadcaster.unsubscribe(subscription)
+        assert broadcaster.stats()["subscribers"] == 0
+
+    asyncio.run(run())
+
+
+@pytest.mark.unit
+def test_broadcaster_not_started_drops_events():
+    """Test that publishing before start is a no-op."""
+    broadcaster = Broadcaster()
+    subscription = broadcaster.subscribe("A")
+    broadcaster.publish(status_event(1, "A"))
+    assert subscription._queue.empty()
+    assert broadcaster.stats()["published"] == 0
+
+
+class FakeListenConnection:
+    """Loops NOTIFY back to the listeners, like PostgreSQL does for its own session."""
+
+    def __init__(self):
+        self.listeners = {}
+        self.termination_listeners = []
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def remove_listener(self, channel, callback):
+        self.listeners.pop(channel, None)
+
+    def add_termination_listener(self, callback):
+        self.termination_listeners.append(callback)
+
+    def remove_termination_listener(self, callback):
+        self.termination_listeners.remove(callback)
+
+    def terminate(self):
+        """Drop the connection as the server would."""
+        self.closed = True
+        for callback in self.termination_listeners:
+            callback(self)
+
+    async def execute(self, query, channel, payload):
+        assert query == "SELECT pg_notify($1, $2)"
+        self.listeners[channel](self, 1234, channel, payload)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.mark.unit
+def test_postgres_backplane_round_trip():
+    """Test that events go through NOTIFY and come back through LISTEN."""
+    connection = FakeListenConnection()
+
+    async def connect(dsn):
+        assert dsn == "postgresql://user:password@db:5432/direcional_db"
+        return connection
+
+    async def run():
+        broadcaster = Broadcaster(
+            PostgresBackplane("postgresql://user:password@db:5432/direcional_db", connect=connect)
+        )
+        await broadcaster.start()
+        subscription = broadcaster.subscribe("A")
+
+        broadcaster.publish(status_event(3, "A", "vendido"))
+
+        event = await asyncio.wait_for(subscription.get(), timeout=1)
+        assert event == status_event(3, "A", "vendido")
+        await broadcaster.stop()
+
+    asyncio.run(run())
+    assert connection.closed
+
+
+@pytest.mark.unit
+def test_postgres_backplane_reconnects():
+    """Test that a lost LISTEN connection is replaced after a backoff, and a failed start retried."""
+    connections = []
+    failures = [OSError("connection refused")]
+
+    async def connect(dsn):
+        if failures:
+            raise failures.pop()
+        connections.append(FakeListenConnection())
+        return connections[-1]
+
+    async def run():
+        backplane = PostgresBackplane("postgresql://db/app", connect=connect, reconnect_delay=0.01)
+        broadcaster = Broadcaster(backplane)
+        await broadcaster.start()
+        subscription = broadcaster.subscribe("A")
+        assert not backplane.connected
+        broadcaster.publish(status_event(1, "A"))
+
+        await asyncio.sleep(0.05)
+        assert backplane.connected
+        connections[0].terminate()
+        assert not backplane.connected
+        failures.append(OSError("connection refused"))
+
+        await asyncio.sleep(0.1)
+        assert backplane.connected and len(connections) == 2
+        broadcaster.publish(status_event(2, "A"))
+        assert await asyncio.wait_for(subscription.get(), timeout=1) == status_event(2, "A")
+
+        stats = backplane.stats()
+        await broadcaster.stop()
+        return stats
+
+    stats = asyncio.run(run())
+    assert stats["reconnects"] == 2
+    assert stats["errors"] == 3
+    assert stats["unsent"] == 1
+    assert connections[1].closed and connections[1].termination_listeners == []
+
+
+@pytest.mark.unit
+def test_create_backplane():
+    """Test building the configured backplane."""
+    backplane = create_backplane("postgres", "postgresql+psycopg2://user:secret@db:5432/app")
+    assert isinstance(backplane, PostgresBackplane)
+    assert backplane.dsn == "postgresql://user:secret@db:5432/app"
+    with pytest.raises(ValueError):
+        create_backplane("kafka", "sqlite:///./test.db")
+
+
+@pytest.mark.unit
+def test_status_event_stream():
+    """Test the Server-Sent Events framing, keep-alives and unsubscribe."""
+
+    async def run():
+        broadcaster = Broadcaster()
+        await broadcaster.start()
+        stream = status_event_stream(broadcaster, "A", keepalive_seconds=0.05)
+
+        assert await stream.__anext__() == ": connected\n\n"
+        assert await stream.__anext__() == ": keep-alive\n\n"
+
+        broadcaster.publish(status_event(1, "A"))
+        chunk = await stream.__anext__()
+        assert chunk.startswith("event: status\ndata: ")
+        assert json.loads(chunk.split("data: ", 1)[1]) == status_event(1, "A")
+
+        await stream.aclose()
+        assert broadcaster.stats()["subscribers"] == 0
+
+    asyncio.run(run())
@@ -0,0 +1,123 @@
+import pytest
+from src.application.use_cases.cliente_import import MAX_RECORD_LINES, ClienteCsvImport, CsvRecordReader
+
+HEADER = "nome,cpf,email,telefone\n"
+
+
+def read_all(reader, data: bytes, piece_size: int):
+    """Feed data to the reader piece_size bytes at a time, returning every record."""
+    records = []
+    for start in range(0, len(data), piece_size):
+        records.extend(reader.feed(data[start:start + piece_size]))
+    return records + reader.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("piece_size", [1, 3, 1024])
+def test_reader_splits_records_across_pieces(piece_size):
+    """Test that records come out the same however the bytes are split."""
+    data = '\ufeffa,b\r\n"João, o ""Zé""",x\n\n"linha\nquebrada",y\nsem,fim'.encode("utf-8")
+
+    records = read_all(CsvRecordReader(), data, piece_size)
+
+    assert [(record.line, record.fields) for record in records] == [
+        (1, ["a", "b"]),
+        (2, ['João, o "Zé"', "x"]),
+        (4, ["linha\nquebrada", "y"]),
+        (6, ["sem", "fim"]),
+    ]
+
+
+@pytest.mark.unit
+def test_reader_rejects_only_the_broken_records():
+    """Test that invalid UTF-8 and an unterminated quote spoil only their own records."""
+    data = b"a,b\n\xff\xfe,c\nd,e\n\"aberto,f\n"
+
+    records = read_all(CsvRecordReader(), data, 4)
+
+    assert [(record.line, record.fields, record.error) for record in records] == [
+        (1, ["a", "b"], None),
+        (2, [], "Row is not valid UTF-8"),
+        (3, ["d", "e"], None),
+        (4, [], "Unterminated quoted field"),
+    ]
+
+
+@pytest.mark.unit
+def test_reader_keeps_a_stray_quote_literal():
+    """Test that a quote inside an unquoted field does not swallow the following rows."""
+    rows = [f"Cliente {i},0000000000{i},c{i}@example.com,1199999999{i}" for i in range(5)]
+    data = (HEADER + 'Ana 5" tall,x,"y ""z""",w\n' + "\n".join(rows) + "\n").encode("utf-8")
+
+    records = read_all(CsvRecordReader(), data, 7)
+
+    assert [(record.line, record.error) for record in records] == [(line, None) for line in range(1, 8)]
+    assert records[1].fields == ['Ana 5" tall', "x", 'y "z"', "w"]
+    assert records[-1].fields[0] == "Cliente 4"
+
+
+@pytest.mark.unit
+def test_reader_resyncs_after_an_unterminated_quote():
+    """Test that a quoted field open for too many lines is reported and the next lines are read again."""
+    rows = [f"linha {i},x" for i in range(MAX_RECORD_LINES + 1)]
+    data = ("a,b\n" + '"aberto,b\n' + "\n".join(rows) + "\n").encode("utf-8")
+
+    records = read_all(CsvRecordReader(), data, 1024)
+
+    assert (records[1].line, records[1].error) == (2, "Unterminated quoted field")
+    assert [record.fields for record in records[2:]] == [row.split(",") for row in rows]
+    assert [record.line for record in records[2:]] == list(range(3, MAX_RECORD_LINES + 4))
+
+
+@pytest.mark.unit
+def test_import_chunks_valid_rows_and_reports_the_rest():
+    """Test validation, in-file CPF deduplication and chunking."""
+    rows = [
+        "Ana,00000000001,ana@example.com,11999999999",
+        "Bruno,00000000002,bruno@example.com,11999999999",
+        "Ana de novo,00000000001,ana2@example.com,11999999999",
+        "Carla,123,carla@example.com,11999999999",
+        "Davi,00000000004,davi@example.com",
+        "Eva,00000000005,eva@example.com,11999999999",
+    ]
+    state = ClienteCsvImport(chunk_size=2)
+
+    chunks = state.feed((HEADER + "\n".join(rows)).encode()) + state.close()
+
+    assert [[item.nome for item in chunk] for chunk in chunks] == [["Ana", "Bruno"], ["Eva"]]
+    report = state.response()
+    assert report.failed == 3
+    assert [(error.line, error.cpf) for error in report.errors] == [
+        (4, "00000000001"),
+        (5, "123"),
+        (6, None),
+    ]
+    assert report.errors[0].error == "CPF repeated in file"
+    assert report.errors[1].error.startswith("cpf: ")
+    assert report.errors[2].error == "Expected 4 columns, got 3"
+
+
+@pytest.mark.unit
+def test_import_header():
+    """Test that the header is case-insensitive, may reorder columns and must name the required ones."""
+    state = ClienteCsvImport()
+    chunks = state.feed(b"Email,CPF,Nome,Telefone,origem\nana@example.com,00000000001,Ana,11999999999,site\n")
+    chunks += state.close()
+    assert chunks[0][0].nome == "Ana"
+
+    with pytest.raises(ValueError, match="missing the columns: email, telefone"):
+        ClienteCsvImport().feed(b"nome,cpf\n")
+    with pytest.raises(ValueError, match="empty"):
+        ClienteCsvImport().close()
+
+
+@pytest.mark.unit
+def test_import_caps_reported_errors():
+    """Test that only the first max_errors rejected rows are listed."""
+    state = ClienteCsvImport(max_errors=2)
+    state.feed((HEADER + "x,1,y,z\n" * 5).encode())
+    state.close()
+
+    report = state.response()
+    assert report.failed == 5
+    assert len(report.errors) == 2
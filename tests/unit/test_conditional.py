@@ -0,0 +1,60 @@
+import pytest
+from datetime import datetime
+from src.presentation.api.conditional import (
+    collection_etag,
+    entity_etag,
+    etag_matches,
+    http_date,
+    unmodified_since,
+)
+
+UPDATED_AT = datetime(2026, 3, 14, 15, 9, 26, 535897)
+
+
+@pytest.mark.unit
+def test_entity_etag_is_strong_and_changes_with_updated_at():
+    """Test that a resource ETag is strong and depends on the ID and updated_at."""
+    etag = entity_etag(7, UPDATED_AT)
+
+    assert etag == '"7-20260314150926535897"'
+    assert entity_etag(8, UPDATED_AT) != etag
+    assert entity_etag(7, UPDATED_AT.replace(microsecond=0)) != etag
+
+
+@pytest.mark.unit
+def test_collection_etag_is_weak_and_order_sensitive():
+    """Test that a page ETag is weak and changes with the items and their order."""
+    first, second = (1, UPDATED_AT), (2, UPDATED_AT)
+    etag = collection_etag([first, second])
+
+    assert etag.startswith('W/"')
+    assert collection_etag([first, second]) == etag
+    assert collection_etag([second, first]) != etag
+    assert collection_etag([first]) != etag
+    assert collection_etag([]) != etag
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header, matches",
+    [
+        ('"7-1"', True),
+        ('W/"7-1"', True),
+        ('"6-1", "7-1"', True),
+        ("*", True),
+        ('"7-2"', False),
+        ("", False),
+    ],
+)
+def test_etag_matches_uses_weak_comparison(header, matches):
+    """Test If-None-Match lists, wildcards and weak validators."""
+    assert etag_matches(header, '"7-1"') is matches
+
+
+@pytest.mark.unit
+def test_unmodified_since_compares_whole_seconds():
+    """Test If-Modified-Since against a timestamp with microseconds."""
+    assert http_date(UPDATED_AT) == "Sat, 14 Mar 2026 15:09:26 GMT"
+    assert unmodified_since(http_date(UPDATED_AT), UPDATED_AT)
+    assert not unmodified_since("Sat, 14 Mar 2026 15:09:25 GMT", UPDATED_AT)
+    assert not unmodified_since("not a date", UPDATED_AT)
@@ -0,0 +1,22 @@
+import pytest
+from src.infrastructure.database.config import to_async_database_url
+
+
+@pytest.mark.unit
+def test_async_url_for_postgres():
+    """Test translating a PostgreSQL URL to asyncpg."""
+    url = to_async_database_url("postgresql://user:password@db:5432/direcional_db")
+    assert url == "postgresql+asyncpg://user:password@db:5432/direcional_db"
+
+
+@pytest.mark.unit
+def test_async_url_for_sqlite():
+    """Test translating a SQLite URL to aiosqlite."""
+    assert to_async_database_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+
+@pytest.mark.unit
+def test_async_url_unsupported_backend():
+    """Test translating a URL without an async driver."""
+    with pytest.raises(ValueError, match="No async driver"):
+        to_async_database_url("mysql://user:password@db/direcional_db")
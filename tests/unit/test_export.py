@@ -0,0 +1,57 @@
+import gzip
+import json
+import pytest
+from datetime import datetime
+from decimal import Decimal
+from src.application.dtos import ClienteResponse
+from src.presentation.api.export import ExportEncoder, ExportFormat, export_columns
+
+COLUMNS = ["id", "valor_venda", "ativa", "data_venda"]
+BATCHES = [
+    [(1, Decimal("250000.00"), True, datetime(2026, 1, 10, 9, 30))],
+    [(2, Decimal("199999.99"), False, datetime(2026, 2, 1))],
+]
+
+
+def encode(encoder):
+    return [encoder.header()] + [encoder.encode(rows) for rows in BATCHES] + [encoder.finish()]
+
+
+@pytest.mark.unit
+def test_export_columns_put_id_first():
+    """Test that exports follow the response schema, with the ID first."""
+    assert export_columns(ClienteResponse) == ["id", "nome", "cpf", "email", "telefone", "created_at", "updated_at"]
+
+
+@pytest.mark.unit
+def test_csv_encoding():
+    """Test the CSV header, exact decimals, booleans and ISO dates."""
+    chunks = encode(ExportEncoder(COLUMNS, ExportFormat.CSV))
+
+    assert b"".join(chunks).decode() == (
+        "id,valor_venda,ativa,data_venda\n"
+        "1,250000.00,true,2026-01-10T09:30:00\n"
+        "2,199999.99,false,2026-02-01T00:00:00\n"
+    )
+    # One chunk per batch, so memory is bounded by the batch size
+    assert chunks[1] == b"1,250000.00,true,2026-01-10T09:30:00\n"
+
+
+@pytest.mark.unit
+def test_ndjson_encoding():
+    """Test one JSON object per line."""
+    lines = b"".join(encode(ExportEncoder(COLUMNS, ExportFormat.NDJSON))).decode().splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        {"id": 1, "valor_venda": 250000.0, "ativa": True, "data_venda": "2026-01-10T09:30:00"},
+        {"id": 2, "valor_venda": 199999.99, "ativa": False, "data_venda": "2026-02-01T00:00:00"},
+    ]
+
+
+@pytest.mark.unit
+def test_gzip_encoding():
+    """Test that compressed chunks concatenate into a valid gzip file."""
+    plain = b"".join(encode(ExportEncoder(COLUMNS, ExportFormat.CSV)))
+    compressed = b"".join(encode(ExportEncoder(COLUMNS, ExportFormat.CSV, compress=True)))
+
+    assert gzip.decompress(compressed) == plain
@@ -0,0 +1,58 @@
+import pytest
+from src.infrastructure.metrics import MetricsRegistry
+
+
+@pytest.mark.unit
+def test_counter_renders_one_line_per_series():
+    """Test the exposition of a labelled counter."""
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests handled", ("route", "status"))
+
+    requests.inc(("/vendas/", "200"))
+    requests.inc(("/vendas/", "200"))
+    requests.inc(("/vendas/{venda_id}", "404"), 1.5)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests handled",
+        "# TYPE requests_total counter",
+        'requests_total{route="/vendas/",status="200"} 2',
+        'requests_total{route="/vendas/{venda_id}",status="404"} 1.5',
+    ]
+
+
+@pytest.mark.unit
+def test_histogram_renders_cumulative_buckets():
+    """Test that histogram buckets are cumulative and end with +Inf, _sum and _count."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1))
+
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(("/",), value)
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{route="/",le="0.1"} 2',
+        'latency_seconds_bucket{route="/",le="1"} 3',
+        'latency_seconds_bucket{route="/",le="+Inf"} 4',
+        'latency_seconds_sum{route="/"} 3.65',
+        'latency_seconds_count{route="/"} 4',
+    ]
+    assert latency.count(("/",)) == 4
+
+
+@pytest.mark.unit
+def test_label_values_are_escaped():
+    """Test escaping quotes, backslashes and newlines in label values."""
+    registry = MetricsRegistry()
+    registry.counter("errors_total", "Errors", ("message",)).inc(('say "hi"\\\n',))
+
+    assert registry.render().splitlines()[-1] == 'errors_total{message="say \\"hi\\"\\\\\\n"} 1'
+
+
+@pytest.mark.unit
+def test_duplicate_metric_name_is_rejected():
+    """Test that a metric name can be registered only once."""
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests handled")
+
+    with pytest.raises(ValueError):
+        registry.histogram("requests_total", "Requests handled")
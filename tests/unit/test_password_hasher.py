@@ -0,0 +1,40 @@
+import asyncio
+import threading
+import pytest
+from src.infrastructure.auth import PasswordHasher, PasswordHasherBusyError
+
+
+@pytest.mark.unit
+def test_hash_and_verify_on_pool():
+    """Test hashing and verifying a password through the worker pool."""
+    hasher = PasswordHasher(max_workers=2, max_pending=4)
+
+    async def scenario():
+        hashed = await hasher.hash("mypassword123")
+        return (
+            await hasher.verify("mypassword123", hashed),
+            await hasher.verify("wrongpassword", hashed),
+        )
+
+    assert asyncio.run(scenario()) == (True, False)
+    assert hasher.stats()["completed"] == 3
+    assert hasher.stats()["queue_depth"] == 0
+
+
+@pytest.mark.unit
+def test_full_queue_rejects_new_jobs():
+    """Test that jobs beyond max_pending are rejected instead of queued."""
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def scenario():
+        blocked = asyncio.ensure_future(hasher.run(release.wait))
+        await asyncio.sleep(0.01)
+        with pytest.raises(PasswordHasherBusyError):
+            await hasher.run(lambda: None)
+        release.set()
+        await blocked
+
+    asyncio.run(scenario())
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.stats()["completed"] == 1
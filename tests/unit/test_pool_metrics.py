@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from src.infrastructure.database.pool import TimedQueuePool, pool_status
+
+
+def make_engine():
+    """Create a single-connection engine backed by a timed pool."""
+    return create_engine(
+        "sqlite://",
+        poolclass=TimedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+
+@pytest.mark.unit
+def test_pool_status_counts_checkouts():
+    """Test that checkouts and connects are counted."""
+    engine = make_engine()
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        status = pool_status(engine.pool)
+        assert status["checked_out"] == 1
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    status = pool_status(engine.pool)
+    assert status["pool"] == "TimedQueuePool"
+    assert status["checked_out"] == 0
+    assert status["checkouts"] == 2
+    assert status["connects"] == 1
+    assert status["timeouts"] == 0
+
+
+@pytest.mark.unit
+def test_pool_status_counts_timeouts():
+    """Test that an exhausted pool records a timeout and its wait time."""
+    engine = make_engine()
+
+    with engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    status = pool_status(engine.pool)
+    assert status["timeouts"] == 1
+    assert status["wait_seconds_max"] >= 0.05
+
+
+@pytest.mark.unit
+def test_pool_metrics_survive_recreate():
+    """Test that metrics are kept when the pool is recreated on dispose."""
+    engine = make_engine()
+    with engine.connect():
+        pass
+
+    engine.dispose()
+    with engine.connect():
+        pass
+
+    status = pool_status(engine.pool)
+    assert status["checkouts"] == 2
+    assert status["connects"] == 2
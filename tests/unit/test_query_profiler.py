@@ -0,0 +1,69 @@
+import logging
+import pytest
+from sqlalchemy import create_engine, text
+from src.infrastructure.metrics import ProfiledQuery, QueryProfile, profile_queries
+from src.infrastructure.metrics.profiler import parameters_digest
+from src.presentation.api.profiler import report, server_timing
+
+BY_ID = "SELECT * FROM clientes WHERE id = ?"
+
+
+def profile_of(*queries):
+    profile = QueryProfile(slow_seconds=0.1, repeat_threshold=3)
+    profile.queries = [
+        ProfiledQuery(statement, parameters_digest(parameters), 0.002) for statement, parameters in queries
+    ]
+    return profile
+
+
+@pytest.mark.unit
+def test_duplicates_need_same_statement_and_parameters():
+    """Test that only statements repeated with identical parameters are duplicates."""
+    profile = profile_of((BY_ID, (1,)), (BY_ID, (2,)), (BY_ID, (1,)), ("SELECT 1", ()))
+
+    assert profile.duplicates() == [(BY_ID, 2)]
+
+
+@pytest.mark.unit
+def test_executemany_keeps_only_the_row_count():
+    """Test that bulk parameters are not kept, and that bulk batches are never duplicates."""
+    engine = create_engine("sqlite://")
+    rows = [{"value": i} for i in range(1000)]
+    with engine.begin() as conn, profile_queries() as profile:
+        conn.execute(text("CREATE TABLE t (value INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (:value)"), rows)
+        conn.execute(text("INSERT INTO t VALUES (:value)"), rows)
+
+    inserts = [query for query in profile.queries if query.statement.startswith("INSERT")]
+    assert [(query.parameters_digest, query.rows) for query in inserts] == [(None, 1000), (None, 1000)]
+    assert profile.duplicates() == []
+
+
+@pytest.mark.unit
+def test_repeated_statements_reach_threshold():
+    """Test that a statement run repeat_threshold times is an N+1 suspect."""
+    assert profile_of((BY_ID, (1,)), (BY_ID, (2,))).repeated() == []
+    assert profile_of((BY_ID, (1,)), (BY_ID, (2,)), (BY_ID, (3,))).repeated() == [(BY_ID, 3)]
+
+
+@pytest.mark.unit
+def test_server_timing_summary():
+    """Test the Server-Timing header value."""
+    assert server_timing(profile_of((BY_ID, (1,))), 0.0125) == 'db;dur=2.00;desc="1 query", app;dur=12.50'
+    assert server_timing(profile_of((BY_ID, (1,)), (BY_ID, (1,))), 0.01) == (
+        'db;dur=4.00;desc="2 queries, 1 duplicates", app;dur=10.00'
+    )
+
+
+@pytest.mark.unit
+def test_report_logs_duplicates_and_n_plus_one(caplog):
+    """Test that duplicates and N+1 suspects are logged with the request."""
+    profile = profile_of((BY_ID, (1,)), (BY_ID, (1,)), (BY_ID, (2,)))
+
+    with caplog.at_level(logging.WARNING, logger="src.presentation.api.profiler"):
+        report("GET /vendas/", profile)
+
+    assert [record.getMessage() for record in caplog.records] == [
+        f"Duplicate query on GET /vendas/, run 2 times: {BY_ID}",
+        f"Possible N+1 on GET /vendas/, statement run 3 times: {BY_ID}",
+    ]
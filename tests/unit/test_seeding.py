@@ -0,0 +1,79 @@
+import pytest
+from datetime import datetime
+from itertools import chain
+from src.infrastructure.database.models.apartamento import StatusApartamento
+from src.infrastructure.database.seeding import (
+    SeedConfig,
+    cpf,
+    generate_clientes,
+    generate_inventory,
+    validate_config,
+)
+
+REFERENCE_DATE = datetime(2026, 1, 1)
+
+
+def flatten(config):
+    """Every generated row of a configuration, table by table."""
+    inventory = list(generate_inventory(config))
+    return (
+        list(generate_clientes(config)),
+        list(chain.from_iterable(chunk.apartamentos for chunk in inventory)),
+        list(chain.from_iterable(chunk.vendas for chunk in inventory)),
+        list(chain.from_iterable(chunk.reservas for chunk in inventory)),
+    )
+
+
+@pytest.mark.unit
+def test_cpf_check_digits():
+    """Test that the generated CPFs carry valid check digits."""
+    assert cpf(111444777) == "11144477735"
+    assert cpf(1) == "00000000191"
+
+
+@pytest.mark.unit
+def test_generation_is_deterministic():
+    """Test that the rows only depend on the seed, not on the chunk size."""
+    config = SeedConfig(clientes=50, apartamentos=500, reference_date=REFERENCE_DATE, seed=7)
+
+    rows = flatten(config)
+
+    assert rows == flatten(config._replace(chunk_size=33))
+    assert rows != flatten(config._replace(seed=8))
+    # Clientes draw from a stream of their own
+    assert rows[0] == flatten(config._replace(apartamentos=10))[0]
+
+
+@pytest.mark.unit
+def test_generated_inventory_is_consistent():
+    """Test that vendido units have a venda and reservado units an active reserva."""
+    config = SeedConfig(clientes=20, apartamentos=1000, reference_date=REFERENCE_DATE)
+
+    clientes, apartamentos, vendas, reservas = flatten(config)
+
+    status = {row[0]: row[7] for row in apartamentos}
+    assert len({row[1] for row in apartamentos}) == len(apartamentos)
+    assert all(len(row[1]) <= 10 for row in apartamentos)
+    assert sorted(row[2] for row in vendas) == sorted(
+        id for id, value in status.items() if value == StatusApartamento.VENDIDO
+    )
+    assert sorted(row[2] for row in reservas if row[5]) == sorted(
+        id for id, value in status.items() if value == StatusApartamento.RESERVADO
+    )
+    assert all(row[4] > REFERENCE_DATE for row in reservas if row[5])
+    assert all(row[3] < REFERENCE_DATE for row in reservas)
+    assert {row[1] for row in vendas + reservas} <= {row[0] for row in clientes}
+    assert len({row[2] for row in clientes}) == len({row[3] for row in clientes}) == 20
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "changes",
+    [{"clientes": -1}, {"vendido_ratio": 0.8, "reservado_ratio": 0.3}, {"clientes": 0}, {"chunk_size": 0}],
+)
+def test_invalid_configurations(changes):
+    """Test that configurations that cannot produce a consistent dataset are rejected."""
+    config = SeedConfig(clientes=10, apartamentos=10, reference_date=REFERENCE_DATE)._replace(**changes)
+
+    with pytest.raises(ValueError):
+        validate_config(config)
@@ -0,0 +1,65 @@
+import pytest
+from unittest.mock import patch
+from src.infrastructure.cache import TTLCache
+
+
+@pytest.mark.unit
+def test_get_and_set():
+    """Test storing and retrieving a value."""
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+@pytest.mark.unit
+def test_entries_expire():
+    """Test that entries are dropped after their TTL."""
+    cache = TTLCache(max_size=10, ttl=60)
+    with patch("src.infrastructure.cache.memory.time.monotonic", return_value=1000.0):
+        cache.set("key", "value")
+
+    with patch("src.infrastructure.cache.memory.time.monotonic", return_value=1061.0):
+        assert cache.get("key") is None
+
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_least_recently_used_is_evicted():
+    """Test that the least recently used entry is evicted when full."""
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+@pytest.mark.unit
+def test_delete_and_clear():
+    """Test removing entries."""
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.delete("a")
+    assert cache.get("a") is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_disabled_cache_stores_nothing():
+    """Test that a zero TTL disables the cache."""
+    cache = TTLCache(max_size=10, ttl=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
@@ -290,3 +290,86 @@ def test_create_venda_from_reserva():
     # Assert
     assert result is not None
     mock_apartamento_repo.update_status.assert_called_once_with(1, StatusApartamento.VENDIDO)
+
+
+@pytest.mark.unit
+def test_create_venda_commits_once():
+    """Test that the venda and the status change are committed together."""
+    # Arrange
+    mock_db = Mock()
+    mock_venda_repo = Mock()
+    mock_apartamento_repo = Mock()
+    mock_cliente_repo = Mock()
+
+    venda_data = VendaCreate(
+        cliente_id=1,
+        apartamento_id=1,
+        valor_venda=250000.0,
+        valor_entrada=50000.0
+    )
+
+    mock_apartamento_repo.get_by_id.return_value = Apartamento(
+        id=1,
+        numero="101",
+        bloco="A",
+        andar=1,
+        quartos=2,
+        area=65.5,
+        preco=250000.0,
+        status=StatusApartamento.DISPONIVEL
+    )
+    mock_venda_repo.get_by_apartamento_id.return_value = None
+
+    # Act
+    service = VendaService(mock_db)
+    service.venda_repo = mock_venda_repo
+    service.apartamento_repo = mock_apartamento_repo
+    service.cliente_repo = mock_cliente_repo
+
+    service.create_venda(venda_data)
+
+    # Assert
+    mock_db.commit.assert_called_once()
+    mock_db.rollback.assert_not_called()
+
+
+@pytest.mark.unit
+def test_create_venda_rolls_back_on_failure():
+    """Test that a failed status update rolls back the venda as well."""
+    # Arrange
+    mock_db = Mock()
+    mock_venda_repo = Mock()
+    mock_apartamento_repo = Mock()
+    mock_cliente_repo = Mock()
+
+    venda_data = VendaCreate(
+        cliente_id=1,
+        apartamento_id=1,
+        valor_venda=250000.0,
+        valor_entrada=50000.0
+    )
+
+    mock_apartamento_repo.get_by_id.return_value = Apartamento(
+        id=1,
+        numero="101",
+        bloco="A",
+        andar=1,
+        quartos=2,
+        area=65.5,
+        preco=250000.0,
+        status=StatusApartamento.DISPONIVEL
+    )
+    mock_venda_repo.get_by_apartamento_id.return_value = None
+    mock_apartamento_repo.update_status.side_effect = RuntimeError("connection lost")
+
+    # Act & Assert
+    service = VendaService(mock_db)
+    service.venda_repo = mock_venda_repo
+    service.apartamento_repo = mock_apartamento_repo
+    service.cliente_repo = mock_cliente_repo
+
+    with pytest.raises(RuntimeError):
+        service.create_venda(venda_data)
+
+    mock_db.commit.assert_not_called()
+    mock_db.rollback.assert_called_once()